@@ -7,17 +7,20 @@ Agents:
 - manager: Session orchestration and competency coverage (formerly director)
 - director: DEPRECATED - alias for manager (backward compatibility)
 """
-from .evaluator import evaluator_node
-from .interviewer import interviewer_node
-from .manager import manager_node, should_continue
+from .evaluator import evaluator_node, aevaluator_node
+from .interviewer import interviewer_node, ainterviewer_node
+from .manager import manager_node, check_session_constraints, should_continue
 
 # Backward compatibility alias
 from .director import director_node
 
 __all__ = [
     "evaluator_node",
+    "aevaluator_node",
     "interviewer_node",
+    "ainterviewer_node",
     "manager_node",
+    "check_session_constraints",
     "director_node",  # Deprecated alias
     "should_continue",
 ]
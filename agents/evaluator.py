@@ -8,33 +8,34 @@ When an InterviewSpec is present, scores each competency independently
 for multi-dimensional assessment.
 """
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
 
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / ".env")
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage
 
 from state import (
     InterviewState,
     CompetencyScore,
     has_spec,
+    get_compiled_spec,
     get_heuristics,
     create_empty_competency_score,
     get_overall_level,
     get_level_name,
+    Append,
+    Increment,
+    count_role,
+    last_of_role,
 )
-from prompts.evaluator_prompt_builder import build_evaluator_prompt
-
-# Initialize LLM
-evaluator_llm = ChatAnthropic(
-    model="claude-sonnet-4-20250514",
-    temperature=0.3,
-    max_tokens=2048,  # Increased for multi-competency output
-)
+from prompts.evaluator_prompt_builder import build_evaluator_system_blocks
+from agents.usage import extract_token_usage, usage_state_update
+from llm.resilience import LLMUnavailable
+from llm.routing import route_llm
+from telemetry import annotate_span, record_tokens, timed_stage, traced
 
 
 def parse_evaluator_response(response_text: str, is_spec_driven: bool = False) -> Dict[str, Any]:
@@ -62,9 +63,10 @@ def parse_evaluator_response(response_text: str, is_spec_driven: bool = False) -
         return parsed
 
     except json.JSONDecodeError:
-        # Fallback response
+        # Fallback response, marked so callers can keep the previous guidance
         if is_spec_driven:
             return {
+                "parse_error": True,
                 "competency_scores": {},
                 "overall_assessment": "Could not parse evaluation",
                 "action": "DO_NOT_HELP",
@@ -74,6 +76,7 @@ def parse_evaluator_response(response_text: str, is_spec_driven: bool = False) -
             }
         else:
             return {
+                "parse_error": True,
                 "current_level": 0,
                 "level_name": "PARSE_ERROR",
                 "level_justification": "Could not parse evaluation",
@@ -86,6 +89,7 @@ def parse_evaluator_response(response_text: str, is_spec_driven: bool = False) -
             }
 
 
+@traced("evaluator")
 def evaluator_node(state: InterviewState) -> Dict[str, Any]:
     """
     Assess candidate performance and provide guidance for the interviewer.
@@ -94,14 +98,53 @@ def evaluator_node(state: InterviewState) -> Dict[str, Any]:
 
     When an InterviewSpec is present, returns multi-dimensional competency scores.
     Otherwise, uses legacy single-score format for backward compatibility.
+
+    If the model can't answer within the turn's time budget, the previous
+    guidance is kept (see _degraded_evaluation).
     """
     # Skip evaluation if no candidate messages yet (opening)
-    candidate_messages = [m for m in state["messages"] if m["role"] == "candidate"]
-    if not candidate_messages:
+    messages = _build_evaluator_messages(state)
+    if messages is None:
+        return _get_initial_evaluation_state(state)
+
+    try:
+        response = route_llm("evaluator", state).invoke(messages)
+    except LLMUnavailable:
+        return _degraded_evaluation()
+    return _process_evaluator_response(state, response)
+
+
+@traced("evaluator")
+async def aevaluator_node(state: InterviewState) -> Dict[str, Any]:
+    """
+    Async variant of evaluator_node.
+
+    Uses ainvoke so the event loop stays free while the model is working.
+    """
+    messages = _build_evaluator_messages(state)
+    if messages is None:
         return _get_initial_evaluation_state(state)
 
-    # Build the system prompt (spec-driven or legacy)
-    system_prompt = build_evaluator_prompt(state)
+    try:
+        response = await route_llm("evaluator", state).ainvoke(messages)
+    except LLMUnavailable:
+        return _degraded_evaluation()
+    return _process_evaluator_response(state, response)
+
+
+@timed_stage("prompt_build_seconds")
+def _build_evaluator_messages(state: InterviewState) -> Optional[List[BaseMessage]]:
+    """
+    Build the evaluator LLM input for the current state.
+
+    Returns None when there is nothing to assess yet (no candidate messages).
+    """
+    last_candidate = last_of_role(state["messages"], "candidate")
+    if last_candidate is None:
+        return None
+
+    # Build the system prompt (spec-driven or legacy) as cacheable blocks
+    system_blocks = build_evaluator_system_blocks(state)
 
     # Get conversation context
     recent_messages = state["messages"][-12:]
@@ -111,7 +154,7 @@ def evaluator_node(state: InterviewState) -> Dict[str, Any]:
     ])
 
     # Get the last candidate message specifically
-    last_candidate_msg = candidate_messages[-1]["content"] if candidate_messages else ""
+    last_candidate_msg = last_candidate["content"]
 
     # Build assessment history context
     if has_spec(state):
@@ -136,22 +179,43 @@ def evaluator_node(state: InterviewState) -> Dict[str, Any]:
 3. Provide specific guidance for the interviewer's next response
 4. Decide what data (if any) to approve for sharing"""
 
-    messages = [
-        SystemMessage(content=system_prompt),
+    return [
+        SystemMessage(content=system_blocks),
         HumanMessage(content=evaluation_context),
     ]
 
-    response = evaluator_llm.invoke(messages)
+
+@timed_stage("parse_seconds")
+def _process_evaluator_response(state: InterviewState, response: Any) -> Dict[str, Any]:
+    """Turn an evaluator LLM response into a state update."""
 
     # Track token usage
-    usage = response.response_metadata.get("usage", {})
-    tokens_used = usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+    usage = extract_token_usage(response)
+    record_tokens(usage)
 
     # Parse and process based on mode
-    if has_spec(state):
-        return _process_spec_driven_evaluation(state, response.content, tokens_used)
+    is_spec_driven = has_spec(state)
+    evaluation = parse_evaluator_response(response.content, is_spec_driven=is_spec_driven)
+    if evaluation.get("parse_error"):
+        annotate_span(parse="fallback")
+        return {**_degraded_evaluation(), **usage_state_update(usage)}
+    annotate_span(parse="ok")
+
+    if is_spec_driven:
+        return _process_spec_driven_evaluation(state, evaluation, usage)
     else:
-        return _process_legacy_evaluation(state, response.content, tokens_used)
+        return _process_legacy_evaluation(state, evaluation, usage)
+
+
+def _degraded_evaluation() -> Dict[str, Any]:
+    """
+    State update for a turn the evaluator could not assess.
+
+    Scores, action and guidance are left as they are, so the interviewer
+    keeps following the last real guidance instead of a blind DO_NOT_HELP.
+    """
+    annotate_span(parse="degraded")
+    return {"degraded_calls": Increment(1)}
 
 
 def _get_initial_evaluation_state(state: InterviewState) -> Dict[str, Any]:
@@ -167,11 +231,10 @@ def _get_initial_evaluation_state(state: InterviewState) -> Dict[str, Any]:
     }
 
     # Initialize competency scores if spec present
-    if has_spec(state):
-        spec = state.get("interview_spec", {})
+    compiled = get_compiled_spec(state)
+    if compiled:
         competency_scores = {}
-        for comp in spec.get("competencies", []):
-            comp_id = comp.get("competency_id", "")
+        for comp_id in compiled.competency_ids:
             competency_scores[comp_id] = create_empty_competency_score(comp_id)
         base_state["competency_scores"] = competency_scores
 
@@ -209,31 +272,35 @@ def _build_legacy_history_context(state: InterviewState) -> str:
 
 def _process_spec_driven_evaluation(
     state: InterviewState,
-    response_content: str,
-    tokens_used: int
+    evaluation: Dict[str, Any],
+    usage: Dict[str, int]
 ) -> Dict[str, Any]:
-    """Process evaluation response for spec-driven interviews."""
+    """Process a parsed evaluation for spec-driven interviews."""
 
-    evaluation = parse_evaluator_response(response_content, is_spec_driven=True)
-    spec = state.get("interview_spec", {})
+    compiled = get_compiled_spec(state)
 
     # Update competency scores
     competency_scores = dict(state.get("competency_scores", {}))
     new_comp_scores = evaluation.get("competency_scores", {})
 
     # Get exchange count for history
-    exchange_count = len([m for m in state.get("messages", []) if m["role"] == "candidate"])
+    exchange_count = count_role(state.get("messages", []), "candidate")
     timestamp = datetime.utcnow().isoformat()
 
-    # Aggregate flags
-    all_red_flags = list(state.get("red_flags_observed", []))
-    all_green_flags = list(state.get("green_flags_observed", []))
+    # Aggregate flags (only new ones are returned, as appends)
+    seen_red_flags = set(state.get("red_flags_observed", []))
+    seen_green_flags = set(state.get("green_flags_observed", []))
+    new_red_flags: List[str] = []
+    new_green_flags: List[str] = []
 
     for comp_id, score_data in new_comp_scores.items():
         if comp_id not in competency_scores:
             competency_scores[comp_id] = create_empty_competency_score(comp_id)
 
-        existing = competency_scores[comp_id]
+        # Copy before updating so the previous state is never mutated in place
+        existing = dict(competency_scores[comp_id])
+        existing["red_flags_observed"] = list(existing.get("red_flags_observed", []))
+        existing["green_flags_observed"] = list(existing.get("green_flags_observed", []))
         new_level = score_data.get("level", 0)
         evidence = score_data.get("evidence", "")
         flags = score_data.get("flags", [])
@@ -274,19 +341,21 @@ def _process_spec_driven_evaluation(
                     clean_flag = flag.replace("RED:", "").strip()
                     if clean_flag not in existing.get("red_flags_observed", []):
                         existing.setdefault("red_flags_observed", []).append(clean_flag)
-                    if clean_flag not in all_red_flags:
-                        all_red_flags.append(clean_flag)
+                    if clean_flag not in seen_red_flags:
+                        seen_red_flags.add(clean_flag)
+                        new_red_flags.append(clean_flag)
                 elif flag.startswith("GREEN:") or "green" in flag.lower():
                     clean_flag = flag.replace("GREEN:", "").strip()
                     if clean_flag not in existing.get("green_flags_observed", []):
                         existing.setdefault("green_flags_observed", []).append(clean_flag)
-                    if clean_flag not in all_green_flags:
-                        all_green_flags.append(clean_flag)
+                    if clean_flag not in seen_green_flags:
+                        seen_green_flags.add(clean_flag)
+                        new_green_flags.append(clean_flag)
 
         competency_scores[comp_id] = existing
 
     # Calculate overall level from competency scores
-    overall_level = get_overall_level(competency_scores, spec)
+    overall_level = get_overall_level(competency_scores, compiled)
     level_name = get_level_name(overall_level)
 
     # Determine trend
@@ -299,9 +368,9 @@ def _process_spec_driven_evaluation(
         trend = "STABLE"
 
     # Track level history
-    level_history = list(state.get("level_history", []))
+    new_history = []
     if overall_level > 0:
-        level_history.append({
+        new_history.append({
             "level": overall_level,
             "trend": trend,
             "justification": evaluation.get("overall_assessment", ""),
@@ -313,42 +382,32 @@ def _process_spec_driven_evaluation(
         "current_level": overall_level,
         "level_name": level_name,
         "level_trend": trend,
-        "level_history": level_history,
+        "level_history": Append(*new_history),
         "evaluator_action": evaluation.get("action", "DO_NOT_HELP"),
         "evaluator_guidance": evaluation.get("interviewer_guidance", ""),
         "data_to_share": evaluation.get("data_to_share"),
-        "red_flags_observed": all_red_flags,
-        "green_flags_observed": all_green_flags,
-        "total_tokens": state.get("total_tokens", 0) + tokens_used,
+        "red_flags_observed": Append(*new_red_flags),
+        "green_flags_observed": Append(*new_green_flags),
+        **usage_state_update(usage),
     }
 
 
 def _process_legacy_evaluation(
     state: InterviewState,
-    response_content: str,
-    tokens_used: int
+    evaluation: Dict[str, Any],
+    usage: Dict[str, int]
 ) -> Dict[str, Any]:
-    """Process evaluation response for legacy case interviews."""
-
-    evaluation = parse_evaluator_response(response_content, is_spec_driven=False)
-
-    # Update flags (accumulate, don't duplicate)
-    red_flags = list(state.get("red_flags_observed", []))
-    green_flags = list(state.get("green_flags_observed", []))
+    """Process a parsed evaluation for legacy case interviews."""
 
-    for flag in evaluation.get("red_flags", []):
-        if flag and flag not in red_flags:
-            red_flags.append(flag)
-
-    for flag in evaluation.get("green_flags", []):
-        if flag and flag not in green_flags:
-            green_flags.append(flag)
+    # Update flags (accumulate, don't duplicate; only new ones are returned)
+    red_flags = _new_flags(state.get("red_flags_observed", []), evaluation.get("red_flags", []))
+    green_flags = _new_flags(state.get("green_flags_observed", []), evaluation.get("green_flags", []))
 
     # Track level history
-    level_history = list(state.get("level_history", []))
+    new_history = []
     new_level = evaluation.get("current_level", state.get("current_level", 0))
     if new_level > 0:
-        level_history.append({
+        new_history.append({
             "level": new_level,
             "trend": evaluation.get("level_trend", "STABLE"),
             "justification": evaluation.get("level_justification", ""),
@@ -359,11 +418,22 @@ def _process_legacy_evaluation(
         "current_level": new_level,
         "level_name": evaluation.get("level_name", state.get("level_name", "NOT_ASSESSED")),
         "level_trend": evaluation.get("level_trend", "STABLE"),
-        "level_history": level_history,
+        "level_history": Append(*new_history),
         "evaluator_action": evaluation.get("action", "DO_NOT_HELP"),
         "evaluator_guidance": evaluation.get("interviewer_guidance", ""),
         "data_to_share": evaluation.get("data_to_share"),
-        "red_flags_observed": red_flags,
-        "green_flags_observed": green_flags,
-        "total_tokens": state.get("total_tokens", 0) + tokens_used,
+        "red_flags_observed": Append(*red_flags),
+        "green_flags_observed": Append(*green_flags),
+        **usage_state_update(usage),
     }
+
+
+def _new_flags(observed: List[str], flags: List[str]) -> List[str]:
+    """Flags not observed before, in order and without duplicates."""
+    seen = set(observed)
+    new = []
+    for flag in flags:
+        if flag and flag not in seen:
+            seen.add(flag)
+            new.append(flag)
+    return new
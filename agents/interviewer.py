@@ -8,32 +8,36 @@ The interviewer is a "Method Actor" - same core capabilities, different script.
 When an InterviewSpec is present, behavior is adapted by the heuristics.
 """
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Callable, Awaitable
 from datetime import datetime
 import json
+import re
 
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / ".env")
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage
 
 from state import (
     InterviewState,
     Message,
     has_spec,
+    get_compiled_spec,
     get_heuristics,
     get_context_packet,
     get_current_phase_config,
+    Append,
+    Increment,
 )
-from prompts.prompt_builder import build_interviewer_prompt, build_opening_message
+from prompts.prompt_builder import build_interviewer_system_blocks, build_opening_message
+from agents.usage import extract_token_usage, usage_state_update
+from llm.cache import content_text
+from llm.resilience import LLMUnavailable
+from llm.routing import route_llm
+from telemetry import annotate_span, record_tokens, timed_stage, traced
 
-# Initialize LLM
-interviewer_llm = ChatAnthropic(
-    model="claude-sonnet-4-20250514",
-    temperature=0.3,
-    max_tokens=1024,
-)
+# Said when the model can't answer in time and the spec suggests nothing better
+DEFAULT_NEUTRAL_PROMPT = "Take your time. Could you walk me through your thinking so far?"
 
 
 def parse_interviewer_response(response_text: str) -> Dict[str, Any]:
@@ -48,9 +52,145 @@ def parse_interviewer_response(response_text: str) -> Dict[str, Any]:
         return json.loads(text.strip())
     except json.JSONDecodeError:
         # Fallback: treat the whole response as the spoken message
-        return {"spoken": response_text}
+        return {"spoken": response_text, "parse_error": True}
+
+
+class SpokenFieldExtractor:
+    """
+    Incrementally extract the "spoken" value from a streaming JSON reply.
 
+    The interviewer answers with {"spoken": "..."}, optionally inside a
+    ```json fence. Feed raw completion chunks to `feed()` and it returns the
+    newly decoded part of the spoken text, so tokens can be shown before the
+    JSON envelope is complete. If the reply turns out not to be JSON, the raw
+    text is passed through, matching parse_interviewer_response's fallback.
+    """
 
+    _ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._mode: Optional[str] = None  # None (undecided) | "json" | "raw"
+        self._in_value = False
+        self._done = False
+
+    def feed(self, chunk: str) -> str:
+        """Consume a chunk of the raw completion and return new spoken text."""
+        self._buffer += chunk
+
+        if self._mode is None:
+            self._mode = self._detect_mode()
+            if self._mode is None:
+                return ""
+
+        if self._mode == "raw":
+            text = self._buffer[self._pos:]
+            self._pos = len(self._buffer)
+            return text
+
+        if self._done:
+            return ""
+
+        if not self._in_value and not self._seek_value_start():
+            return ""
+
+        return self._decode_available()
+
+    def _detect_mode(self) -> Optional[str]:
+        """Decide whether the reply is a JSON envelope or plain text."""
+        text = self._buffer.lstrip()
+        if len(text) < 3 and "```".startswith(text):
+            return None
+        if text.startswith("```"):
+            newline = text.find("\n")
+            if newline == -1:
+                return None
+            text = text[newline + 1:].lstrip()
+        if not text:
+            return None
+        return "json" if text.startswith("{") else "raw"
+
+    def _seek_value_start(self) -> bool:
+        """Advance past `"spoken": "` once it has fully arrived."""
+        key = self._buffer.find('"spoken"')
+        if key == -1:
+            return False
+        colon = self._buffer.find(":", key + len('"spoken"'))
+        if colon == -1:
+            return False
+        quote = colon + 1
+        while quote < len(self._buffer) and self._buffer[quote] in " \t\r\n":
+            quote += 1
+        if quote >= len(self._buffer):
+            return False
+        if self._buffer[quote] != '"':
+            # Not a string value - let the final parse deal with it
+            self._done = True
+            return False
+        self._pos = quote + 1
+        self._in_value = True
+        return True
+
+    def _decode_available(self) -> str:
+        """Decode as much of the JSON string value as has arrived."""
+        out = []
+        buf = self._buffer
+        i = self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self._done = True
+                i += 1
+                break
+            if ch != "\\":
+                out.append(ch)
+                i += 1
+                continue
+            # Escape sequence - wait for the rest of it to arrive
+            if i + 1 >= len(buf):
+                break
+            code = buf[i + 1]
+            if code == "u":
+                if i + 6 > len(buf):
+                    break
+                codepoint = _hex4(buf[i + 2:i + 6])
+                if codepoint is None:
+                    # Malformed escape: stop streaming, the final parse decides the message
+                    self._done = True
+                    break
+                width = 6
+                if 0xD800 <= codepoint <= 0xDBFF:
+                    # Surrogate pair: needs the low half too, if one follows
+                    if i + 8 > len(buf):
+                        break
+                    if buf[i + 6:i + 8] == "\\u":
+                        if i + 12 > len(buf):
+                            break
+                        low = _hex4(buf[i + 8:i + 12])
+                        if low is None:
+                            self._done = True
+                            break
+                        if 0xDC00 <= low <= 0xDFFF:
+                            codepoint = 0x10000 + ((codepoint - 0xD800) << 10) + (low - 0xDC00)
+                            width = 12
+                out.append(chr(codepoint))
+                i += width
+            else:
+                out.append(self._ESCAPES.get(code, code))
+                i += 2
+        self._pos = i
+        return "".join(out)
+
+
+def _hex4(text: str) -> Optional[int]:
+    """The value of a \\uXXXX escape's four hex digits, or None if malformed."""
+    if len(text) != 4 or any(c not in "0123456789abcdefABCDEF" for c in text):
+        return None
+    return int(text, 16)
+
+
+@traced("interviewer")
 def interviewer_node(state: InterviewState) -> Dict[str, Any]:
     """
     Generate the interviewer's response to the candidate.
@@ -58,6 +198,9 @@ def interviewer_node(state: InterviewState) -> Dict[str, Any]:
 
     When an InterviewSpec is present, uses heuristics from the spec.
     Otherwise, uses legacy case interview behavior.
+
+    If the model can't answer within the turn's time budget, a neutral
+    prompt is said instead (see generate_neutral_prompt).
     """
     # Check if interview is complete
     if state.get("is_complete"):
@@ -67,8 +210,71 @@ def interviewer_node(state: InterviewState) -> Dict[str, Any]:
     if not state["messages"]:
         return generate_opening_message_node(state)
 
-    # Build the system prompt (spec-driven or legacy)
-    system_prompt = build_interviewer_prompt(state)
+    try:
+        response = route_llm("interviewer", state).invoke(_build_interviewer_messages(state))
+    except LLMUnavailable:
+        return generate_neutral_prompt(state)
+    return _process_interviewer_response(state, response)
+
+
+@traced("interviewer")
+async def ainterviewer_node(
+    state: InterviewState,
+    on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> Dict[str, Any]:
+    """
+    Async variant of interviewer_node.
+
+    Uses ainvoke so the event loop stays free while the model is working.
+    Opening and closing messages are canned, so they need no LLM call.
+
+    When `on_token` is given, the reply is streamed and `on_token` is
+    awaited with each new piece of spoken text as it is generated.
+    """
+    if state.get("is_complete"):
+        return generate_closing_message(state)
+
+    if not state["messages"]:
+        return generate_opening_message_node(state)
+
+    messages = _build_interviewer_messages(state)
+
+    if on_token is None:
+        try:
+            response = await route_llm("interviewer", state).ainvoke(messages)
+        except LLMUnavailable:
+            return generate_neutral_prompt(state)
+        return _process_interviewer_response(state, response)
+
+    extractor = SpokenFieldExtractor()
+    response = None
+    streamed = False
+    try:
+        async for chunk in route_llm("interviewer", state).astream(messages):
+            response = chunk if response is None else response + chunk
+            text = extractor.feed(content_text(chunk.content))
+            if text:
+                streamed = True
+                await on_token(text)
+    except LLMUnavailable:
+        response = None
+
+    if response is None:
+        # Unavailable, or a stream that ended without a single chunk
+        fallback = generate_neutral_prompt(state)
+        if not streamed:
+            await on_token(fallback["messages"].items[0]["content"])
+        return fallback
+
+    return _process_interviewer_response(state, response)
+
+
+@timed_stage("prompt_build_seconds")
+def _build_interviewer_messages(state: InterviewState) -> List[BaseMessage]:
+    """Build the interviewer LLM input for the current state."""
+
+    # Build the system prompt (spec-driven or legacy) as cacheable blocks
+    system_blocks = build_interviewer_system_blocks(state)
 
     # Get recent conversation
     recent_messages = state["messages"][-10:]
@@ -114,20 +320,26 @@ def interviewer_node(state: InterviewState) -> Dict[str, Any]:
 
 Respond to the candidate's last message, following the evaluator's guidance and your methodology principles."""
 
-    messages = [
-        SystemMessage(content=system_prompt),
+    return [
+        SystemMessage(content=system_blocks),
         HumanMessage(content=context),
     ]
 
-    response = interviewer_llm.invoke(messages)
-    parsed = parse_interviewer_response(response.content)
 
-    # Track token usage
-    usage = response.response_metadata.get("usage", {})
-    tokens_used = usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+@timed_stage("parse_seconds")
+def _process_interviewer_response(state: InterviewState, response: Any) -> Dict[str, Any]:
+    """Turn an interviewer LLM response into a state update."""
+
+    content = content_text(response.content)
+    parsed = parse_interviewer_response(content)
+
+    # Track token usage (streamed replies report it as usage_metadata)
+    usage = extract_token_usage(response)
+    record_tokens(usage)
+    annotate_span(parse="fallback" if parsed.get("parse_error") else "ok")
 
     # Extract the spoken message
-    spoken = parsed.get("spoken", response.content)
+    spoken = parsed.get("spoken", content)
 
     new_message = Message(
         role="interviewer",
@@ -136,8 +348,8 @@ Respond to the candidate's last message, following the evaluator's guidance and
     )
 
     return {
-        "messages": state["messages"] + [new_message],
-        "total_tokens": state.get("total_tokens", 0) + tokens_used,
+        "messages": Append(new_message),
+        **usage_state_update(usage),
     }
 
 
@@ -162,11 +374,10 @@ def _generate_spec_opening(state: InterviewState) -> Dict[str, Any]:
     context_packet = get_context_packet(state) or {}
     heuristics = get_heuristics(state) or {}
     packet_type = context_packet.get("packet_type", "")
-    spec = state.get("interview_spec", {})
+    compiled = get_compiled_spec(state)
 
     # Get the first phase
-    phases = spec.get("phases", [])
-    first_phase = phases[0]["id"] if phases else "opening"
+    first_phase = compiled.first_phase_id or "opening"
 
     # Build the opening based on interview type
     if packet_type == "case_study":
@@ -186,7 +397,7 @@ def _generate_spec_opening(state: InterviewState) -> Dict[str, Any]:
     )
 
     return {
-        "messages": [new_message],
+        "messages": Append(new_message),
         "current_phase": first_phase.upper(),
     }
 
@@ -272,11 +483,40 @@ Over to you."""
     )
 
     return {
-        "messages": [new_message],
+        "messages": Append(new_message),
         "current_phase": "STRUCTURING",
     }
 
 
+def generate_neutral_prompt(state: InterviewState) -> Dict[str, Any]:
+    """
+    Fallback reply for a turn the model couldn't answer in time.
+
+    Uses the spec's own silence prompt (the first quoted question in the
+    silence_tolerance heuristic, e.g. 'What are you thinking?'), which is
+    safe to say at any point without evaluator guidance.
+    """
+    phase = get_current_phase_config(state) or {}
+    overrides = phase.get("heuristic_overrides")
+    heuristics = get_heuristics(state) or {}
+    silence_tolerance = (
+        overrides.get("silence_tolerance") if isinstance(overrides, dict) else None
+    ) or heuristics.get("silence_tolerance", "")
+
+    match = re.search(r"'([^']+\?)'", silence_tolerance)
+    new_message = Message(
+        role="interviewer",
+        content=match.group(1) if match else DEFAULT_NEUTRAL_PROMPT,
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+    annotate_span(parse="degraded")
+    return {
+        "messages": Append(new_message),
+        "degraded_calls": Increment(1),
+    }
+
+
 def generate_closing_message(state: InterviewState) -> Dict[str, Any]:
     """
     Generate the interview closing.
@@ -287,9 +527,9 @@ def generate_closing_message(state: InterviewState) -> Dict[str, Any]:
     closing_style = heuristics.get("closing_style", "")
 
     # Default closings by type
-    if has_spec(state):
-        spec = state.get("interview_spec", {})
-        interview_type = spec.get("interview_type", "")
+    compiled = get_compiled_spec(state)
+    if compiled:
+        interview_type = compiled.interview_type
 
         if interview_type == "first_round":
             closing = "That's been really helpful - thank you for sharing your background with me. Do you have any questions for me about the role or the company before we wrap up?"
@@ -312,7 +552,7 @@ def generate_closing_message(state: InterviewState) -> Dict[str, Any]:
     )
 
     return {
-        "messages": state["messages"] + [new_message],
+        "messages": Append(new_message),
         "is_complete": True,
         "final_score": state.get("current_level", 0),
         "current_phase": "COMPLETE",
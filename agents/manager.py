@@ -17,11 +17,13 @@ from state import (
     InterviewState,
     ManagerDirective,
     has_spec,
-    get_current_phase_config,
-    get_heuristics,
+    get_compiled_spec,
+    count_role,
 )
+from telemetry import traced
 
 
+@traced("manager")
 def manager_node(state: InterviewState) -> Dict[str, Any]:
     """
     Manage session constraints and provide guidance for interview flow.
@@ -36,27 +38,14 @@ def manager_node(state: InterviewState) -> Dict[str, Any]:
     if state.get("is_complete"):
         return {"should_continue": False}
 
-    # Get constraints from spec or use defaults
-    if has_spec(state):
-        spec = state.get("interview_spec", {})
-        constraints = spec.get("constraints", {})
-        max_duration = constraints.get("max_duration_minutes", 30)
-        max_exchanges = constraints.get("max_exchanges", 15)
-        min_exchanges = constraints.get("min_exchanges_for_completion", 5)
-        allow_early = constraints.get("allow_early_termination", True)
-    else:
-        max_duration = 30
-        max_exchanges = 15
-        min_exchanges = 5
-        allow_early = True
-
-    # Count candidate exchanges
-    candidate_messages = [m for m in state.get("messages", []) if m["role"] == "candidate"]
-    num_exchanges = len(candidate_messages)
+    # Check hard termination conditions
+    termination = check_session_constraints(state)
+    if termination:
+        return termination
 
-    # Check time elapsed
-    started_at = datetime.fromisoformat(state["started_at"])
-    elapsed_minutes = (datetime.utcnow() - started_at).total_seconds() / 60
+    max_duration, max_exchanges, min_exchanges, allow_early = _get_constraints(state)
+    num_exchanges = _count_exchanges(state)
+    elapsed_minutes = _elapsed_minutes(state)
 
     # Determine urgency
     time_remaining = max_duration - elapsed_minutes
@@ -69,8 +58,43 @@ def manager_node(state: InterviewState) -> Dict[str, Any]:
     else:
         urgency = "normal"
 
-    # Check hard termination conditions
-    if num_exchanges >= max_exchanges:
+    # For spec-driven interviews, check competency coverage and phase guidance
+    if has_spec(state):
+        directive = _build_spec_directive(state, num_exchanges, min_exchanges, urgency, allow_early)
+    else:
+        directive = _build_legacy_directive(state, num_exchanges, min_exchanges, urgency)
+
+    # Check if we should end based on directive
+    if not directive.get("should_continue", True):
+        return {
+            "should_continue": False,
+            "is_complete": True,
+            "manager_directive": directive
+        }
+
+    return {
+        "should_continue": True,
+        "manager_directive": directive
+    }
+
+
+def check_session_constraints(state: InterviewState) -> Optional[Dict[str, Any]]:
+    """
+    Check the hard session limits: maximum exchanges and time.
+
+    This needs no LLM call, so the runner calls it before the interviewer.
+    When the session must end, the turn can go straight to the closing
+    message instead of paying for an interviewer reply that is never used.
+
+    Returns:
+        The terminating state update, or None if the session may continue
+    """
+    if state.get("is_complete"):
+        return None
+
+    max_duration, max_exchanges, _, _ = _get_constraints(state)
+
+    if _count_exchanges(state) >= max_exchanges:
         return {
             "should_continue": False,
             "is_complete": True,
@@ -81,7 +105,7 @@ def manager_node(state: InterviewState) -> Dict[str, Any]:
             )
         }
 
-    if elapsed_minutes >= max_duration:
+    if _elapsed_minutes(state) >= max_duration:
         return {
             "should_continue": False,
             "is_complete": True,
@@ -92,24 +116,31 @@ def manager_node(state: InterviewState) -> Dict[str, Any]:
             )
         }
 
-    # For spec-driven interviews, check competency coverage and phase guidance
-    if has_spec(state):
-        directive = _build_spec_directive(state, num_exchanges, min_exchanges, urgency, allow_early)
-    else:
-        directive = _build_legacy_directive(state, num_exchanges, min_exchanges, urgency)
+    return None
 
-    # Check if we should end based on directive
-    if not directive.get("should_continue", True):
-        return {
-            "should_continue": False,
-            "is_complete": True,
-            "manager_directive": directive
-        }
 
-    return {
-        "should_continue": True,
-        "manager_directive": directive
-    }
+def _get_constraints(state: InterviewState) -> tuple:
+    """Get (max_duration, max_exchanges, min_exchanges, allow_early) from spec or defaults."""
+    compiled = get_compiled_spec(state)
+    if compiled:
+        return (
+            compiled.max_duration_minutes,
+            compiled.max_exchanges,
+            compiled.min_exchanges,
+            compiled.allow_early_termination,
+        )
+    return 30, 15, 5, True
+
+
+def _count_exchanges(state: InterviewState) -> int:
+    """Count candidate exchanges so far."""
+    return count_role(state.get("messages", []), "candidate")
+
+
+def _elapsed_minutes(state: InterviewState) -> float:
+    """Minutes since the interview started."""
+    started_at = datetime.fromisoformat(state["started_at"])
+    return (datetime.utcnow() - started_at).total_seconds() / 60
 
 
 def _build_spec_directive(
@@ -121,16 +152,16 @@ def _build_spec_directive(
 ) -> ManagerDirective:
     """Build directive for spec-driven interviews."""
 
-    spec = state.get("interview_spec", {})
+    compiled = get_compiled_spec(state)
     competency_scores = state.get("competency_scores", {})
 
     # Analyze competency coverage
     undercovered = []
     satisfied = []
 
-    for comp_config in spec.get("competencies", []):
-        comp_id = comp_config.get("competency_id", "")
-        tier = comp_config.get("tier", "important")
+    for comp in compiled.competencies:
+        comp_id = comp.competency_id
+        tier = comp.tier
 
         score = competency_scores.get(comp_id, {})
         level = score.get("current_level", 0)
@@ -155,7 +186,7 @@ def _build_spec_directive(
         # Prioritize critical competencies
         critical_undercovered = [
             c for c in undercovered
-            if _get_tier(c, spec) == "critical"
+            if c in compiled.critical_ids
         ]
         if critical_undercovered:
             focus_area = f"Need more signal on: {', '.join(critical_undercovered[:2])}"
@@ -170,12 +201,12 @@ def _build_spec_directive(
     if allow_early and num_exchanges >= min_exchanges:
         # Can end if all competencies have sufficient signal
         all_assessed = all(
-            competency_scores.get(c.get("competency_id", ""), {}).get("current_level", 0) > 0
-            for c in spec.get("competencies", [])
+            competency_scores.get(c, {}).get("current_level", 0) > 0
+            for c in compiled.competency_ids
         )
         all_confident = all(
-            competency_scores.get(c.get("competency_id", ""), {}).get("confidence", "low") != "low"
-            for c in spec.get("competencies", [])
+            competency_scores.get(c, {}).get("confidence", "low") != "low"
+            for c in compiled.competency_ids
         )
 
         if all_assessed and all_confident and not undercovered:
@@ -236,24 +267,12 @@ def _build_legacy_directive(
 def _check_phase_transition(state: InterviewState, num_exchanges: int) -> tuple:
     """Check if a phase transition should be suggested."""
 
-    current_phase_id = state.get("current_phase", "").lower()
-    spec = state.get("interview_spec", {})
-    phases = spec.get("phases", [])
+    compiled = get_compiled_spec(state)
+    current_phase = compiled.phase(state.get("current_phase", "")) if compiled else None
 
-    if not phases:
-        return None, None
-
-    # Find current phase config
-    current_phase_config = None
-    current_phase_index = -1
-    for i, phase in enumerate(phases):
-        if phase.get("id", "").lower() == current_phase_id:
-            current_phase_config = phase
-            current_phase_index = i
-            break
-
-    if not current_phase_config:
+    if not current_phase:
         return None, None
+    current_phase_config = current_phase.config
 
     # Count exchanges in current phase (simplified - count from last phase change)
     # In a full implementation, we'd track phase entry time
@@ -263,24 +282,15 @@ def _check_phase_transition(state: InterviewState, num_exchanges: int) -> tuple:
     suggested_max = current_phase_config.get("suggested_max_exchanges")
     if suggested_max and phase_exchanges >= suggested_max:
         # Suggest moving to next phase
-        if current_phase_index + 1 < len(phases):
-            next_phase = phases[current_phase_index + 1]
+        if current_phase.next_phase_id is not None:
             return (
-                next_phase.get("id"),
+                current_phase.next_phase_id,
                 f"Current phase ({current_phase_config.get('name', '')}) has reached suggested duration"
             )
 
     return None, None
 
 
-def _get_tier(competency_id: str, spec: Dict[str, Any]) -> str:
-    """Get the tier of a competency from the spec."""
-    for comp in spec.get("competencies", []):
-        if comp.get("competency_id", "") == competency_id:
-            return comp.get("tier", "important")
-    return "important"
-
-
 def _create_directive(
     should_continue: bool,
     urgency: str = "normal",
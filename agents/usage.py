@@ -0,0 +1,63 @@
+"""
+Token usage extraction shared by the LLM-backed agents.
+
+Anthropic reports uncached input, cache reads and cache writes separately.
+The state keeps a running `total_tokens` (everything processed) plus the
+cache counters, so the effect of prompt caching is visible per session.
+"""
+from typing import Dict, Any
+
+from state import Increment
+
+# State counters updated by every LLM-backed node
+USAGE_STATE_KEYS = ("total_tokens", "cache_read_tokens", "cache_write_tokens")
+
+
+def extract_token_usage(response: Any) -> Dict[str, int]:
+    """
+    Get token counts from an LLM response.
+
+    Handles both the raw Anthropic `usage` block in response_metadata and
+    LangChain's `usage_metadata` (used for streamed replies), whose
+    input_tokens already include cached tokens.
+    """
+    usage = response.response_metadata.get("usage")
+    if usage:
+        return {
+            "input_tokens": usage.get("input_tokens", 0) or 0,
+            "output_tokens": usage.get("output_tokens", 0) or 0,
+            "cache_read_tokens": usage.get("cache_read_input_tokens", 0) or 0,
+            "cache_write_tokens": usage.get("cache_creation_input_tokens", 0) or 0,
+        }
+
+    usage = getattr(response, "usage_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    cache_read = details.get("cache_read", 0) or 0
+    cache_write = details.get("cache_creation", 0) or 0
+    return {
+        "input_tokens": max(0, (usage.get("input_tokens", 0) or 0) - cache_read - cache_write),
+        "output_tokens": usage.get("output_tokens", 0) or 0,
+        "cache_read_tokens": cache_read,
+        "cache_write_tokens": cache_write,
+    }
+
+
+def usage_state_update(usage: Dict[str, int]) -> Dict[str, Increment]:
+    """Build the state delta that adds `usage` to the session counters."""
+    tokens_used = (
+        usage["input_tokens"]
+        + usage["output_tokens"]
+        + usage["cache_read_tokens"]
+        + usage["cache_write_tokens"]
+    )
+    return {
+        "total_tokens": Increment(tokens_used),
+        "cache_read_tokens": Increment(usage["cache_read_tokens"]),
+        "cache_write_tokens": Increment(usage["cache_write_tokens"]),
+    }
+
+
+def tokens_in(result: Dict[str, Any]) -> int:
+    """Total tokens a node result spent."""
+    delta = result.get("total_tokens")
+    return delta.amount if isinstance(delta, Increment) else 0
@@ -14,9 +14,14 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from api.routes.interview import router as interview_router
+from llm.admission import get_admission_stats
+from llm.routing import get_routing_report
+from prompts.render_cache import get_render_cache_stats
+from telemetry import render_metrics
 
 app = FastAPI(
     title="Case Interview API",
@@ -52,3 +57,19 @@ async def root():
 async def health():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/api/llm/stats")
+async def llm_stats():
+    """LLM admission (in-flight calls, queue depth, waits), per-tier routing and prompt render cache stats."""
+    return {
+        "admission": get_admission_stats(),
+        "routing": get_routing_report(),
+        "prompt_render_cache": get_render_cache_stats(),
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Per-agent, per-interview-type latency histograms and token counters, for Prometheus."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
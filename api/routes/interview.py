@@ -2,10 +2,15 @@
 Interview API routes.
 Wraps the existing InterviewRunner for the candidate-facing React app.
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from contextlib import aclosing
+from typing import Optional, Dict, Any, AsyncGenerator, AsyncIterator, Awaitable, Callable
+import hashlib
+import json
 import uuid
+import os
 
 import sys
 from pathlib import Path
@@ -13,11 +18,22 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from case_loader import initialize_interview_state, get_available_cases
 from graph import InterviewRunner
+from llm.admission import AdmissionRejected, Priority, admission
+from api.session_store import (
+    Reply,
+    SessionBusyError,
+    SessionConflictError,
+    SessionLease,
+    create_session_store,
+)
 
 router = APIRouter(prefix="/api", tags=["interview"])
 
-# In-memory session storage (use Redis/DB in production)
-sessions: Dict[str, InterviewRunner] = {}
+# Session storage, bounded and expiring (see api/session_store.py)
+sessions = create_session_store()
+
+# Turn mode for new sessions: "serial" (default), "speculative" or "pipelined"
+TURN_MODE = os.getenv("INTERVIEW_TURN_MODE", "serial")
 
 
 class StartInterviewRequest(BaseModel):
@@ -69,16 +85,16 @@ async def start_interview(request: StartInterviewRequest):
 
     # Initialize the interview
     state = initialize_interview_state(request.case_id)
-    runner = InterviewRunner(state)
+    runner = InterviewRunner(state, turn_mode=TURN_MODE)
 
     # Generate session ID
     session_id = str(uuid.uuid4())
 
     # Start the interview and get opening message
-    opening = runner.start()
+    opening = await runner.astart()
 
     # Store the session
-    sessions[session_id] = runner
+    await sessions.aput(session_id, runner)
 
     return StartInterviewResponse(
         session_id=session_id,
@@ -88,32 +104,206 @@ async def start_interview(request: StartInterviewRequest):
 
 
 @router.post("/interviews/{session_id}/respond", response_model=RespondResponse)
-async def respond_to_interview(session_id: str, request: RespondRequest):
-    """Send a candidate message and get the interviewer's response."""
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
+async def respond_to_interview(
+    session_id: str,
+    request: RespondRequest,
+    idempotency_key: Optional[str] = Header(None),
+):
+    """
+    Send a candidate message and get the interviewer's response.
+
+    Turns for one session run one at a time. With an `Idempotency-Key`
+    header, a retried request gets the stored reply instead of a new turn.
+    """
+    lease = await _acquire_lease(session_id)
+    try:
+        replayed = await _stored_reply(session_id, idempotency_key, request)
+        if replayed is not None:
+            return replayed
+
+        runner = await _get_runner(session_id)
+
+        if runner.is_complete():
+            raise HTTPException(status_code=400, detail="Interview is already complete")
+
+        # Get the interviewer's response
+        _check_llm_capacity()
+        try:
+            response = await runner.arespond(request.message)
+        except AdmissionRejected as e:
+            raise _too_busy(e)
+        result = RespondResponse(
+            interviewer_message=response,
+            is_complete=runner.is_complete()
+        )
+        await _save_runner(session_id, runner, _reply(idempotency_key, request, result))
+    finally:
+        await lease.arelease()
+
+    return result
+
+
+@router.post("/interviews/{session_id}/respond/stream")
+async def respond_to_interview_stream(
+    session_id: str,
+    request: RespondRequest,
+    idempotency_key: Optional[str] = Header(None),
+):
+    """
+    Send a candidate message and stream the interviewer's response (SSE).
+
+    Emits `token` events with pieces of the interviewer's reply as they are
+    generated, then a single `done` event shaped like RespondResponse.
+    A retry with the same `Idempotency-Key` replays the stored reply as one
+    `token` event followed by `done`.
+    """
+    lease = await _acquire_lease(session_id)
+    try:
+        replayed = await _stored_reply(session_id, idempotency_key, request)
+        if replayed is not None:
+            await lease.arelease()
+            return StreamingResponse(
+                _sse_events(_replay_events(replayed)),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
+        runner = await _get_runner(session_id)
+
+        if runner.is_complete():
+            raise HTTPException(status_code=400, detail="Interview is already complete")
+
+        _check_llm_capacity()
+    except BaseException:
+        await lease.arelease()
+        raise
+
+    # The lease is held until the stream finishes
+    return StreamingResponse(
+        _sse_events(
+            runner.arespond_stream(request.message),
+            on_done=lambda done: _save_runner(session_id, runner, _reply(idempotency_key, request, done)),
+            lease=lease,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-    runner = sessions[session_id]
 
-    if runner.is_complete():
-        raise HTTPException(status_code=400, detail="Interview is already complete")
+async def _acquire_lease(session_id: str) -> SessionLease:
+    """Hold the session for one turn or raise 409 if another request keeps it."""
+    try:
+        return await sessions.acquire_lease(session_id)
+    except SessionBusyError:
+        raise HTTPException(status_code=409, detail="Session is busy with another request")
 
-    # Get the interviewer's response
-    response = runner.respond(request.message)
 
-    return RespondResponse(
-        interviewer_message=response,
-        is_complete=runner.is_complete()
+def _check_llm_capacity() -> None:
+    """Shed load with 429 before a turn starts if the LLM queue is full."""
+    try:
+        admission.check_capacity(Priority.LIVE_TURN)
+    except AdmissionRejected as e:
+        raise _too_busy(e)
+
+
+def _too_busy(error: AdmissionRejected) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="The interviewer is busy, please retry shortly",
+        headers={"Retry-After": str(int(error.retry_after))},
     )
 
 
+async def _get_runner(session_id: str) -> InterviewRunner:
+    """Look up a session's runner or raise 404."""
+    runner = await sessions.aget(session_id)
+    if runner is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return runner
+
+
+async def _save_runner(session_id: str, runner: InterviewRunner, reply: Optional[Reply] = None) -> None:
+    """Store the session after a turn or raise 409 if it changed underneath us."""
+    try:
+        await sessions.aput(session_id, runner, reply=reply)
+    except SessionConflictError:
+        raise HTTPException(status_code=409, detail="Session was updated by another request")
+
+
+def _request_hash(request: RespondRequest) -> str:
+    return hashlib.sha256(request.message.encode("utf-8")).hexdigest()
+
+
+def _reply(idempotency_key: Optional[str], request: RespondRequest, result: "RespondResponse") -> Optional[Reply]:
+    """The (key, reply) to store with a turn, if the request was idempotent."""
+    if not idempotency_key:
+        return None
+    return idempotency_key, {"request_hash": _request_hash(request), "response": result.model_dump()}
+
+
+async def _stored_reply(
+    session_id: str,
+    idempotency_key: Optional[str],
+    request: RespondRequest,
+) -> Optional[RespondResponse]:
+    """The reply already computed for this idempotency key, if any."""
+    if not idempotency_key:
+        return None
+    stored = await sessions.aget_reply(session_id, idempotency_key)
+    if stored is None:
+        return None
+    if stored["request_hash"] != _request_hash(request):
+        raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different message")
+    return RespondResponse(**stored["response"])
+
+
+async def _replay_events(reply: RespondResponse) -> AsyncIterator[Dict[str, Any]]:
+    """Runner-style stream events for a stored reply."""
+    yield {"type": "token", "text": reply.interviewer_message}
+    yield {"type": "done", **reply.model_dump()}
+
+
+async def _sse_events(
+    events: AsyncGenerator[Dict[str, Any], None],
+    on_done: Optional[Callable[[RespondResponse], Awaitable[None]]] = None,
+    lease: Optional[SessionLease] = None,
+) -> AsyncIterator[str]:
+    """
+    Format runner stream events as Server-Sent Events.
+
+    The runner's stream is closed before the lease is released, so a client
+    that disconnects mid-turn leaves the session rolled back, not busy.
+    """
+    try:
+        async with aclosing(events):
+            async for event in events:
+                if event["type"] == "token":
+                    yield _sse("token", {"text": event["text"]})
+                else:
+                    done = RespondResponse(
+                        interviewer_message=event["interviewer_message"],
+                        is_complete=event["is_complete"],
+                    )
+                    if on_done is not None:
+                        await on_done(done)
+                    yield _sse("done", done.model_dump())
+    except Exception:
+        yield _sse("error", {"detail": "Failed to generate a response"})
+        raise
+    finally:
+        if lease is not None:
+            await lease.arelease()
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Encode a single Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @router.get("/interviews/{session_id}/status", response_model=InterviewStatus)
 async def get_interview_status(session_id: str):
     """Check the status of an interview session."""
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    runner = sessions[session_id]
+    runner = await _get_runner(session_id)
     messages = runner.get_messages()
     candidate_messages = [m for m in messages if m["role"] == "candidate"]
 
@@ -121,3 +311,9 @@ async def get_interview_status(session_id: str):
         is_complete=runner.is_complete(),
         message_count=len(candidate_messages)
     )
+
+
+@router.get("/sessions/stats")
+async def get_session_stats():
+    """Session store counters: size, hits and evictions."""
+    return await sessions.astats()
@@ -0,0 +1,775 @@
+"""
+Session storage for the interview API.
+
+Routes look sessions up through a SessionStore instead of a module-level
+dict, so the backing storage can change without touching the handlers.
+The default InMemorySessionStore keeps runners in an LRU bounded by entry
+count and estimated bytes, and expires idle and completed sessions.
+SQLiteSessionStore checkpoints every turn to a SQLite file, so sessions
+survive restarts and can be served by several workers on one host.
+
+Usage:
+    from api.session_store import create_session_store
+
+    store = create_session_store()     # SESSION_STORE=memory (default) or sqlite
+    store.put(session_id, runner)      # after start and after every turn
+    runner = store.get(session_id)     # None if unknown, expired or evicted
+
+    async with store.lease(session_id):    # one turn at a time per session
+        runner = await store.aget(session_id)
+        await runner.arespond(message)
+        await store.aput(session_id, runner, reply=(idempotency_key, response))
+
+Async code uses the a-prefixed methods, which run a store's blocking I/O
+(SQLite reads, checkpoints, lease updates) in a worker thread instead of
+on the event loop.
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+from graph import InterviewRunner
+from state import LOG_KEYS, InterviewState, get_compiled_spec
+
+DEFAULT_MAX_SESSIONS = int(os.getenv("SESSION_MAX_ENTRIES", "1000"))
+DEFAULT_MAX_BYTES = int(os.getenv("SESSION_MAX_BYTES", str(256 * 1024 * 1024)))
+DEFAULT_IDLE_TTL_SECONDS = float(os.getenv("SESSION_IDLE_TTL_SECONDS", "3600"))
+DEFAULT_COMPLETED_TTL_SECONDS = float(os.getenv("SESSION_COMPLETED_TTL_SECONDS", "600"))
+DEFAULT_DB_PATH = os.getenv("SESSION_DB_PATH", "sessions.db")
+DEFAULT_LEASE_TTL_SECONDS = float(os.getenv("SESSION_LEASE_TTL_SECONDS", "30"))
+DEFAULT_LEASE_WAIT_SECONDS = float(os.getenv("SESSION_LEASE_WAIT_SECONDS", "30"))
+
+# Rough per-item cost of a log entry (dict, keys, list slot) on top of its text
+_LOG_ITEM_OVERHEAD = 128
+
+# Idempotent replies remembered per session (most recent first out)
+MAX_REPLIES_PER_SESSION = 32
+
+# (idempotency key, reply) stored together with a turn's checkpoint
+Reply = Tuple[str, Dict[str, Any]]
+
+T = TypeVar("T")
+
+
+class SessionBusyError(Exception):
+    """Another worker kept the session's lease for longer than we could wait."""
+
+
+class SessionConflictError(Exception):
+    """A checkpoint was written from a stale copy of the session."""
+
+
+class SessionLease:
+    """A held session lease. release() and arelease() are idempotent."""
+
+    def __init__(
+        self,
+        release: Callable[[], None] = lambda: None,
+        arelease: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        self._release = release
+        self._arelease = arelease
+        self._released = False
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._release()
+
+    async def arelease(self) -> None:
+        """Release from async code without blocking the event loop on the store."""
+        if self._arelease is None:
+            self.release()
+        elif not self._released:
+            self._released = True
+            await self._arelease()
+
+
+class SessionStore(ABC):
+    """Where the API keeps live interview sessions."""
+
+    # Whether calls may block on I/O; if so the async methods run them in a worker thread
+    blocking_io = False
+
+    def __init__(self):
+        # One asyncio lock per session with a turn in progress
+        self._turn_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[InterviewRunner]:
+        """Return the session's runner, or None if it is not stored."""
+
+    @abstractmethod
+    def put(self, session_id: str, runner: InterviewRunner, reply: Optional[Reply] = None) -> None:
+        """
+        Store a session. Called after it starts and after every turn.
+
+        `reply` is the turn's (idempotency key, response), saved atomically
+        with the session so a retried request can be answered from it.
+        """
+
+    @abstractmethod
+    def get_reply(self, session_id: str, key: str) -> Optional[Dict[str, Any]]:
+        """The reply stored under an idempotency key, if any."""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Remove a session if present."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+
+    async def aget(self, session_id: str) -> Optional[InterviewRunner]:
+        return await self._offload(self.get, session_id)
+
+    async def aput(self, session_id: str, runner: InterviewRunner, reply: Optional[Reply] = None) -> None:
+        await self._offload(self.put, session_id, runner, reply)
+
+    async def aget_reply(self, session_id: str, key: str) -> Optional[Dict[str, Any]]:
+        return await self._offload(self.get_reply, session_id, key)
+
+    async def astats(self) -> Dict[str, Any]:
+        return await self._offload(self.stats)
+
+    async def _offload(self, fn: Callable[..., T], *args: Any) -> T:
+        """Call `fn` from async code, in a worker thread if it may block."""
+        if not self.blocking_io:
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
+    async def acquire_lease(self, session_id: str) -> SessionLease:
+        """
+        Hold a session for one turn, waiting while another request has it.
+
+        The default serializes turns within this process with a per-session
+        asyncio lock. Stores shared between processes extend it.
+        """
+        lock = self._turn_locks.get(session_id)
+        if lock is None:
+            lock = self._turn_locks[session_id] = asyncio.Lock()
+        await lock.acquire()
+        return SessionLease(lock.release)
+
+    @asynccontextmanager
+    async def lease(self, session_id: str) -> AsyncIterator[SessionLease]:
+        """Context manager around acquire_lease()."""
+        lease = await self.acquire_lease(session_id)
+        try:
+            yield lease
+        finally:
+            await lease.arelease()
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id) is not None
+
+
+@dataclass
+class _Entry:
+    runner: InterviewRunner
+    size_bytes: int
+    last_access: float
+    completed_at: Optional[float] = None
+    replies: "OrderedDict[str, Dict[str, Any]]" = field(default_factory=OrderedDict)
+    # Log sizes as of the last put, so the next one only measures new items
+    log_lengths: Dict[str, int] = field(default_factory=dict)
+    log_bytes: int = 0
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Thread-safe in-process store with LRU, byte-cap and TTL eviction.
+
+    Sessions idle for longer than `idle_ttl_seconds` expire, as do sessions
+    that finished more than `completed_ttl_seconds` ago. When the entry or
+    byte cap is exceeded, least recently used sessions are evicted first.
+    Expired sessions are swept on every get/put in O(expired).
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        idle_ttl_seconds: float = DEFAULT_IDLE_TTL_SECONDS,
+        completed_ttl_seconds: float = DEFAULT_COMPLETED_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.completed_ttl_seconds = completed_ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # Least recently used first
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # Completed sessions, oldest completion first
+        self._completed: "OrderedDict[str, float]" = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions: Dict[str, int] = {"capacity": 0, "bytes": 0, "idle": 0, "completed": 0}
+
+    def get(self, session_id: str) -> Optional[InterviewRunner]:
+        with self._lock:
+            self._sweep(self._clock())
+            entry = self._entries.get(session_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry.last_access = self._clock()
+            self._entries.move_to_end(session_id)
+            return entry.runner
+
+    def put(self, session_id: str, runner: InterviewRunner, reply: Optional[Reply] = None) -> None:
+        state = runner.get_state()
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or entry.runner is not runner:
+                if entry is not None:
+                    self._remove(session_id)
+                entry = _Entry(runner=runner, size_bytes=0, last_access=now)
+                self._entries[session_id] = entry
+
+            _measure_new_log_items(entry, state)
+            size_bytes = estimate_static_bytes(state) + entry.log_bytes
+            self._bytes += size_bytes - entry.size_bytes
+            entry.size_bytes = size_bytes
+            entry.last_access = now
+            self._entries.move_to_end(session_id)
+
+            if entry.completed_at is None and runner.is_complete():
+                entry.completed_at = now
+                self._completed[session_id] = now
+
+            if reply is not None:
+                key, value = reply
+                entry.replies[key] = value
+                while len(entry.replies) > MAX_REPLIES_PER_SESSION:
+                    entry.replies.popitem(last=False)
+
+            self._sweep(now)
+            self._enforce_caps()
+
+    def get_reply(self, session_id: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            return entry.replies.get(key) if entry is not None else None
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            if session_id in self._entries:
+                self._remove(session_id)
+
+    def clear(self) -> None:
+        """Drop all sessions and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._completed.clear()
+            self._bytes = 0
+            self.hits = self.misses = 0
+            self.evictions = dict.fromkeys(self.evictions, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "sessions": len(self._entries),
+                "completed_sessions": len(self._completed),
+                "bytes": self._bytes,
+                "max_sessions": self.max_sessions,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": sum(self.evictions.values()),
+                "evictions_by_reason": dict(self.evictions),
+            }
+
+    def _remove(self, session_id: str) -> None:
+        entry = self._entries.pop(session_id)
+        self._completed.pop(session_id, None)
+        self._bytes -= entry.size_bytes
+
+    def _evict(self, session_id: str, reason: str) -> None:
+        self._remove(session_id)
+        self.evictions[reason] += 1
+
+    def _sweep(self, now: float) -> None:
+        """Expire idle and completed sessions. Both orders are oldest first."""
+        while self._entries:
+            session_id, entry = next(iter(self._entries.items()))
+            if now - entry.last_access <= self.idle_ttl_seconds:
+                break
+            self._evict(session_id, "idle")
+
+        while self._completed:
+            session_id, completed_at = next(iter(self._completed.items()))
+            if now - completed_at <= self.completed_ttl_seconds:
+                break
+            self._evict(session_id, "completed")
+
+    def _enforce_caps(self) -> None:
+        """Evict least recently used sessions, never the one just stored."""
+        while len(self._entries) > self.max_sessions:
+            self._evict(next(iter(self._entries)), "capacity")
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            self._evict(next(iter(self._entries)), "bytes")
+
+
+def estimate_static_bytes(state: InterviewState) -> int:
+    """Approximate size of the parts of a state outside the per-turn logs."""
+    total = 0
+    for key, value in state.items():
+        if key not in LOG_KEYS:
+            total += _approx_size(value)
+    return total
+
+
+def estimate_log_bytes(state: InterviewState) -> int:
+    """Approximate size of the transcript and other per-turn logs."""
+    return sum(_log_item_bytes(item) for key in LOG_KEYS for item in state.get(key) or ())
+
+
+def _measure_new_log_items(entry: _Entry, state: InterviewState) -> None:
+    """Add the log items appended since the entry's last put to its log size."""
+    for key in LOG_KEYS:
+        log = state.get(key) or ()
+        seen = entry.log_lengths.get(key, 0)
+        if len(log) < seen:
+            # The log was replaced by a shorter one: measure it all again
+            entry.log_bytes = estimate_log_bytes(state)
+            entry.log_lengths = {key: len(state.get(key) or ()) for key in LOG_KEYS}
+            return
+        for index in range(seen, len(log)):
+            entry.log_bytes += _log_item_bytes(log[index])
+        entry.log_lengths[key] = len(log)
+
+
+def _log_item_bytes(item: Any) -> int:
+    if isinstance(item, dict):
+        content = item.get("content")
+        return _LOG_ITEM_OVERHEAD + (len(content) if isinstance(content, str) else 0)
+    return _LOG_ITEM_OVERHEAD + (len(item) if isinstance(item, str) else 0)
+
+
+def _approx_size(value: Any) -> int:
+    """Approximate in-memory footprint of plain JSON-like data."""
+    if isinstance(value, str):
+        return 50 + len(value)
+    if isinstance(value, dict):
+        return 64 + sum(_approx_size(k) + _approx_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 56 + sum(_approx_size(v) for v in value)
+    return 32
+
+
+# =============================================================================
+# SQLITE STORE
+# =============================================================================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS specs (
+    content_hash TEXT PRIMARY KEY,
+    body BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    spec_hash TEXT,
+    checkpoint BLOB NOT NULL,
+    completed INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_updated_at ON sessions (updated_at);
+CREATE TABLE IF NOT EXISTS replies (
+    session_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    reply TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (session_id, key)
+);
+CREATE TABLE IF NOT EXISTS leases (
+    session_id TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+# Fast compression: checkpoints are written on the critical path of a turn
+_COMPRESSION_LEVEL = 1
+
+# Expired rows are deleted at most this often
+_SWEEP_INTERVAL_SECONDS = 60.0
+
+# Decoded specs shared by rehydrated sessions
+_MAX_CACHED_SPECS = 256
+
+# Lease polling backoff while another worker holds a session
+_LEASE_POLL_INITIAL_SECONDS = 0.01
+_LEASE_POLL_MAX_SECONDS = 0.2
+
+# A lease abandoned without release() stops being renewed after this many TTLs
+_MAX_LEASE_RENEWALS = 10
+
+
+def _encode(value: Any) -> bytes:
+    return zlib.compress(
+        json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8"),
+        _COMPRESSION_LEVEL,
+    )
+
+
+def _decode(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob))
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Durable store that checkpoints a session to SQLite on every put().
+
+    Runners are rehydrated lazily on the first get() that needs them and
+    then served from an in-memory LRU. Each checkpoint bumps a version, so
+    a worker whose cached runner is behind the database reloads it.
+
+    The spec is stored once per content hash rather than in every
+    checkpoint; the rest of the state is JSON compressed with zlib. The
+    database runs in WAL mode with synchronous=NORMAL, which keeps a
+    checkpoint to a single small write.
+
+    Several worker processes can share one database. A turn holds the
+    session's lease (a row in `leases` with an expiry that is renewed while
+    the turn runs), so only one worker advances a session at a time, and
+    put() refuses to overwrite a newer checkpoint than the one the runner
+    was loaded from.
+
+    Calls wait on the database (busy_timeout, WAL checkpoints, contended
+    leases), so async callers use the a-prefixed methods, which run them
+    in a worker thread.
+    """
+
+    blocking_io = True
+
+    def __init__(
+        self,
+        path: str = DEFAULT_DB_PATH,
+        idle_ttl_seconds: float = DEFAULT_IDLE_TTL_SECONDS,
+        completed_ttl_seconds: float = DEFAULT_COMPLETED_TTL_SECONDS,
+        cache: Optional[InMemorySessionStore] = None,
+        lease_ttl_seconds: float = DEFAULT_LEASE_TTL_SECONDS,
+        lease_wait_seconds: float = DEFAULT_LEASE_WAIT_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__()
+        self.path = path
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.lease_wait_seconds = lease_wait_seconds
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.completed_ttl_seconds = completed_ttl_seconds
+        self._clock = clock
+        self._cache = cache or InMemorySessionStore(
+            idle_ttl_seconds=idle_ttl_seconds,
+            completed_ttl_seconds=completed_ttl_seconds,
+        )
+        # Checkpoint version each cached runner was loaded or saved at
+        self._versions: "weakref.WeakKeyDictionary[InterviewRunner, int]" = weakref.WeakKeyDictionary()
+        self._specs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+        self._last_sweep = 0.0
+
+        self.hits = 0
+        self.misses = 0
+        self.rehydrations = 0
+        self.checkpoints = 0
+        self.checkpoint_seconds = 0.0
+        self.expirations = 0
+        self.conflicts = 0
+        self.lease_waits = 0
+        self.lease_timeouts = 0
+
+    def get(self, session_id: str) -> Optional[InterviewRunner]:
+        self._maybe_sweep()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            self._cache.delete(session_id)
+            self.misses += 1
+            return None
+
+        runner = self._cache.get(session_id)
+        if runner is not None and self._versions.get(runner) == row[0]:
+            self.hits += 1
+            return runner
+
+        runner = self._load(session_id)
+        if runner is None:
+            self.misses += 1
+            return None
+        self.rehydrations += 1
+        return runner
+
+    def put(self, session_id: str, runner: InterviewRunner, reply: Optional[Reply] = None) -> None:
+        started = time.perf_counter()
+        checkpoint = runner.checkpoint()
+        spec_hash = get_compiled_spec(checkpoint["state"]).content_hash if runner.has_spec() else None
+        state = dict(checkpoint["state"])
+        spec = state.pop("interview_spec", None)
+        blob = _encode({**checkpoint, "state": state})
+        version = self._versions.get(runner, 0) + 1
+
+        with self._lock, self._transaction():
+            if spec_hash and self._conn.execute(
+                "SELECT 1 FROM specs WHERE content_hash = ?", (spec_hash,)
+            ).fetchone() is None:
+                self._conn.execute(
+                    "INSERT INTO specs (content_hash, body) VALUES (?, ?)", (spec_hash, _encode(spec))
+                )
+            row = (spec_hash, blob, int(runner.is_complete()), self._clock())
+            updated = self._conn.execute(
+                "UPDATE sessions SET version = ?, spec_hash = ?, checkpoint = ?, completed = ?, updated_at = ? "
+                "WHERE session_id = ? AND version = ?",
+                (version, *row, session_id, version - 1),
+            ).rowcount
+            if not updated:
+                stored = self._conn.execute(
+                    "SELECT version FROM sessions WHERE session_id = ?", (session_id,)
+                ).fetchone()
+                if stored is not None:
+                    self.conflicts += 1
+                    self._cache.delete(session_id)
+                    raise SessionConflictError(
+                        f"Session {session_id} is at version {stored[0]}, "
+                        f"this copy was loaded at {version - 1}"
+                    )
+                # New session, or expired while in use: store it afresh
+                self._conn.execute(
+                    "INSERT INTO sessions (session_id, version, spec_hash, checkpoint, completed, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (session_id, version, *row),
+                )
+            if reply is not None:
+                key, value = reply
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO replies (session_id, key, reply, created_at) VALUES (?, ?, ?, ?)",
+                    (session_id, key, json.dumps(value), self._clock()),
+                )
+                self._conn.execute(
+                    "DELETE FROM replies WHERE session_id = ? AND key NOT IN "
+                    "(SELECT key FROM replies WHERE session_id = ? ORDER BY created_at DESC LIMIT ?)",
+                    (session_id, session_id, MAX_REPLIES_PER_SESSION),
+                )
+            self.checkpoints += 1
+            self.checkpoint_seconds += time.perf_counter() - started
+
+        self._versions[runner] = version
+        self._cache.put(session_id, runner)
+        self._maybe_sweep()
+
+    def get_reply(self, session_id: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT reply FROM replies WHERE session_id = ? AND key = ?", (session_id, key)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, session_id: str) -> None:
+        with self._lock, self._transaction():
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self._conn.execute("DELETE FROM replies WHERE session_id = ?", (session_id,))
+        self._cache.delete(session_id)
+
+    async def acquire_lease(self, session_id: str) -> SessionLease:
+        # Requests in this worker queue on the local lock, not the database
+        local = await super().acquire_lease(session_id)
+        owner = f"{os.getpid()}:{uuid.uuid4().hex}"
+        deadline = time.monotonic() + self.lease_wait_seconds
+        delay = _LEASE_POLL_INITIAL_SECONDS
+        try:
+            while not await asyncio.to_thread(self._try_lease, session_id, owner):
+                if time.monotonic() >= deadline:
+                    self.lease_timeouts += 1
+                    raise SessionBusyError(f"Session {session_id} is busy in another worker")
+                self.lease_waits += 1
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _LEASE_POLL_MAX_SECONDS)
+        except BaseException:
+            local.release()
+            raise
+
+        renewal = asyncio.ensure_future(self._renew_lease(session_id, owner))
+
+        def release() -> None:
+            renewal.cancel()
+            try:
+                self._drop_lease(session_id, owner)
+            finally:
+                local.release()
+
+        async def arelease() -> None:
+            renewal.cancel()
+            try:
+                await asyncio.to_thread(self._drop_lease, session_id, owner)
+            finally:
+                # The local lock belongs to the event loop, so it is released here
+                local.release()
+
+        return SessionLease(release, arelease)
+
+    def _try_lease(self, session_id: str, owner: str) -> bool:
+        """Take the lease if it is free or expired."""
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO leases (session_id, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (session_id) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE leases.expires_at < ?",
+                (session_id, owner, now + self.lease_ttl_seconds, now),
+            )
+            row = self._conn.execute(
+                "SELECT owner FROM leases WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row is not None and row[0] == owner
+
+    async def _renew_lease(self, session_id: str, owner: str) -> None:
+        """Keep extending a held lease so long turns don't lose it."""
+        for _ in range(_MAX_LEASE_RENEWALS):
+            await asyncio.sleep(self.lease_ttl_seconds / 3)
+            await asyncio.to_thread(self._extend_lease, session_id, owner)
+
+    def _extend_lease(self, session_id: str, owner: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE leases SET expires_at = ? WHERE session_id = ? AND owner = ?",
+                (self._clock() + self.lease_ttl_seconds, session_id, owner),
+            )
+
+    def _drop_lease(self, session_id: str, owner: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM leases WHERE session_id = ? AND owner = ?", (session_id, owner)
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sessions, completed, stored_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(completed), 0), COALESCE(SUM(LENGTH(checkpoint)), 0) FROM sessions"
+            ).fetchone()
+        lookups = self.hits + self.rehydrations + self.misses
+        return {
+            "sessions": sessions,
+            "completed_sessions": completed,
+            "stored_bytes": stored_bytes,
+            "hits": self.hits,
+            "rehydrations": self.rehydrations,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.rehydrations) / lookups if lookups else 0.0,
+            "expirations": self.expirations,
+            "checkpoints": self.checkpoints,
+            "conflicts": self.conflicts,
+            "lease_waits": self.lease_waits,
+            "lease_timeouts": self.lease_timeouts,
+            "avg_checkpoint_ms": 1000 * self.checkpoint_seconds / self.checkpoints if self.checkpoints else 0.0,
+            "cache": self._cache.stats(),
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _load(self, session_id: str) -> Optional[InterviewRunner]:
+        """Rehydrate a runner from its latest checkpoint."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, spec_hash, checkpoint FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            version, spec_hash, blob = row
+            spec = self._get_spec(spec_hash) if spec_hash else None
+
+        checkpoint = _decode(blob)
+        if spec is not None:
+            checkpoint["state"]["interview_spec"] = spec
+        runner = InterviewRunner.restore(checkpoint)
+        self._versions[runner] = version
+        self._cache.put(session_id, runner)
+        return runner
+
+    def _get_spec(self, spec_hash: str) -> Dict[str, Any]:
+        """Decoded spec for a content hash, shared across sessions (lock held)."""
+        spec = self._specs.get(spec_hash)
+        if spec is None:
+            (body,) = self._conn.execute(
+                "SELECT body FROM specs WHERE content_hash = ?", (spec_hash,)
+            ).fetchone()
+            spec = self._specs[spec_hash] = _decode(body)
+            while len(self._specs) > _MAX_CACHED_SPECS:
+                self._specs.popitem(last=False)
+        self._specs.move_to_end(spec_hash)
+        return spec
+
+    def _maybe_sweep(self) -> None:
+        """Delete expired sessions, at most once per sweep interval."""
+        now = self._clock()
+        if now - self._last_sweep < _SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_sweep = now
+        with self._lock, self._transaction():
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE updated_at < ? OR (completed = 1 AND updated_at < ?)",
+                (now - self.idle_ttl_seconds, now - self.completed_ttl_seconds),
+            )
+            self.expirations += cursor.rowcount
+            self._conn.execute("DELETE FROM leases WHERE expires_at < ?", (now,))
+            self._conn.execute(
+                "DELETE FROM replies WHERE session_id NOT IN (SELECT session_id FROM sessions)"
+            )
+            self._conn.execute(
+                "DELETE FROM specs WHERE content_hash NOT IN "
+                "(SELECT spec_hash FROM sessions WHERE spec_hash IS NOT NULL)"
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the enclosed statements atomically (lock held by the caller)."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+
+def create_session_store() -> SessionStore:
+    """Build the store configured by the environment (SESSION_STORE)."""
+    kind = os.getenv("SESSION_STORE", "memory")
+    if kind == "memory":
+        return InMemorySessionStore()
+    if kind == "sqlite":
+        return SQLiteSessionStore()
+    raise ValueError(f"Unknown SESSION_STORE: {kind}. Expected 'memory' or 'sqlite'")
@@ -0,0 +1,11 @@
+"""
+Offline benchmarks for the interview runner.
+
+Benchmarks swap the agents' LLM clients for deterministic stand-ins, so
+they measure the system's own overhead with no network access or API spend.
+
+Run a benchmark as a module from the repository root, e.g.:
+    python -m benchmarks.state_overhead
+    python -m benchmarks.turn_latency
+    python -m benchmarks.load_test
+"""
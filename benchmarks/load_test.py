@@ -0,0 +1,294 @@
+"""
+Concurrent load test for the candidate API.
+
+Simulates N candidates, each starting an interview (POST /api/interviews)
+and answering turn after turn (POST /api/interviews/{id}/respond) with a
+think time between answers, until the interview ends or the turn limit
+is reached. Candidates are started evenly over a ramp-up period.
+
+Targets:
+    in-process (default)   api.main:app served through httpx's ASGI transport,
+                           with its LLM clients replaced by either
+                           --llm stand-in   instant or fixed-delay stand-ins (default)
+                           --llm stub       ChatAnthropic against benchmarks.stub_llm,
+                                            served on a background thread
+    --url URL              a running server, with whatever LLM it is configured for
+
+Reports requests per second, p50/p95/p99 latency and error rate per
+endpoint, and memory per session: the session store's own estimate (from
+GET /api/sessions/stats) and, in-process, the growth in resident memory.
+
+Usage:
+    python -m benchmarks.load_test [--candidates 50] [--turns 10] [--think-ms 2000]
+        [--ramp-seconds 5] [--llm stand-in|stub] [--llm-latency-ms 800]
+        [--url http://127.0.0.1:8000] [--case-id coffee_profitability]
+        [--seed 0] [--json load_test.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import sys
+import time
+from collections import Counter
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx  # noqa: E402
+
+from benchmarks.turn_latency import TRANSCRIPTS  # noqa: E402
+
+# Spread of think times around the median (lognormal sigma)
+THINK_SIGMA = 0.5
+
+# Per-request client timeout; long enough for a turn that exhausts its budget
+REQUEST_TIMEOUT_SECONDS = 60.0
+
+
+@dataclass
+class LoadConfig:
+    """Shape of the simulated traffic."""
+    candidates: int = 50
+    turns: int = 10                 # Answers per candidate, at most
+    think_ms: float = 2000.0        # Median pause before each answer
+    ramp_seconds: float = 5.0       # Candidates start evenly over this period
+    case_id: str = "coffee_profitability"
+    seed: int = 0
+
+
+@dataclass
+class EndpointStats:
+    """Latencies and outcomes for one endpoint."""
+    latencies: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+
+    def record(self, seconds: float, status: str) -> None:
+        self.latencies.append(seconds)
+        self.statuses[status] += 1
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        requests = sum(self.statuses.values())
+        errors = requests - self.statuses.get("200", 0)
+        ordered = sorted(self.latencies)
+        return {
+            "requests": requests,
+            "requests_per_second": round(requests / elapsed, 2) if elapsed else 0.0,
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "statuses": dict(sorted(self.statuses.items())),
+            "latency_ms": {name: _percentile_ms(ordered, q) for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))},
+        }
+
+
+def _percentile_ms(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000, 1)
+
+
+# =============================================================================
+# CANDIDATES
+# =============================================================================
+
+async def _timed_post(
+    client: httpx.AsyncClient,
+    stats: EndpointStats,
+    path: str,
+    body: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """POST and record the outcome. Returns the JSON body of a 200, else None."""
+    started = time.perf_counter()
+    try:
+        response = await client.post(path, json=body)
+    except httpx.HTTPError as error:
+        stats.record(time.perf_counter() - started, type(error).__name__)
+        return None
+    stats.record(time.perf_counter() - started, str(response.status_code))
+    return response.json() if response.status_code == 200 else None
+
+
+async def run_candidate(
+    client: httpx.AsyncClient,
+    config: LoadConfig,
+    index: int,
+    stats: Dict[str, EndpointStats],
+) -> int:
+    """One candidate's interview. Returns the number of answered turns."""
+    rng = random.Random(config.seed * 100_003 + index)
+    await asyncio.sleep(config.ramp_seconds * index / max(config.candidates, 1))
+
+    started = await _timed_post(client, stats["start"], "/api/interviews", {"case_id": config.case_id})
+    if started is None:
+        return 0
+
+    lines = TRANSCRIPTS["case"]
+    answered = 0
+    for turn in range(config.turns):
+        if config.think_ms > 0:
+            await asyncio.sleep(config.think_ms * rng.lognormvariate(0.0, THINK_SIGMA) / 1000)
+        reply = await _timed_post(
+            client,
+            stats["respond"],
+            f"/api/interviews/{started['session_id']}/respond",
+            {"message": f"{lines[turn % len(lines)]} (turn {turn + 1})"},
+        )
+        if reply is None:
+            break
+        answered += 1
+        if reply["is_complete"]:
+            break
+    return answered
+
+
+async def run_load(client: httpx.AsyncClient, config: LoadConfig, in_process: bool = True) -> Dict[str, Any]:
+    """
+    Drive every candidate through `client` and return the report.
+
+    Resident memory growth is only reported when the app runs `in_process`.
+    """
+    # One unmeasured interview first, so lazy imports and client setup don't count as per-session memory
+    warm_up = LoadConfig(candidates=1, turns=1, think_ms=0, ramp_seconds=0, case_id=config.case_id)
+    await run_candidate(client, warm_up, 0, {"start": EndpointStats(), "respond": EndpointStats()})
+
+    stats = {"start": EndpointStats(), "respond": EndpointStats()}
+    rss_before = _rss_bytes()
+    started = time.perf_counter()
+
+    turns = await asyncio.gather(*(run_candidate(client, config, index, stats) for index in range(config.candidates)))
+
+    elapsed = time.perf_counter() - started
+    session_stats = (await client.get("/api/sessions/stats")).json()
+    sessions = session_stats.get("sessions", 0)
+    store_bytes = session_stats.get("bytes")
+    rss_growth = _rss_bytes() - rss_before if in_process else None
+
+    return {
+        "elapsed_seconds": round(elapsed, 2),
+        "candidates": config.candidates,
+        "turns_answered": sum(turns),
+        "turns_per_second": round(sum(turns) / elapsed, 2) if elapsed else 0.0,
+        "endpoints": {name: endpoint.report(elapsed) for name, endpoint in stats.items()},
+        "memory": {
+            "sessions_held": sessions,
+            "store_bytes_per_session": round(store_bytes / sessions) if sessions and store_bytes is not None else None,
+            "rss_growth_bytes": rss_growth,
+            "rss_growth_bytes_per_candidate": (
+                round(rss_growth / config.candidates) if rss_growth is not None and config.candidates else None
+            ),
+        },
+        "session_store": session_stats,
+    }
+
+
+def _rss_bytes() -> int:
+    """Resident memory of this process (peak, where the current value isn't available)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # ru_maxrss is in kilobytes on Linux, bytes on macOS
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+# =============================================================================
+# TARGETS
+# =============================================================================
+
+def run(
+    config: LoadConfig,
+    url: Optional[str] = None,
+    llm: str = "stand-in",
+    llm_latency_ms: float = 800.0,
+) -> Dict[str, Any]:
+    """
+    Run the load test and return the report.
+
+    With `url`, requests go to that server. Otherwise api.main:app runs in
+    this process, with `llm` ("stand-in" or "stub") answering its LLM calls
+    after a median of `llm_latency_ms`.
+    """
+    if url is not None:
+        async def remote() -> Dict[str, Any]:
+            async with httpx.AsyncClient(base_url=url, timeout=REQUEST_TIMEOUT_SECONDS) as client:
+                return await run_load(client, config, in_process=False)
+        return {"target": url, "config": vars(config), **asyncio.run(remote())}
+
+    with ExitStack() as stack:
+        if llm == "stub":
+            from benchmarks.stub_llm import StubConfig, serve_stub
+
+            from llm.registry import registry
+
+            stub_url = stack.enter_context(serve_stub(StubConfig(latency_ms=llm_latency_ms, seed=config.seed)))
+            stack.enter_context(mock.patch.dict(os.environ, {
+                "ANTHROPIC_BASE_URL": stub_url,
+                "ANTHROPIC_API_KEY": os.environ.get("ANTHROPIC_API_KEY", "stub"),
+            }))
+            # Clients read the environment when first built: drop any built
+            # before the run, and the stub-bound ones after it
+            registry.reset()
+            stack.callback(registry.reset)
+        elif llm == "stand-in":
+            from benchmarks.stand_in import stand_in_llms
+
+            stack.enter_context(stand_in_llms(delay=llm_latency_ms / 1000))
+        else:
+            raise ValueError(f"Unknown LLM: {llm}. Expected 'stand-in' or 'stub'")
+
+        from api.main import app
+
+        async def in_process() -> Dict[str, Any]:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://api", timeout=REQUEST_TIMEOUT_SECONDS) as client:
+                return await run_load(client, config)
+        return {"target": f"in-process ({llm})", "config": vars(config), **asyncio.run(in_process())}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--think-ms", type=float, default=2000.0, help="median think time before each answer")
+    parser.add_argument("--ramp-seconds", type=float, default=5.0)
+    parser.add_argument("--case-id", default="coffee_profitability")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="load a running server instead of an in-process app")
+    parser.add_argument("--llm", choices=("stand-in", "stub"), default="stand-in", help="in-process LLM")
+    parser.add_argument("--llm-latency-ms", type=float, default=800.0, help="in-process LLM median latency")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    config = LoadConfig(
+        candidates=args.candidates,
+        turns=args.turns,
+        think_ms=args.think_ms,
+        ramp_seconds=args.ramp_seconds,
+        case_id=args.case_id,
+        seed=args.seed,
+    )
+    results = run(config, url=args.url, llm=args.llm, llm_latency_ms=args.llm_latency_ms)
+
+    print(f"{results['target']}: {results['candidates']} candidates, {results['turns_answered']} turns "
+          f"in {results['elapsed_seconds']}s ({results['turns_per_second']} turns/s)")
+    for name, endpoint in results["endpoints"].items():
+        latency = endpoint["latency_ms"]
+        print(f"  {name:<8} {endpoint['requests']:>6} req  {endpoint['requests_per_second']:>7} req/s"
+              f"  p50 {latency['p50']:>8} ms  p95 {latency['p95']:>8} ms  p99 {latency['p99']:>8} ms"
+              f"  errors {endpoint['error_rate']:.2%}")
+    memory = results["memory"]
+    rss = f", RSS +{memory['rss_growth_bytes'] / 1e6:.1f} MB" if memory["rss_growth_bytes"] is not None else ""
+    print(f"  memory   {memory['sessions_held']} sessions held, ~{memory['store_bytes_per_session']} B/session in the store{rss}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Deterministic stand-in LLMs for benchmarks and the offline test suite.
+
+StandInChatModel answers instantly (or after a fixed delay) with replies in
+the format each agent expects, so benchmarks exercise the real prompt
+building, parsing and state handling without calling the API. The tests
+serve the same model (as FakeChatModel) with scripted responders.
+"""
+import asyncio
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+
+# Benchmark stand-ins report roughly a real turn's usage, stream in larger
+# chunks, and don't hold on to the prompts (they'd count as session memory)
+BENCHMARK_SETTINGS = {
+    "usage": {"input_tokens": 1000, "output_tokens": 100},
+    "chunk_chars": 16,
+    "record_calls": False,
+}
+
+
+class StandInChatModel:
+    """
+    Minimal ChatAnthropic stand-in with invoke, ainvoke and astream.
+
+    Replies are produced by `responder(messages) -> str`. With
+    `record_calls`, every call is recorded so tests can assert how many paid
+    calls a flow would make.
+    """
+
+    def __init__(
+        self,
+        responder: Callable[[List[Any]], str],
+        delay: float = 0.0,
+        usage: Optional[Dict[str, int]] = None,
+        chunk_chars: int = 3,
+        record_calls: bool = True,
+    ):
+        self.responder = responder
+        self.delay = delay
+        self.usage = usage or {"input_tokens": 100, "output_tokens": 20}
+        self.chunk_chars = chunk_chars
+        self.record_calls = record_calls
+        self.calls: List[List[Any]] = []
+
+    def _reply(self, messages: List[Any]) -> AIMessage:
+        if self.record_calls:
+            self.calls.append(messages)
+        return AIMessage(
+            content=self.responder(messages),
+            response_metadata={"usage": dict(self.usage)},
+        )
+
+    def invoke(self, messages: List[Any], **kwargs) -> AIMessage:
+        if self.delay:
+            time.sleep(self.delay)
+        return self._reply(messages)
+
+    async def ainvoke(self, messages: List[Any], **kwargs) -> AIMessage:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self._reply(messages)
+
+    async def astream(self, messages: List[Any], **kwargs):
+        """Stream the reply a few characters at a time, usage on the last chunk."""
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        content = self._reply(messages).content
+        for i in range(0, len(content), self.chunk_chars):
+            yield AIMessageChunk(content=content[i:i + self.chunk_chars])
+        yield AIMessageChunk(
+            content="",
+            usage_metadata={
+                "input_tokens": self.usage["input_tokens"],
+                "output_tokens": self.usage["output_tokens"],
+                "total_tokens": self.usage["input_tokens"] + self.usage["output_tokens"],
+            },
+        )
+
+
+def evaluator_responder(competency_ids: Sequence[str] = ()) -> Callable[[List[Any]], str]:
+    """
+    Evaluator replies that cycle levels 2-4 each turn.
+
+    With competency ids the reply is in the spec-driven format, otherwise
+    in the legacy single-score format.
+    """
+    turn = {"count": 0}
+
+    def respond(messages: List[Any]) -> str:
+        turn["count"] += 1
+        level = 2 + turn["count"] % 3
+        reply: Dict[str, Any] = {
+            "action": "LIGHT_HELP",
+            "interviewer_guidance": "Ask them to go one level deeper.",
+            "data_to_share": None,
+        }
+        if competency_ids:
+            reply["competency_scores"] = {
+                comp_id: {
+                    "level": level,
+                    "evidence": f"Turn {turn['count']} evidence",
+                    "flags": [f"GREEN: signal {turn['count'] % 7}"],
+                }
+                for comp_id in competency_ids
+            }
+            reply["overall_assessment"] = "Steady."
+        else:
+            reply.update({
+                "current_level": level,
+                "level_name": "GOOD_NOT_ENOUGH",
+                "level_justification": "Stand-in assessment.",
+                "level_trend": "STABLE",
+                "red_flags": [],
+                "green_flags": [f"signal {turn['count'] % 7}"],
+            })
+        return json.dumps(reply)
+
+    return respond
+
+
+def interviewer_responder(messages: List[Any]) -> str:
+    """Interviewer replies in the expected JSON envelope."""
+    return json.dumps({"spoken": "Interesting. Walk me through the next step of your reasoning."})
+
+
+@contextmanager
+def stand_in_llms(
+    competency_ids: Sequence[str] = (),
+    delay: float = 0.0,
+) -> Iterator[Dict[str, StandInChatModel]]:
+    """Temporarily replace the evaluator and interviewer LLMs with stand-ins."""
+    from llm.registry import registry
+
+    models = {
+        "evaluator": StandInChatModel(evaluator_responder(competency_ids), delay=delay, **BENCHMARK_SETTINGS),
+        "interviewer": StandInChatModel(interviewer_responder, delay=delay, **BENCHMARK_SETTINGS),
+    }
+    with registry.override(**models):
+        yield models
+
+
+def long_session_spec(max_exchanges: int) -> Dict[str, Any]:
+    """A technical interview spec whose limits allow `max_exchanges` turns."""
+    from specs import create_technical_interview_spec
+
+    spec = create_technical_interview_spec({
+        "problem_statement": "Design a rate limiter for a public API.",
+        "expected_complexity": "O(1) per request",
+    }).model_dump()
+    return stretch_constraints(spec, max_exchanges)
+
+
+def stretch_constraints(spec: Dict[str, Any], max_exchanges: int) -> Dict[str, Any]:
+    """Relax a spec dict's limits so the manager allows `max_exchanges` turns."""
+    spec["constraints"]["max_exchanges"] = max_exchanges + 1
+    spec["constraints"]["max_duration_minutes"] = 24 * 60
+    return spec
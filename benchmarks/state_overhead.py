@@ -0,0 +1,81 @@
+"""
+Per-turn state overhead over a long session.
+
+Runs one long interview against instant stand-in LLMs and reports the
+runner's own cost per turn (prompt assembly, parsing, state updates) in
+buckets across the session. With append-only logs and in-place deltas the
+per-turn cost should stay flat rather than growing with the transcript.
+
+Usage:
+    python -m benchmarks.state_overhead [--turns 200] [--bucket 20] [--json out.json]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.stand_in import long_session_spec, stand_in_llms  # noqa: E402
+
+
+def run(turns: int = 200, bucket: int = 20) -> Dict[str, Any]:
+    """Run a `turns`-long session and return per-bucket turn timings (ms)."""
+    from graph import InterviewRunner, initialize_from_spec
+    from specs import compile_spec
+
+    spec = long_session_spec(turns)
+    competency_ids = compile_spec(spec).competency_ids
+
+    with stand_in_llms(competency_ids):
+        runner = InterviewRunner(initialize_from_spec(spec, session_id="state-overhead"))
+        runner.start()
+
+        timings: List[float] = []
+        for turn in range(turns):
+            started = time.perf_counter()
+            runner.respond(f"Answer {turn}: I'd use a token bucket per API key.")
+            timings.append((time.perf_counter() - started) * 1000)
+
+    buckets = [
+        {
+            "turns": f"{start + 1}-{start + len(chunk)}",
+            "mean_ms": round(statistics.fmean(chunk), 4),
+            "median_ms": round(statistics.median(chunk), 4),
+        }
+        for start in range(0, len(timings), bucket)
+        for chunk in [timings[start:start + bucket]]
+    ]
+    first, last = buckets[0]["median_ms"], buckets[-1]["median_ms"]
+
+    return {
+        "benchmark": "state_overhead",
+        "turns": turns,
+        "messages": len(runner.get_messages()),
+        "buckets": buckets,
+        "last_to_first_ratio": round(last / first, 3) if first else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--bucket", type=int, default=20)
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    results = run(args.turns, args.bucket)
+
+    for row in results["buckets"]:
+        print(f"turns {row['turns']:>9}: mean {row['mean_ms']:.3f} ms, median {row['median_ms']:.3f} ms")
+    print(f"last/first median ratio: {results['last_to_first_ratio']}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""
+Local stub of the Anthropic Messages API for load tests.
+
+Serves POST /v1/messages (plain and streamed) with replies in the format
+each agent expects: evaluator JSON matching the prompt's OUTPUT FORMAT
+section (spec-driven competency scores or the legacy single score) and
+interviewer {"spoken": ...} envelopes. Latency, token counts, error rate
+and rate limiting are configurable, so the API's own throughput and tail
+latency can be measured without network access or API spend.
+
+Point the app's ChatAnthropic clients at it with:
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8089 ANTHROPIC_API_KEY=stub uvicorn api.main:app
+
+Usage:
+    python -m benchmarks.stub_llm [--port 8089] [--latency-ms 800] [--latency-sigma 0.4]
+        [--ttft-ms 250] [--error-rate 0.01] [--rpm 0] [--seed 0]
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import JSONResponse, StreamingResponse  # noqa: E402
+
+# Characters per streamed text delta
+STREAM_CHUNK_CHARS = 12
+
+_COMPETENCY_HEADING = re.compile(r"^### (.+?) \[", re.MULTILINE)
+_SCORE_EXAMPLE = re.compile(r'"(\w+)": \{"level": \d')
+_ACTION_OPTIONS = re.compile(r'"action": "<([A-Z_|]+)>"')
+
+_SPOKEN_REPLIES = (
+    "Interesting. Walk me through how you'd approach the next step.",
+    "Okay. What would you look at first, and why?",
+    "That makes sense. What trade-offs did you consider there?",
+    "Got it. How would you check that assumption?",
+    "Take me one level deeper on that.",
+)
+
+
+@dataclass
+class StubConfig:
+    """How the stub behaves. Latencies are medians of a lognormal distribution."""
+    latency_ms: float = 800.0       # Whole reply (non-streamed), median
+    latency_sigma: float = 0.4      # Lognormal spread; 0 for a fixed latency
+    ttft_ms: float = 250.0          # Time to first streamed token, median
+    output_tokens: Optional[int] = None  # Fixed output token count (default: ~chars/4)
+    error_rate: float = 0.0         # Share of requests answered with 529 overloaded
+    rpm: int = 0                    # Requests per minute before 429s (0 = unlimited)
+    seed: int = 0
+
+
+class StubLLM:
+    """Reply generation, latency sampling and rate limiting for the stub app."""
+
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self._random = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._recent: Deque[float] = deque()
+        self._cached_prefixes: set = set()
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+
+    # -------------------------------------------------------------------------
+    # Admission
+    # -------------------------------------------------------------------------
+
+    def admit(self) -> Optional[Tuple[int, str, str]]:
+        """Returns (status, error type, message) to reject a request, or None."""
+        with self._lock:
+            self.requests += 1
+            now = time.monotonic()
+            if self.config.rpm:
+                while self._recent and now - self._recent[0] >= 60.0:
+                    self._recent.popleft()
+                if len(self._recent) >= self.config.rpm:
+                    self.rate_limited += 1
+                    return 429, "rate_limit_error", "Number of requests has exceeded your rate limit"
+                self._recent.append(now)
+            if self.config.error_rate and self._random.random() < self.config.error_rate:
+                self.errors += 1
+                return 529, "overloaded_error", "Overloaded"
+        return None
+
+    def retry_after(self) -> int:
+        with self._lock:
+            if not self._recent:
+                return 1
+            return max(1, math.ceil(60.0 - (time.monotonic() - self._recent[0])))
+
+    def sample_seconds(self, median_ms: float) -> float:
+        """A latency sample from a lognormal distribution with the given median."""
+        if median_ms <= 0:
+            return 0.0
+        with self._lock:
+            factor = self._random.lognormvariate(0.0, self.config.latency_sigma) if self.config.latency_sigma else 1.0
+        return median_ms * factor / 1000.0
+
+    # -------------------------------------------------------------------------
+    # Replies
+    # -------------------------------------------------------------------------
+
+    def reply(self, body: Dict[str, Any]) -> Tuple[str, Dict[str, int]]:
+        """Reply text and usage block for a Messages API request body."""
+        system = _text(body.get("system", ""))
+        conversation = "".join(_text(message.get("content", "")) for message in body.get("messages", []))
+        seed = int(hashlib.sha256((system + conversation).encode("utf-8")).hexdigest()[:8], 16)
+
+        if '"competency_scores"' in system:
+            text = _spec_evaluation(system, seed)
+        elif '"current_level"' in system:
+            text = _legacy_evaluation(system, seed)
+        else:
+            text = json.dumps({"spoken": _SPOKEN_REPLIES[seed % len(_SPOKEN_REPLIES)]})
+
+        return text, self._usage(body, system, conversation, text)
+
+    def _usage(self, body: Dict[str, Any], system: str, conversation: str, text: str) -> Dict[str, int]:
+        """Token counts at ~4 characters per token, with prompt caching of marked system blocks."""
+        cached_chars = sum(
+            len(block.get("text", ""))
+            for block in body.get("system", []) if isinstance(block, dict) and block.get("cache_control")
+        ) if isinstance(body.get("system"), list) else 0
+        cached_tokens = cached_chars // 4
+        input_tokens = max(1, (len(system) + len(conversation)) // 4 - cached_tokens)
+
+        cache_read = cache_write = 0
+        if cached_tokens:
+            prefix = hashlib.sha256(system[:cached_chars].encode("utf-8")).hexdigest()
+            with self._lock:
+                if prefix in self._cached_prefixes:
+                    cache_read = cached_tokens
+                else:
+                    self._cached_prefixes.add(prefix)
+                    cache_write = cached_tokens
+
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": self.config.output_tokens or max(1, len(text) // 4),
+            "cache_creation_input_tokens": cache_write,
+            "cache_read_input_tokens": cache_read,
+        }
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"requests": self.requests, "errors": self.errors, "rate_limited": self.rate_limited}
+
+
+def _text(content: Any) -> str:
+    """Flatten a string or list of content blocks to text."""
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+
+def _spec_evaluation(system: str, seed: int) -> str:
+    """Evaluator reply in the spec-driven format of _build_output_format_section."""
+    match = _ACTION_OPTIONS.search(system)
+    actions = match.group(1).split("|") if match else ["LIGHT_HELP"]
+    competency_ids = _assessed_competency_ids(system)
+    level = 2 + seed % 3
+    return json.dumps({
+        "competency_scores": {
+            comp_id: {"level": level, "evidence": "Stub observation.", "flags": []}
+            for comp_id in competency_ids
+        },
+        "overall_assessment": "Stub assessment.",
+        "action": actions[seed % len(actions)],
+        "interviewer_guidance": "Ask them to go one level deeper.",
+        "data_to_share": None,
+        "focus_next": competency_ids[0] if competency_ids else None,
+    })
+
+
+def _assessed_competency_ids(system: str) -> List[str]:
+    """
+    Every competency in the prompt's COMPETENCIES TO ASSESS section.
+
+    The OUTPUT FORMAT example only lists the first three, so the headings
+    (display names, or the id when the rubric has no definition) are mapped
+    back to rubric ids instead.
+    """
+    start = system.find("## COMPETENCIES TO ASSESS")
+    if start < 0:
+        return _SCORE_EXAMPLE.findall(system)
+    end = system.find("\n## ", start + 1)
+    section = system[start:end] if end >= 0 else system[start:]
+
+    from specs import UNIVERSAL_RUBRIC
+
+    ids_by_name = {competency.name: competency.id for competency in UNIVERSAL_RUBRIC.values()}
+    return [ids_by_name.get(name, name) for name in _COMPETENCY_HEADING.findall(section)]
+
+
+def _legacy_evaluation(system: str, seed: int) -> str:
+    """Evaluator reply in the legacy single-score format."""
+    match = _ACTION_OPTIONS.search(system)
+    actions = match.group(1).split("|") if match else ["LIGHT_HELP"]
+    level = 2 + seed % 3
+    return json.dumps({
+        "current_level": level,
+        "level_name": ("FAIL", "WEAK", "GOOD_NOT_ENOUGH", "CLEAR_PASS", "OUTSTANDING")[level - 1],
+        "level_justification": "Stub assessment.",
+        "level_trend": "STABLE",
+        "action": actions[seed % len(actions)],
+        "interviewer_guidance": "Ask them to go one level deeper.",
+        "data_to_share": None,
+        "red_flags": [],
+        "green_flags": ["Structured"],
+    })
+
+
+# =============================================================================
+# APP
+# =============================================================================
+
+def create_stub_app(config: Optional[StubConfig] = None) -> FastAPI:
+    """A FastAPI app serving the stub Messages API."""
+    stub = StubLLM(config or StubConfig())
+    app = FastAPI(title="Stub Anthropic Messages API")
+    app.state.stub = stub
+
+    @app.post("/v1/messages")
+    async def messages(request: Request):
+        body = await request.json()
+        rejection = stub.admit()
+        if rejection is not None:
+            status, error_type, message = rejection
+            headers = {"retry-after": str(stub.retry_after())} if status == 429 else {}
+            return JSONResponse(
+                {"type": "error", "error": {"type": error_type, "message": message}},
+                status_code=status,
+                headers=headers,
+            )
+
+        text, usage = stub.reply(body)
+        message = {
+            "id": f"msg_stub_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "stub"),
+            "content": [],
+            "stop_reason": None,
+            "stop_sequence": None,
+            "usage": usage,
+        }
+
+        if body.get("stream"):
+            return StreamingResponse(_stream(stub, message, text), media_type="text/event-stream")
+
+        await asyncio.sleep(stub.sample_seconds(stub.config.latency_ms))
+        message.update(content=[{"type": "text", "text": text}], stop_reason="end_turn")
+        return JSONResponse(message)
+
+    @app.get("/stats")
+    async def stats():
+        return stub.stats()
+
+    return app
+
+
+@contextmanager
+def serve_stub(config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+    """Serve the stub on a background thread (a free port by default) and yield its base URL."""
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(create_stub_app(config), host=host, port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    bound_port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://{host}:{bound_port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+async def _stream(stub: StubLLM, message: Dict[str, Any], text: str) -> AsyncIterator[str]:
+    """Server-sent events in the Messages API streaming format."""
+    usage = message["usage"]
+    chunks = [text[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(text), STREAM_CHUNK_CHARS)]
+    # The rest of the reply takes the remainder of a whole-reply latency sample
+    ttft = stub.sample_seconds(stub.config.ttft_ms)
+    per_chunk = max(0.0, stub.sample_seconds(stub.config.latency_ms) - ttft) / max(len(chunks), 1)
+
+    await asyncio.sleep(ttft)
+    yield _event("message_start", {"message": {**message, "usage": {**usage, "output_tokens": 1}}})
+    yield _event("content_block_start", {"index": 0, "content_block": {"type": "text", "text": ""}})
+    for chunk in chunks:
+        yield _event("content_block_delta", {"index": 0, "delta": {"type": "text_delta", "text": chunk}})
+        if per_chunk:
+            await asyncio.sleep(per_chunk)
+    yield _event("content_block_stop", {"index": 0})
+    yield _event("message_delta", {
+        "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+        "usage": {"output_tokens": usage["output_tokens"]},
+    })
+    yield _event("message_stop", {})
+
+
+def _event(event_type: str, data: Dict[str, Any]) -> str:
+    return f"event: {event_type}\ndata: {json.dumps({'type': event_type, **data})}\n\n"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=800.0, help="median whole-reply latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.4, help="lognormal spread (0 = fixed)")
+    parser.add_argument("--ttft-ms", type=float, default=250.0, help="median time to first streamed token")
+    parser.add_argument("--output-tokens", type=int, default=None, help="fixed output token count")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 529")
+    parser.add_argument("--rpm", type=int, default=0, help="requests per minute before 429s (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    config = StubConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        ttft_ms=args.ttft_ms,
+        output_tokens=args.output_tokens,
+        error_rate=args.error_rate,
+        rpm=args.rpm,
+        seed=args.seed,
+    )
+    uvicorn.run(create_stub_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
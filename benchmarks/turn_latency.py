@@ -0,0 +1,295 @@
+"""
+Per-turn overhead of the interview pipeline, by interview type.
+
+Drives InterviewRunner through a scripted transcript for every interview
+type on the spec-driven path, and for the legacy case path, against
+instant stand-in LLMs. Each turn's time is split into the runner's own
+components:
+
+    prompt_build   building the evaluator and interviewer messages
+    parse          parsing replies and building their state deltas
+    state_merge    applying deltas to the session state
+    manager        constraint checks and the manager directive
+    other          everything else in the turn (routing, telemetry, ...)
+
+Prompt sizes come from the per-node spans (see telemetry) and are
+converted to tokens at ~4 characters per token. Both timings and prompt
+tokens are reported per bucket of turns and as a least-squares slope per
+10 turns, so growth with transcript length shows up as a number.
+
+The legacy path ends at its fixed 15-exchange limit; spec-driven
+interviews have their limits stretched to the requested turn count. The
+turn that closes an interview is left out.
+
+Usage:
+    python -m benchmarks.turn_latency [--turns 60] [--bucket 10] [--json turn_latency.json]
+"""
+import argparse
+import importlib
+import json
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.stand_in import stand_in_llms, stretch_constraints  # noqa: E402
+
+# Rough prompt-size to token conversion for Claude models
+CHARS_PER_TOKEN = 4
+
+# Component -> (module, attribute) pairs whose time counts toward it
+COMPONENTS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "prompt_build": (
+        ("agents.evaluator", "_build_evaluator_messages"),
+        ("agents.interviewer", "_build_interviewer_messages"),
+    ),
+    "parse": (
+        ("agents.evaluator", "_process_evaluator_response"),
+        ("agents.interviewer", "_process_interviewer_response"),
+    ),
+    "state_merge": (("graph", "apply_delta"),),
+    "manager": (
+        ("graph", "manager_node"),
+        ("graph", "check_session_constraints"),
+    ),
+}
+
+TRANSCRIPTS: Dict[str, List[str]] = {
+    "case": [
+        "I'd split profit into revenue and costs, then look at each driver.",
+        "On revenue: cups per day times average ticket. Can we see the trend?",
+        "Costs look heavier on rent and labor. What share is fixed?",
+        "So the margin drop comes from wage increases, not pricing.",
+        "I'd test a small price rise and staffing by hour of the day.",
+        "To sum up: recover margin through pricing and rostering.",
+    ],
+    "first_round": [
+        "I've spent four years building data pipelines at a logistics company.",
+        "The migration cut our batch window from six hours to forty minutes.",
+        "I led the design and two engineers implemented it with me.",
+        "I'm looking for a team where the data platform is the product.",
+        "The gap is streaming: I've only used Kafka on side projects.",
+        "What does the on-call rotation look like for this team?",
+    ],
+    "technical": [
+        "I'd keep a token bucket per API key, refilled lazily on each request.",
+        "Each bucket stores the tokens left and the last refill time.",
+        "A request computes the refill, then takes a token or gets a 429.",
+        "Per request that's O(1) time; memory is O(keys).",
+        "Across nodes I'd move the bucket into Redis with a Lua script.",
+        "Edge cases: clock skew and bursts right after a refill.",
+    ],
+}
+
+
+# =============================================================================
+# COMPONENT TIMING
+# =============================================================================
+
+class ComponentTimer:
+    """Accumulates time spent in the patched functions of each component."""
+
+    def __init__(self):
+        self.totals: Dict[str, float] = dict.fromkeys(COMPONENTS, 0.0)
+        # Nested calls to the same component (none today) are only counted once
+        self._depth: Dict[str, int] = dict.fromkeys(COMPONENTS, 0)
+
+    def take(self) -> Dict[str, float]:
+        """Seconds per component since the last take()."""
+        totals, self.totals = self.totals, dict.fromkeys(COMPONENTS, 0.0)
+        return totals
+
+    def wrap(self, component: str, fn: Callable) -> Callable:
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            self._depth[component] += 1
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._depth[component] -= 1
+                if not self._depth[component]:
+                    self.totals[component] += time.perf_counter() - started
+        return timed
+
+    @contextmanager
+    def patched(self) -> Iterator["ComponentTimer"]:
+        """Time every component's functions for the duration of the block."""
+        originals = []
+        try:
+            for component, targets in COMPONENTS.items():
+                for module_name, attribute in targets:
+                    module = importlib.import_module(module_name)
+                    original = getattr(module, attribute)
+                    originals.append((module, attribute, original))
+                    setattr(module, attribute, self.wrap(component, original))
+            yield self
+        finally:
+            for module, attribute, original in reversed(originals):
+                setattr(module, attribute, original)
+
+
+# =============================================================================
+# SCENARIOS
+# =============================================================================
+
+def scenarios(turns: int) -> List[Tuple[str, str, Callable[[], Dict[str, Any]], Tuple[str, ...]]]:
+    """(name, transcript, initial state factory, competency ids) for every benchmarked path."""
+    from case_loader import initialize_interview_state, load_case
+    from graph import initialize_from_spec
+    from specs import (
+        compile_spec,
+        create_case_interview_spec,
+        create_first_round_spec,
+        create_technical_interview_spec,
+    )
+
+    specs = {
+        "case": create_case_interview_spec(load_case("coffee_profitability")),
+        "first_round": create_first_round_spec(
+            job_description="Senior data engineer owning batch and streaming pipelines.",
+            candidate_cv="Data engineer, 4 years. Airflow, Spark, some Kafka.",
+            role_title="Senior Data Engineer",
+        ),
+        "technical": create_technical_interview_spec({
+            "problem_statement": "Design a rate limiter for a public API.",
+            "expected_complexity": "O(1) per request",
+        }),
+    }
+
+    result = [(
+        "legacy_case",
+        "case",
+        lambda: initialize_interview_state("coffee_profitability"),
+        (),
+    )]
+    for interview_type, spec in specs.items():
+        spec_dict = stretch_constraints(spec.model_dump(), turns)
+        result.append((
+            f"spec_{interview_type}",
+            interview_type,
+            lambda spec_dict=spec_dict: initialize_from_spec(spec_dict, session_id=f"turn-latency-{spec_dict['spec_id']}"),
+            tuple(compile_spec(spec_dict).competency_ids),
+        ))
+    return result
+
+
+def run_scenario(
+    name: str,
+    transcript: str,
+    make_state: Callable[[], Dict[str, Any]],
+    competency_ids: Tuple[str, ...],
+    turns: int,
+    bucket: int,
+) -> Dict[str, Any]:
+    """Run one scripted interview and summarize its per-turn costs."""
+    from graph import InterviewRunner
+
+    lines = TRANSCRIPTS[transcript]
+    timer = ComponentTimer()
+    rows: List[Dict[str, float]] = []
+
+    with stand_in_llms(competency_ids), timer.patched():
+        runner = InterviewRunner(make_state())
+        runner.start()
+        seen_spans = len(runner.get_spans())
+        timer.take()
+
+        for turn in range(turns):
+            if runner.is_complete():
+                break
+            started = time.perf_counter()
+            runner.respond(f"{lines[turn % len(lines)]} (turn {turn + 1})")
+            turn_seconds = time.perf_counter() - started
+
+            components = timer.take()
+            spans = runner.get_spans()[seen_spans:]
+            seen_spans += len(spans)
+            if runner.is_complete():
+                # The closing turn skips the interviewer call; it isn't a typical turn
+                break
+
+            row = {f"{component}_ms": seconds * 1000 for component, seconds in components.items()}
+            row["turn_ms"] = turn_seconds * 1000
+            row["other_ms"] = max(0.0, row["turn_ms"] - sum(components.values()) * 1000)
+            for agent in ("evaluator", "interviewer"):
+                chars = sum(sum(span["prompt_chars"].values()) for span in spans if span["node"] == agent)
+                row[f"{agent}_prompt_tokens"] = chars / CHARS_PER_TOKEN
+            rows.append(row)
+
+    metrics = list(rows[0]) if rows else []
+    return {
+        "scenario": name,
+        "path": "legacy" if name.startswith("legacy") else "spec",
+        "interview_type": runner.get_interview_type() or "legacy_case",
+        "turns_run": len(rows),
+        "summary": {metric: _summary([row[metric] for row in rows]) for metric in metrics},
+        "buckets": [
+            {
+                "turns": f"{start + 1}-{start + len(chunk)}",
+                **{metric: round(statistics.fmean(row[metric] for row in chunk), 4) for metric in metrics},
+            }
+            for start in range(0, len(rows), bucket)
+            for chunk in [rows[start:start + bucket]]
+        ],
+        "growth_per_10_turns": {metric: _slope([row[metric] for row in rows], per=10) for metric in metrics},
+    }
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "mean": round(statistics.fmean(ordered), 4),
+        "median": round(statistics.median(ordered), 4),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+    }
+
+
+def _slope(values: List[float], per: int) -> Optional[float]:
+    """Least-squares change over `per` turns, or None with too few turns."""
+    if len(values) < 3 or len(set(values)) == 1:
+        return 0.0 if len(values) >= 3 else None
+    slope, _ = statistics.linear_regression(range(len(values)), values)
+    return round(slope * per, 4)
+
+
+def run(turns: int = 60, bucket: int = 10) -> Dict[str, Any]:
+    """Run every scenario and return the combined results."""
+    return {
+        "benchmark": "turn_latency",
+        "turns": turns,
+        "chars_per_token": CHARS_PER_TOKEN,
+        "scenarios": [
+            run_scenario(name, transcript, make_state, competency_ids, turns, bucket)
+            for name, transcript, make_state, competency_ids in scenarios(turns)
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=60)
+    parser.add_argument("--bucket", type=int, default=10)
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    results = run(args.turns, args.bucket)
+
+    for scenario in results["scenarios"]:
+        summary, growth = scenario["summary"], scenario["growth_per_10_turns"]
+        print(f"{scenario['scenario']} ({scenario['turns_run']} turns)")
+        for metric in ("turn_ms", "prompt_build_ms", "parse_ms", "state_merge_ms", "manager_ms", "other_ms"):
+            print(f"  {metric:<16} median {summary[metric]['median']:8.3f}  p95 {summary[metric]['p95']:8.3f}"
+                  f"  growth/10 turns {growth[metric]}")
+        for metric in ("evaluator_prompt_tokens", "interviewer_prompt_tokens"):
+            print(f"  {metric:<26} mean {summary[metric]['mean']:9.1f}  growth/10 turns {growth[metric]}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
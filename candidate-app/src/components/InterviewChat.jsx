@@ -48,30 +48,79 @@ function InterviewChat({ sessionId, caseTitle, openingMessage, onComplete }) {
     setIsLoading(true)
 
     try {
-      const response = await fetch(`/api/interviews/${sessionId}/respond`, {
+      const response = await fetch(`/api/interviews/${sessionId}/respond/stream`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ message: userMessage }),
       })
 
-      if (!response.ok) throw new Error('Failed to get response')
+      if (!response.ok || !response.body) throw new Error('Failed to get response')
 
-      const data = await response.json()
+      let streamed = ''
+      let done = null
 
-      // Add interviewer response
-      setMessages((prev) => [
-        ...prev,
-        { role: 'interviewer', content: data.interviewer_message },
-      ])
+      // Show interviewer text as soon as the first tokens arrive
+      const showInterviewerText = (text) => {
+        setIsLoading(false)
+        setMessages((prev) => {
+          const last = prev[prev.length - 1]
+          if (last?.role === 'interviewer' && last.streaming) {
+            return [...prev.slice(0, -1), { ...last, content: text }]
+          }
+          return [...prev, { role: 'interviewer', content: text, streaming: true }]
+        })
+      }
+
+      const reader = response.body.getReader()
+      const decoder = new TextDecoder()
+      let buffer = ''
+
+      while (!done) {
+        const { value, done: finished } = await reader.read()
+        if (finished) break
+        buffer += decoder.decode(value, { stream: true })
+
+        // SSE events are separated by a blank line
+        let boundary
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+          const raw = buffer.slice(0, boundary)
+          buffer = buffer.slice(boundary + 2)
+
+          const event = raw.match(/^event: (.*)$/m)?.[1]
+          const data = JSON.parse(raw.match(/^data: (.*)$/m)?.[1] || '{}')
+
+          if (event === 'token') {
+            streamed += data.text
+            showInterviewerText(streamed)
+          } else if (event === 'done') {
+            done = data
+          } else if (event === 'error') {
+            throw new Error(data.detail)
+          }
+        }
+      }
+
+      if (!done) throw new Error('Response ended unexpectedly')
+
+      // The final message is authoritative (e.g. a closing message)
+      setMessages((prev) => {
+        const last = prev[prev.length - 1]
+        const base = last?.role === 'interviewer' && last.streaming ? prev.slice(0, -1) : prev
+        return [...base, { role: 'interviewer', content: done.interviewer_message }]
+      })
 
       // Check if interview is complete
-      if (data.is_complete) {
+      if (done.is_complete) {
         setTimeout(() => onComplete(), 1500)
       }
     } catch (err) {
       setError('Unable to send message. Please try again.')
-      // Remove the failed user message
-      setMessages((prev) => prev.slice(0, -1))
+      // Remove any partial reply and the failed user message
+      setMessages((prev) => {
+        const last = prev[prev.length - 1]
+        const base = last?.role === 'interviewer' && last.streaming ? prev.slice(0, -1) : prev
+        return base.slice(0, -1)
+      })
       setInput(userMessage)
     } finally {
       setIsLoading(false)
@@ -74,6 +74,9 @@ def initialize_interview_state(
 
         # Usage tracking
         total_tokens=0,
+        cache_read_tokens=0,
+        cache_write_tokens=0,
+        degraded_calls=0,
     )
 
 
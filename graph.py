@@ -5,6 +5,8 @@ New Flow (Evaluator-Driven):
 1. Candidate responds
 2. Evaluator assesses and provides guidance
 3. Interviewer responds following evaluator guidance
+   (skipped when the hard session limits are already reached - the
+   interview goes straight to the closing message)
 4. Manager checks constraints and provides guidance
 
 This module now supports multiple interview types via the InterviewSpec system.
@@ -12,8 +14,15 @@ The InterviewRunner can be initialized with either:
 - A legacy InterviewState (backward compatible)
 - An InterviewSpec (new context injection approach)
 """
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union, AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 from datetime import datetime
+import contextvars
+import statistics
+import asyncio
+import os
+import time
 import uuid
 
 from state import (
@@ -22,11 +31,25 @@ from state import (
     Phase,
     initialize_competency_scores,
     has_spec,
+    get_compiled_spec,
     get_spec_interview_type,
+    Append,
+    AppendLog,
+    LogView,
+    apply_delta,
+    last_of_role,
+    prepare_state,
+    restore_snapshot,
+    SpecDict,
+    snapshot_state,
 )
-from agents.evaluator import evaluator_node
-from agents.interviewer import interviewer_node, generate_closing_message
-from agents.manager import manager_node
+from agents.evaluator import evaluator_node, aevaluator_node
+from agents.interviewer import interviewer_node, ainterviewer_node, generate_closing_message
+from agents.manager import manager_node, check_session_constraints
+from agents.usage import USAGE_STATE_KEYS, tokens_in
+from llm.admission import Priority, admission_priority
+from llm.resilience import time_budget
+from telemetry import get_session_spans
 
 
 def initialize_from_spec(
@@ -77,7 +100,7 @@ def initialize_from_spec(
         "started_at": datetime.utcnow().isoformat(),
 
         # Interview specification (NEW)
-        "interview_spec": spec_dict,
+        "interview_spec": SpecDict(spec_dict),
 
         # Legacy case fields (populated for case interviews, empty otherwise)
         "case_id": spec_dict.get("spec_id", ""),
@@ -125,11 +148,110 @@ def initialize_from_spec(
 
         # Usage
         "total_tokens": 0,
+        "cache_read_tokens": 0,
+        "cache_write_tokens": 0,
+        "degraded_calls": 0,
     }
 
     return state
 
 
+# =============================================================================
+# SPECULATIVE TURN MODE
+# =============================================================================
+# In speculative mode the interviewer drafts its reply from the previous
+# turn's guidance while the evaluator is still running. The draft is kept
+# when the new evaluation leaves the action and approved data unchanged.
+
+TURN_MODES = ("serial", "speculative", "pipelined")
+
+# Shared pool for running evaluations alongside the interviewer on the sync path
+_turn_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="interview-turn")
+
+
+def _submit(fn, *args):
+    """Run `fn` on the turn pool with the caller's context (and so its time budget)."""
+    return _turn_pool.submit(contextvars.copy_context().run, fn, *args)
+
+
+def _discard(future: Any) -> None:
+    """Stop a background evaluation that will never be applied."""
+    if future is None or future.cancel():
+        return
+    if future.done() and not future.cancelled():
+        future.exception()  # Retrieved, so a failure isn't reported as unhandled
+
+
+# =============================================================================
+# TURN TIME BUDGET
+# =============================================================================
+# Every LLM call in a turn must finish within the turn's budget (see
+# llm.resilience). When it can't, the evaluator keeps its last guidance
+# and the interviewer falls back to a neutral prompt, so the candidate
+# never waits longer than the budget for a reply.
+
+DEFAULT_TURN_BUDGET_SECONDS = float(os.getenv("INTERVIEW_TURN_BUDGET_SECONDS", "30"))
+
+# Part of the budget the evaluator may use when the interviewer runs after it
+EVALUATOR_BUDGET_SHARE = 0.6
+
+
+class SpeculationStats:
+    """
+    Hit/miss counters and latency savings for speculative turns.
+
+    `latency_saved` is the estimated candidate-visible time saved per turn
+    versus running the evaluator and interviewer back to back. On a miss
+    it is zero or negative (the draft was thrown away).
+    """
+
+    def __init__(self, max_samples: int = 1000):
+        self.hits = 0
+        self.misses = 0
+        self.wasted_tokens = 0
+        self.latency_saved: deque = deque(maxlen=max_samples)
+
+    def record(self, hit: bool, saved_seconds: float, wasted_tokens: int = 0) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.wasted_tokens += wasted_tokens
+        self.latency_saved.append(saved_seconds)
+
+    def record_abandoned(self, wasted_tokens: int) -> None:
+        """Count a draft from a turn that failed; it is neither a hit nor a miss."""
+        self.wasted_tokens += wasted_tokens
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        samples = list(self.latency_saved)
+        return {
+            "turns": self.hits + self.misses,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+            "p50_latency_saved_ms": round(statistics.median(samples) * 1000, 1) if samples else 0.0,
+            "wasted_tokens": self.wasted_tokens,
+        }
+
+
+# Process-wide speculation stats, keyed by interview type
+_speculation_by_type: Dict[str, SpeculationStats] = {}
+
+
+def get_speculation_report() -> Dict[str, Dict[str, Any]]:
+    """Speculative-turn hit rate and p50 latency saved, per interview type."""
+    return {
+        interview_type: stats.summary()
+        for interview_type, stats in sorted(_speculation_by_type.items())
+    }
+
+
 class InterviewRunner:
     """
     High-level interface for running interviews.
@@ -142,11 +264,43 @@ class InterviewRunner:
     1. Evaluator assesses candidate and provides guidance (runs FIRST)
     2. Interviewer responds following evaluator guidance
     3. Manager checks constraints and provides guidance
+
+    With turn_mode="speculative", steps 1 and 2 run concurrently: the
+    interviewer drafts from the previous turn's guidance and the draft is
+    only regenerated if the evaluator changes the action or approved data.
+
+    With turn_mode="pipelined", the evaluator is taken off the critical
+    path: the interviewer answers turn N with guidance from turn N-1 while
+    turn N is evaluated in the background. Each evaluation is applied
+    exactly once, in order, before the next turn starts.
+
+    Each turn runs under a time budget of `turn_budget_seconds`; LLM calls
+    that can't finish in time are replaced by degraded fallbacks. The
+    runner's LLM calls are admitted at `priority` (simulated interviews
+    queue behind live ones).
     """
 
-    def __init__(self, initial_state: InterviewState):
-        self.state = initial_state
+    def __init__(
+        self,
+        initial_state: InterviewState,
+        turn_mode: str = "serial",
+        turn_budget_seconds: Optional[float] = None,
+        priority: Priority = Priority.LIVE_TURN,
+    ):
+        if turn_mode not in TURN_MODES:
+            raise ValueError(f"Unknown turn mode: {turn_mode}. Expected one of {TURN_MODES}")
+        # Private copy, updated in place by node deltas
+        self.state = prepare_state(initial_state)
         self.response_count = 0
+        self.turn_mode = turn_mode
+        self.turn_budget_seconds = turn_budget_seconds or DEFAULT_TURN_BUDGET_SECONDS
+        self.priority = priority
+        self.speculation = SpeculationStats()
+
+        # Pipelined mode: at most one background evaluation in flight,
+        # as (exchange number, future/task, state snapshot it was computed from)
+        self._pending_evaluation: Optional[Tuple[int, Any, InterviewState]] = None
+        self._evaluations_applied = 0
 
     @classmethod
     def from_spec(
@@ -154,6 +308,8 @@ class InterviewRunner:
         spec: Union[Dict[str, Any], "InterviewSpec"],
         candidate_id: Optional[str] = None,
         session_id: Optional[str] = None,
+        turn_mode: str = "serial",
+        priority: Priority = Priority.LIVE_TURN,
     ) -> "InterviewRunner":
         """
         Create an InterviewRunner from an InterviewSpec.
@@ -165,57 +321,463 @@ class InterviewRunner:
             spec: An InterviewSpec or dict representation
             candidate_id: Optional candidate identifier
             session_id: Optional session identifier
+            turn_mode: "serial" (default), "speculative" or "pipelined"
+            priority: Admission priority of the interview's LLM calls
 
         Returns:
             Configured InterviewRunner ready to start
         """
         state = initialize_from_spec(spec, candidate_id, session_id)
-        return cls(state)
+        return cls(state, turn_mode=turn_mode, priority=priority)
 
     def start(self) -> str:
         """Start the interview and return the opening message."""
         # For opening, just call interviewer directly (no candidate response yet)
-        result = interviewer_node(self.state)
-        self.state = {**self.state, **result}
+        with admission_priority(self.priority):
+            result = interviewer_node(self.state)
+        apply_delta(self.state, result)
         return self._get_last_interviewer_message()
 
     def respond(self, candidate_response: str) -> str:
-        """Process candidate's response and return interviewer's next message."""
-        # Add candidate message
+        """
+        Process candidate's response and return interviewer's next message.
+
+        A turn that raises leaves the session as it was before the turn.
+        """
+        savepoint = self._savepoint()
+        try:
+            with admission_priority(self.priority), time_budget(self.turn_budget_seconds):
+                return self._respond(candidate_response)
+        except BaseException:
+            self._rollback(savepoint)
+            raise
+
+    def _respond(self, candidate_response: str) -> str:
+        """One turn on the sync path, under the turn's time budget."""
+        if self.turn_mode == "pipelined":
+            self.drain()
+        self._add_candidate_message(candidate_response)
+
+        # Hard limits reached: assess the last answer and go straight to closing
+        termination = check_session_constraints(self.state)
+        if termination:
+            apply_delta(self.state, evaluator_node(self.state))
+            return self._close_session(termination)
+
+        if self.turn_mode == "speculative":
+            self._respond_speculative()
+            return self._finish_turn()
+
+        if self.turn_mode == "pipelined":
+            return self._respond_pipelined()
+
+        # 1. Run evaluator FIRST - assess candidate and provide guidance
+        with time_budget(self.turn_budget_seconds * EVALUATOR_BUDGET_SHARE):
+            evaluator_result = evaluator_node(self.state)
+        apply_delta(self.state, evaluator_result)
+
+        # 2. Run interviewer - follows evaluator guidance
+        interviewer_result = interviewer_node(self.state)
+        apply_delta(self.state, interviewer_result)
+
+        return self._finish_turn()
+
+    async def astart(self) -> str:
+        """Async variant of start() for use inside an event loop."""
+        with admission_priority(self.priority):
+            result = await ainterviewer_node(self.state)
+        apply_delta(self.state, result)
+        return self._get_last_interviewer_message()
+
+    async def arespond(self, candidate_response: str) -> str:
+        """
+        Async variant of respond().
+
+        LLM calls are awaited, so a single event loop can keep many
+        interviews in flight while the model is working.
+        """
+        return await self._arespond(candidate_response)
+
+    async def arespond_stream(self, candidate_response: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a candidate response, streaming the interviewer's reply.
+
+        Yields {"type": "token", "text": ...} events as the interviewer's
+        spoken text is generated, then a final {"type": "done",
+        "interviewer_message": ..., "is_complete": ...} event. The final
+        message is authoritative: it may differ from the streamed text when
+        the turn ends with a closing message.
+
+        If the consumer stops early (a client disconnect), the turn is
+        cancelled and the session is left as it was before the turn.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        end_of_stream = object()
+
+        async def emit(text: str) -> None:
+            queue.put_nowait(text)
+
+        async def run_turn() -> str:
+            try:
+                return await self._arespond(candidate_response, on_token=emit)
+            finally:
+                queue.put_nowait(end_of_stream)
+
+        turn = asyncio.create_task(run_turn())
+        try:
+            while True:
+                item = await queue.get()
+                if item is end_of_stream:
+                    break
+                yield {"type": "token", "text": item}
+            message = await turn
+        finally:
+            if not turn.done():
+                # The consumer went away: cancel the turn and let it roll back
+                # before the caller releases the session
+                turn.cancel()
+                await asyncio.wait([turn])
+
+        yield {"type": "done", "interviewer_message": message, "is_complete": self.is_complete()}
+
+    async def _arespond(
+        self,
+        candidate_response: str,
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> str:
+        """
+        Shared async turn; `on_token` receives streamed interviewer text.
+
+        A turn that raises or is cancelled leaves the session as it was
+        before the turn, so a retry doesn't repeat the candidate's message.
+        """
+        savepoint = self._savepoint()
+        try:
+            with admission_priority(self.priority), time_budget(self.turn_budget_seconds):
+                return await self._arespond_turn(candidate_response, on_token)
+        except BaseException:
+            self._rollback(savepoint)
+            raise
+
+    async def _arespond_turn(
+        self,
+        candidate_response: str,
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> str:
+        """One turn on the async path, under the turn's time budget."""
+        if self.turn_mode == "pipelined":
+            await self.adrain()
+        self._add_candidate_message(candidate_response)
+
+        # Hard limits reached: assess the last answer and go straight to closing
+        termination = check_session_constraints(self.state)
+        if termination:
+            apply_delta(self.state, await aevaluator_node(self.state))
+            return self._close_session(termination)
+
+        if self.turn_mode == "speculative":
+            await self._arespond_speculative(on_token)
+            return self._finish_turn()
+
+        if self.turn_mode == "pipelined":
+            return await self._arespond_pipelined(on_token)
+
+        with time_budget(self.turn_budget_seconds * EVALUATOR_BUDGET_SHARE):
+            evaluator_result = await aevaluator_node(self.state)
+        apply_delta(self.state, evaluator_result)
+
+        interviewer_result = await ainterviewer_node(self.state, on_token=on_token)
+        apply_delta(self.state, interviewer_result)
+
+        return self._finish_turn()
+
+    # =========================================================================
+    # Pipelined evaluation
+    # =========================================================================
+
+    def _respond_pipelined(self) -> str:
+        """Reply with current guidance while this turn is evaluated in a thread."""
+        snapshot = snapshot_state(self.state)
+        future = _submit(evaluator_node, snapshot)
+        self._pending_evaluation = (self.response_count, future, snapshot)
+
+        apply_delta(self.state, interviewer_node(self.state))
+        message = self._finish_turn()
+
+        if self.is_complete():
+            # Final scores must include the last answer
+            self.drain()
+        return message
+
+    async def _arespond_pipelined(
+        self,
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> str:
+        """Reply with current guidance while this turn is evaluated in the background."""
+        snapshot = snapshot_state(self.state)
+        task = asyncio.ensure_future(aevaluator_node(snapshot))
+        self._pending_evaluation = (self.response_count, task, snapshot)
+
+        apply_delta(self.state, await ainterviewer_node(self.state, on_token=on_token))
+        message = self._finish_turn()
+
+        if self.is_complete():
+            # Final scores must include the last answer
+            await self.adrain()
+        return message
+
+    def drain(self) -> None:
+        """Wait for and apply any in-flight background evaluation (sync path)."""
+        if self._pending_evaluation is None:
+            return
+        exchange, future, snapshot = self._pending_evaluation
+        if isinstance(future, asyncio.Future):
+            raise RuntimeError("A background evaluation is running on an event loop; use adrain()")
+
+        try:
+            if future is None:
+                raise LookupError("evaluation was not carried over from a checkpoint")
+            result = future.result()
+        except Exception:
+            # Never lose an update: evaluate again from the same snapshot
+            with admission_priority(self.priority):
+                result = evaluator_node(snapshot)
+        self._apply_evaluation(exchange, result, snapshot)
+
+    async def adrain(self) -> None:
+        """Wait for and apply any in-flight background evaluation."""
+        if self._pending_evaluation is None:
+            return
+        exchange, future, snapshot = self._pending_evaluation
+
+        try:
+            if future is None:
+                raise LookupError("evaluation was not carried over from a checkpoint")
+            if isinstance(future, asyncio.Future):
+                # Shield so a cancelled request leaves the evaluation pending, not lost
+                result = await asyncio.shield(future)
+            else:
+                result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Never lose an update: evaluate again from the same snapshot
+            with admission_priority(self.priority):
+                result = await aevaluator_node(snapshot)
+        self._apply_evaluation(exchange, result, snapshot)
+
+    def has_pending_evaluation(self) -> bool:
+        """Whether a background evaluation has not been applied yet."""
+        return self._pending_evaluation is not None
+
+    def _apply_evaluation(self, exchange: int, result: Dict[str, Any], snapshot: InterviewState) -> None:
+        """
+        Apply a background evaluation exactly once, in exchange order.
+
+        The result was computed from `snapshot`. It is a delta (appends and
+        increments), so it applies cleanly on top of whatever the interviewer
+        added in the meantime.
+        """
+        if self._pending_evaluation is None or self._pending_evaluation[0] != exchange:
+            return
+        if exchange != self._evaluations_applied + 1:
+            raise RuntimeError(
+                f"Evaluation for exchange {exchange} applied out of order "
+                f"(last applied: {self._evaluations_applied})"
+            )
+
+        apply_delta(self.state, result)
+        if self.state.get("is_complete"):
+            self.state["final_score"] = self.state.get("current_level", 0)
+
+        self._pending_evaluation = None
+        self._evaluations_applied = exchange
+
+    def _respond_speculative(self) -> None:
+        """Run evaluator and interviewer draft in parallel threads."""
+        draft_state = snapshot_state(self.state)
+        started = time.perf_counter()
+
+        with time_budget(self.turn_budget_seconds * EVALUATOR_BUDGET_SHARE):
+            evaluator_future = _submit(_timed, evaluator_node, draft_state)
+        draft_future = _submit(_timed, interviewer_node, draft_state)
+        try:
+            evaluator_result, evaluator_seconds = evaluator_future.result()
+            draft_result, draft_seconds = draft_future.result()
+        except BaseException:
+            self._abandon_speculation(evaluator_future, draft_future)
+            raise
+
+        if self._accept_draft(evaluator_result, draft_result, draft_state):
+            self._record_speculation(True, evaluator_seconds, draft_seconds)
+            return
+
+        regen_started = time.perf_counter()
+        apply_delta(self.state, interviewer_node(self.state))
+        self._record_speculation(
+            False,
+            evaluator_seconds,
+            draft_seconds,
+            regen_seconds=time.perf_counter() - regen_started,
+            wasted_tokens=tokens_in(draft_result),
+        )
+
+    async def _arespond_speculative(
+        self,
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> None:
+        """
+        Run evaluator and interviewer draft concurrently on the event loop.
+
+        A kept draft is already complete, so it is emitted to `on_token` in
+        one piece; a regenerated reply is streamed as usual.
+        """
+        draft_state = snapshot_state(self.state)
+
+        # The task takes a copy of the context, and with it the shorter budget
+        with time_budget(self.turn_budget_seconds * EVALUATOR_BUDGET_SHARE):
+            evaluation = asyncio.ensure_future(_atimed(aevaluator_node, draft_state))
+        draft = asyncio.ensure_future(_atimed(ainterviewer_node, draft_state))
+        try:
+            (evaluator_result, evaluator_seconds), (draft_result, draft_seconds) = await asyncio.gather(
+                evaluation, draft
+            )
+        except BaseException:
+            # gather leaves the other call running when one fails; the turn is over
+            self._abandon_speculation(evaluation, draft)
+            raise
+
+        if self._accept_draft(evaluator_result, draft_result, draft_state):
+            self._record_speculation(True, evaluator_seconds, draft_seconds)
+            if on_token is not None:
+                await on_token(self._get_last_interviewer_message())
+            return
+
+        regen_started = time.perf_counter()
+        apply_delta(self.state, await ainterviewer_node(self.state, on_token=on_token))
+        self._record_speculation(
+            False,
+            evaluator_seconds,
+            draft_seconds,
+            regen_seconds=time.perf_counter() - regen_started,
+            wasted_tokens=tokens_in(draft_result),
+        )
+
+    def _abandon_speculation(self, evaluation: Any, draft: Any) -> None:
+        """
+        Stop both calls of a failed speculative turn.
+
+        A call already running on a thread can't be stopped, so a draft that
+        completes anyway is counted as wasted when it does.
+        """
+        _discard(evaluation)
+        if not draft.cancel():
+            draft.add_done_callback(self._count_abandoned_draft)
+
+    def _count_abandoned_draft(self, draft: Any) -> None:
+        if draft.cancelled() or draft.exception() is not None:
+            return
+        draft_result, _ = draft.result()
+        interview_type = self.get_interview_type() or "legacy_case"
+        type_stats = _speculation_by_type.setdefault(interview_type, SpeculationStats())
+        for stats in (self.speculation, type_stats):
+            stats.record_abandoned(tokens_in(draft_result))
+
+    def _accept_draft(
+        self,
+        evaluator_result: Dict[str, Any],
+        draft_result: Dict[str, Any],
+        draft_state: InterviewState,
+    ) -> bool:
+        """
+        Apply the evaluation and keep the draft if its guidance still holds.
+
+        A discarded draft was still paid for, so its token usage is added to
+        the session counters either way. Returns True when the draft was kept.
+        """
+        previous = _speculation_key(draft_state)
+        apply_delta(self.state, evaluator_result)
+
+        if _speculation_key(self.state) != previous:
+            draft_usage = {key: draft_result[key] for key in USAGE_STATE_KEYS if key in draft_result}
+            apply_delta(self.state, draft_usage)
+            return False
+
+        apply_delta(self.state, draft_result)
+        return True
+
+    def _record_speculation(
+        self,
+        hit: bool,
+        evaluator_seconds: float,
+        draft_seconds: float,
+        regen_seconds: float = 0.0,
+        wasted_tokens: int = 0,
+    ) -> None:
+        """Record the outcome against this runner and the process-wide report."""
+        serial_seconds = evaluator_seconds + (draft_seconds if hit else regen_seconds)
+        speculative_seconds = max(evaluator_seconds, draft_seconds) + regen_seconds
+        saved = serial_seconds - speculative_seconds
+
+        interview_type = self.get_interview_type() or "legacy_case"
+        type_stats = _speculation_by_type.setdefault(interview_type, SpeculationStats())
+        for stats in (self.speculation, type_stats):
+            stats.record(hit, saved, wasted_tokens)
+
+    def _savepoint(self) -> Dict[str, Any]:
+        """What a turn may change, taken before it starts (O(#keys))."""
+        return {
+            "state": snapshot_state(self.state),
+            "response_count": self.response_count,
+            "pending_evaluation": self._pending_evaluation,
+            "evaluations_applied": self._evaluations_applied,
+        }
+
+    def _rollback(self, savepoint: Dict[str, Any]) -> None:
+        """Undo a turn that failed part-way. Nodes return new values, so the snapshot is intact."""
+        pending = self._pending_evaluation
+        if pending is not None and pending is not savepoint["pending_evaluation"]:
+            # Started by the failed turn: nobody will apply it, so don't pay for it
+            _discard(pending[1])
+        self.state = restore_snapshot(savepoint["state"])
+        self.response_count = savepoint["response_count"]
+        self._pending_evaluation = savepoint["pending_evaluation"]
+        self._evaluations_applied = savepoint["evaluations_applied"]
+
+    def _add_candidate_message(self, candidate_response: str) -> None:
+        """Append the candidate's message to the transcript."""
         candidate_message = Message(
             role="candidate",
             content=candidate_response,
             timestamp=datetime.utcnow().isoformat(),
         )
-        self.state["messages"] = self.state["messages"] + [candidate_message]
+        apply_delta(self.state, {"messages": Append(candidate_message)})
         self.response_count += 1
 
-        # 1. Run evaluator FIRST - assess candidate and provide guidance
-        evaluator_result = evaluator_node(self.state)
-        self.state = {**self.state, **evaluator_result}
-
-        # 2. Run interviewer - follows evaluator guidance
-        interviewer_result = interviewer_node(self.state)
-        self.state = {**self.state, **interviewer_result}
+    def _close_session(self, termination: Dict[str, Any]) -> str:
+        """End the interview without an interviewer reply and return the closing."""
+        apply_delta(self.state, termination)
+        apply_delta(self.state, generate_closing_message(self.state))
+        return self._get_last_interviewer_message()
 
+    def _finish_turn(self) -> str:
+        """Run the manager, close the interview if needed, and return the reply."""
         # 3. Run manager to check constraints and provide guidance
         manager_result = manager_node(self.state)
-        self.state = {**self.state, **manager_result}
+        apply_delta(self.state, manager_result)
 
         # Check if interview should end
         if self.state.get("is_complete"):
             if not self._last_message_is_closing():
                 closing_result = generate_closing_message(self.state)
-                self.state = {**self.state, **closing_result}
+                apply_delta(self.state, closing_result)
 
         return self._get_last_interviewer_message()
 
     def _get_last_interviewer_message(self) -> str:
         """Get the most recent interviewer message."""
-        for msg in reversed(self.state["messages"]):
-            if msg["role"] == "interviewer":
-                return msg["content"]
-        return ""
+        last = last_of_role(self.state["messages"], "interviewer")
+        return last["content"] if last else ""
 
     def _last_message_is_closing(self) -> bool:
         """Check if the last message is already a closing message."""
@@ -232,6 +794,62 @@ class InterviewRunner:
         """Get the current interview state."""
         return self.state
 
+    # =========================================================================
+    # Checkpoints
+    # =========================================================================
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """
+        JSON-serializable snapshot of the session, for restore().
+
+        A pipelined evaluation still in flight is recorded as the state it
+        was started from (log lengths plus the fields that have changed
+        since), so a restored runner evaluates that exchange again instead
+        of losing it.
+        """
+        pending = None
+        if self._pending_evaluation is not None:
+            exchange, _, snapshot = self._pending_evaluation
+            pending = {"exchange": exchange, "log_lengths": {}, "fields": {}}
+            for key, value in snapshot.items():
+                if isinstance(value, LogView):
+                    pending["log_lengths"][key] = len(value)
+                elif value is not self.state.get(key) and value != self.state.get(key):
+                    pending["fields"][key] = value
+
+        return {
+            "state": self.state,
+            "turn_mode": self.turn_mode,
+            "turn_budget_seconds": self.turn_budget_seconds,
+            "priority": int(self.priority),
+            "response_count": self.response_count,
+            "evaluations_applied": self._evaluations_applied,
+            "pending_evaluation": pending,
+        }
+
+    @classmethod
+    def restore(cls, checkpoint: Dict[str, Any]) -> "InterviewRunner":
+        """Rebuild a runner from checkpoint() output."""
+        runner = cls(
+            checkpoint["state"],
+            turn_mode=checkpoint.get("turn_mode", "serial"),
+            turn_budget_seconds=checkpoint.get("turn_budget_seconds"),
+            priority=Priority(checkpoint.get("priority", Priority.LIVE_TURN)),
+        )
+        runner.response_count = checkpoint.get("response_count", 0)
+        runner._evaluations_applied = checkpoint.get("evaluations_applied", 0)
+
+        pending = checkpoint.get("pending_evaluation")
+        if pending:
+            snapshot = {
+                key: value.snapshot(pending["log_lengths"].get(key)) if isinstance(value, AppendLog) else value
+                for key, value in runner.state.items()
+            }
+            snapshot.update(pending["fields"])
+            # No future to wait on: drain() evaluates again from the snapshot
+            runner._pending_evaluation = (pending["exchange"], None, snapshot)
+        return runner
+
     def get_current_level(self) -> tuple:
         """Get current assessment level and name."""
         return (
@@ -288,13 +906,7 @@ class InterviewRunner:
             - critical_status: Pass/fail status on critical competencies
         """
         scores = self.state.get("competency_scores", {})
-        spec = self.state.get("interview_spec", {})
-
-        # Get tiers from spec
-        competency_tiers = {}
-        for comp in spec.get("competencies", []):
-            comp_id = comp.get("competency_id", comp.get("id"))
-            competency_tiers[comp_id] = comp.get("tier", "important")
+        compiled = get_compiled_spec(self.state)
 
         assessed = []
         pending = []
@@ -302,7 +914,7 @@ class InterviewRunner:
 
         for comp_id, score in scores.items():
             level = score.get("current_level", 0)
-            tier = competency_tiers.get(comp_id, "important")
+            tier = compiled.tier(comp_id) if compiled else "important"
 
             if level == 0:
                 pending.append(comp_id)
@@ -324,6 +936,10 @@ class InterviewRunner:
             "critical_status": critical_status
         }
 
+    def get_spans(self) -> List[Dict[str, Any]]:
+        """Per-node spans recorded for this session (see telemetry), oldest first."""
+        return get_session_spans(self.state.get("session_id") or "")
+
     def get_manager_directive(self) -> Optional[Dict[str, Any]]:
         """Get the current manager directive."""
         return self.state.get("manager_directive")
@@ -335,3 +951,22 @@ class InterviewRunner:
     def get_spec(self) -> Optional[Dict[str, Any]]:
         """Get the interview spec if present."""
         return self.state.get("interview_spec")
+
+
+def _speculation_key(state: InterviewState) -> Tuple[str, Optional[str]]:
+    """The guidance fields a speculative draft depends on."""
+    return (state.get("evaluator_action") or "", state.get("data_to_share") or None)
+
+
+def _timed(node, state: InterviewState) -> Tuple[Dict[str, Any], float]:
+    """Run a node and return (result, seconds)."""
+    started = time.perf_counter()
+    result = node(state)
+    return result, time.perf_counter() - started
+
+
+async def _atimed(node, state: InterviewState) -> Tuple[Dict[str, Any], float]:
+    """Await an async node and return (result, seconds)."""
+    started = time.perf_counter()
+    result = await node(state)
+    return result, time.perf_counter() - started
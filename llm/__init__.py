@@ -0,0 +1,50 @@
+"""
+Shared plumbing for LLM calls made by the agents and spec generators.
+
+Modules:
+- admission: global concurrency limit with a bounded, prioritized wait queue
+- registry: lazily built, shared LLM clients with per-role settings and tiers
+- routing: per-turn model tier selection from spec rules, with per-tier stats
+- resilience: turn time budgets, retries, hedging and circuit breaking
+- cache: content-addressed record/replay of LLM replies for offline runs
+"""
+from .admission import (
+    AdmissionController,
+    AdmissionRejected,
+    Priority,
+    admission_priority,
+    admit,
+    aadmit,
+    current_priority,
+    get_admission_stats,
+)
+from .cache import CacheMiss, CachingChatModel, ReplyStore, with_cache
+from .registry import LLMRegistry, RoleConfig, get_llm, registry
+from .resilience import CallGuard, LLMUnavailable, time_budget
+from .routing import RoutedLLM, get_routing_report, route_llm, select_tier
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionRejected",
+    "Priority",
+    "admission_priority",
+    "admit",
+    "aadmit",
+    "current_priority",
+    "get_admission_stats",
+    "CacheMiss",
+    "CachingChatModel",
+    "ReplyStore",
+    "with_cache",
+    "LLMRegistry",
+    "RoleConfig",
+    "get_llm",
+    "registry",
+    "CallGuard",
+    "LLMUnavailable",
+    "time_budget",
+    "RoutedLLM",
+    "get_routing_report",
+    "route_llm",
+    "select_tier",
+]
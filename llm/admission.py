@@ -0,0 +1,313 @@
+"""
+Admission control for LLM calls.
+
+Every model call takes a slot from one process-wide controller. At most
+`max_concurrent` calls run at once; the rest wait in a bounded queue that
+is served by priority (live interview turns first, then spec generation,
+then summarization, then simulated interviews) and FIFO within a priority. When the queue is full a
+call is rejected with AdmissionRejected, which carries a Retry-After hint,
+instead of piling more load onto a rate-limited provider.
+
+Usage:
+    from llm.admission import Priority, aadmit
+
+    async with aadmit(Priority.LIVE_TURN):
+        response = await llm.ainvoke(messages)
+
+Routed agent calls (llm.routing) take the priority set for the current
+context with admission_priority(), LIVE_TURN by default.
+"""
+import asyncio
+import heapq
+import itertools
+import math
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_MAX_CONCURRENT = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+DEFAULT_MAX_QUEUE = int(os.getenv("LLM_MAX_QUEUE", "64"))
+DEFAULT_QUEUE_TIMEOUT_SECONDS = float(os.getenv("LLM_QUEUE_TIMEOUT_SECONDS", "30"))
+
+
+class Priority(IntEnum):
+    """Who is waiting for the model. Lower values are served first."""
+    LIVE_TURN = 0
+    SPEC_GENERATION = 1
+    SUMMARIZATION = 2
+    SIMULATION = 3
+
+
+class AdmissionRejected(Exception):
+    """The LLM queue is full (or the wait timed out); retry after `retry_after` seconds."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    __slots__ = ("priority", "wake", "granted", "dropped", "rejected")
+
+    def __init__(self, priority: Priority, wake: Callable[[], None]):
+        self.priority = priority
+        self.wake = wake
+        self.granted = False   # A released slot was handed to this waiter
+        self.dropped = False   # Gave up (timeout/cancel) or was rejected
+        self.rejected = False  # Pushed out of a full queue by a higher priority
+
+
+class AdmissionController:
+    """
+    Thread- and asyncio-safe concurrency limiter with a priority queue.
+
+    A released slot is handed directly to the best waiter, so the queue is
+    only non-empty while every slot is in use. When the queue is full, a
+    new call may take the place of a queued lower-priority call, which is
+    then rejected; otherwise the new call is rejected.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        queue_timeout_seconds: float = DEFAULT_QUEUE_TIMEOUT_SECONDS,
+        max_samples: int = 1000,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        # (priority, arrival order, waiter); dropped waiters are skipped lazily
+        self._queue: List[Tuple[int, int, _Waiter]] = []
+        self._queued = 0
+        self._order = itertools.count()
+
+        self.admitted = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.preempted = 0
+        self._wait_seconds: Dict[Priority, Deque[float]] = {
+            priority: deque(maxlen=max_samples) for priority in Priority
+        }
+        self._hold_seconds: Deque[float] = deque(maxlen=max_samples)
+
+    # -------------------------------------------------------------------------
+    # Acquire / release
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def slot(self, priority: Priority) -> Iterator[None]:
+        """Hold a slot for a blocking call (waits on this thread)."""
+        started = time.perf_counter()
+        event = threading.Event()
+        waiter = self._enter(priority, event.set)
+        if waiter is not None:
+            event.wait(self.queue_timeout_seconds)
+            self._settle(waiter, timed_out=not event.is_set())
+
+        admitted_at = self._admitted(priority, started)
+        try:
+            yield
+        finally:
+            self._done(admitted_at)
+
+    @asynccontextmanager
+    async def aslot(self, priority: Priority) -> AsyncIterator[None]:
+        """Hold a slot for an async call (waits without blocking the loop)."""
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(lambda: ready.done() or ready.set_result(None))
+
+        waiter = self._enter(priority, wake)
+        if waiter is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(ready), self.queue_timeout_seconds)
+            except asyncio.TimeoutError:
+                self._settle(waiter, timed_out=True)
+            except asyncio.CancelledError:
+                if self._settle(waiter, timed_out=False, cancelled=True):
+                    self._release()
+                raise
+            else:
+                self._settle(waiter, timed_out=False)
+
+        admitted_at = self._admitted(priority, started)
+        try:
+            yield
+        finally:
+            self._done(admitted_at)
+
+    def check_capacity(self, priority: Priority = Priority.LIVE_TURN) -> None:
+        """Raise AdmissionRejected now if a call at `priority` would be rejected."""
+        with self._lock:
+            if self._in_flight < self.max_concurrent or self._queued < self.max_queue:
+                return
+            worst = self._worst_waiter()
+            if worst is not None and priority < worst.priority:
+                return
+            self.rejected += 1
+            raise AdmissionRejected("LLM capacity exhausted", self._retry_after())
+
+    def _enter(self, priority: Priority, wake: Callable[[], None]) -> Optional[_Waiter]:
+        """Take a free slot (returns None) or queue a waiter (returns it)."""
+        with self._lock:
+            if self._in_flight < self.max_concurrent:
+                self._in_flight += 1
+                return None
+
+            if self._queued >= self.max_queue:
+                worst = self._worst_waiter()
+                if worst is None or priority >= worst.priority:
+                    self.rejected += 1
+                    raise AdmissionRejected("LLM queue is full", self._retry_after())
+                # Make room: the lowest-priority, most recent waiter is rejected
+                worst.dropped = worst.rejected = True
+                self._queued -= 1
+                self.preempted += 1
+                worst.wake()
+
+            waiter = _Waiter(priority, wake)
+            heapq.heappush(self._queue, (int(priority), next(self._order), waiter))
+            self._queued += 1
+            return waiter
+
+    def _settle(self, waiter: _Waiter, timed_out: bool, cancelled: bool = False) -> bool:
+        """
+        Resolve a waiter after its wait ends. Returns True if it holds a slot.
+
+        Raises AdmissionRejected if it was pushed out or timed out first.
+        """
+        with self._lock:
+            if waiter.granted:
+                return True
+            if waiter.rejected:
+                if cancelled:
+                    return False
+                raise AdmissionRejected("Displaced by higher-priority LLM calls", self._retry_after())
+            waiter.dropped = True
+            self._queued -= 1
+            if cancelled:
+                return False
+            if timed_out:
+                self.timeouts += 1
+                raise AdmissionRejected("Timed out waiting for LLM capacity", self._retry_after())
+        return False
+
+    def _admitted(self, priority: Priority, started: float) -> float:
+        """Record an admission and its queue wait. Returns the admission time."""
+        admitted_at = time.perf_counter()
+        with self._lock:
+            self.admitted += 1
+            self._wait_seconds[priority].append(admitted_at - started)
+        return admitted_at
+
+    def _done(self, admitted_at: float) -> None:
+        """Record how long the slot was held and release it."""
+        with self._lock:
+            self._hold_seconds.append(time.perf_counter() - admitted_at)
+        self._release()
+
+    def _release(self) -> None:
+        """Hand the slot to the best live waiter, or free it."""
+        with self._lock:
+            while self._queue:
+                _, _, waiter = heapq.heappop(self._queue)
+                if waiter.dropped:
+                    continue
+                waiter.granted = True
+                self._queued -= 1
+                waiter.wake()
+                return
+            self._in_flight -= 1
+
+    def _worst_waiter(self) -> Optional[_Waiter]:
+        """Lowest-priority, most recently queued live waiter (lock held)."""
+        live = [(priority, order, waiter) for priority, order, waiter in self._queue if not waiter.dropped]
+        return max(live, key=lambda item: (item[0], item[1]))[2] if live else None
+
+    def _retry_after(self) -> float:
+        """Seconds until the queue has likely drained enough to admit a call (lock held)."""
+        hold = statistics.fmean(self._hold_seconds) if self._hold_seconds else 1.0
+        return float(max(1, math.ceil(hold * (self._queued + 1) / max(self.max_concurrent, 1))))
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, admissions and wait times for monitoring."""
+        with self._lock:
+            queued_by_priority = {priority.name.lower(): 0 for priority in Priority}
+            for _, _, waiter in self._queue:
+                if not waiter.dropped:
+                    queued_by_priority[waiter.priority.name.lower()] += 1
+
+            wait_ms = {}
+            for priority, samples in self._wait_seconds.items():
+                ordered = sorted(samples)
+                wait_ms[priority.name.lower()] = {
+                    "p50": round(ordered[len(ordered) // 2] * 1000, 1) if ordered else 0.0,
+                    "p95": round(ordered[int(len(ordered) * 0.95)] * 1000, 1) if ordered else 0.0,
+                }
+
+            return {
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queued": self._queued,
+                "queued_by_priority": queued_by_priority,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "preempted": self.preempted,
+                "wait_ms": wait_ms,
+                "avg_call_ms": round(statistics.fmean(self._hold_seconds) * 1000, 1) if self._hold_seconds else 0.0,
+            }
+
+
+# Process-wide controller shared by every LLM call site
+admission = AdmissionController()
+
+
+def admit(priority: Priority):
+    """Hold a slot of the process-wide controller around a blocking LLM call."""
+    return admission.slot(priority)
+
+
+def aadmit(priority: Priority):
+    """Hold a slot of the process-wide controller around an async LLM call."""
+    return admission.aslot(priority)
+
+
+_priority: ContextVar[Priority] = ContextVar("llm_priority", default=Priority.LIVE_TURN)
+
+
+def current_priority() -> Priority:
+    """The priority routed LLM calls made here are admitted at."""
+    return _priority.get()
+
+
+@contextmanager
+def admission_priority(priority: Priority) -> Iterator[Priority]:
+    """Admit the routed LLM calls made in this block at `priority`."""
+    token = _priority.set(priority)
+    try:
+        yield priority
+    finally:
+        _priority.reset(token)
+
+
+def get_admission_stats() -> Dict[str, Any]:
+    """Counters of the process-wide admission controller."""
+    return admission.stats()
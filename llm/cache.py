@@ -0,0 +1,267 @@
+"""
+Content-addressed record/replay cache for LLM calls.
+
+Replies are keyed on the model settings (model, temperature, max_tokens)
+and a canonical hash of the input messages, and stored one per file as
+zlib-compressed JSON under LLM_CACHE_DIR. Recording an interview once
+lets it replay in milliseconds with no network access, e.g. in CI or
+while iterating on prompt builders (any prompt change is a new key).
+
+Modes (LLM_CACHE_MODE):
+    passthrough   every call goes to the model; nothing is read or stored (default)
+    record        recorded replies are served; misses call the model and are stored
+    replay        only recorded replies are served; a miss raises CacheMiss
+
+Environment:
+    LLM_CACHE_MODE   passthrough, record or replay
+    LLM_CACHE_DIR    directory of recorded replies (default .llm_cache)
+
+Usage:
+    LLM_CACHE_MODE=record pytest tests/test_synthetic_candidates.py   # once, online
+    LLM_CACHE_MODE=replay pytest tests/test_synthetic_candidates.py   # offline
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from .registry import RoleConfig
+
+CACHE_MODES = ("passthrough", "record", "replay")
+DEFAULT_CACHE_DIR = ".llm_cache"
+
+# Characters per chunk when a recorded reply is replayed as a stream
+_REPLAY_CHUNK_CHARS = 16
+
+
+class CacheMiss(LookupError):
+    """Replay mode found no recorded reply for a call."""
+
+
+def cache_mode() -> str:
+    """The configured cache mode (LLM_CACHE_MODE)."""
+    mode = os.getenv("LLM_CACHE_MODE", "passthrough").lower()
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Unknown LLM_CACHE_MODE: {mode}. Expected one of {CACHE_MODES}")
+    return mode
+
+
+def cache_key(config: RoleConfig, messages: List[Any]) -> str:
+    """
+    Content address of a call.
+
+    Prompt-cache markers are left out: they change how the provider bills
+    a prompt, not what the model answers.
+    """
+    payload = {
+        "model": config.model,
+        "temperature": config.temperature,
+        "max_tokens": config.max_tokens,
+        "messages": [_canonical_message(message) for message in messages],
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _canonical_message(message: Any) -> Dict[str, Any]:
+    if isinstance(message, dict):
+        role, content = message.get("role", ""), message.get("content", "")
+    else:
+        role, content = message.type, message.content
+    if isinstance(content, list):
+        content = [
+            {k: v for k, v in block.items() if k != "cache_control"} if isinstance(block, dict) else block
+            for block in content
+        ]
+    return {"role": role, "content": content}
+
+
+class ReplyStore:
+    """Recorded replies on disk, one compressed file per key."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def _path(self, key: str) -> Path:
+        # Two-level fan-out keeps directories small
+        return self.directory / key[:2] / f"{key[2:]}.json.z"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            data = self._path(key).read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return json.loads(zlib.decompress(data))
+
+    def put(self, key: str, reply: Dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = zlib.compress(json.dumps(reply, separators=(",", ":"), default=str).encode("utf-8"), 9)
+        # Write then rename, so concurrent recorders never leave a torn file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        with self._lock:
+            self.writes += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"directory": str(self.directory), "hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+
+_default_store: Optional[ReplyStore] = None
+_default_store_lock = threading.Lock()
+
+
+def default_store() -> ReplyStore:
+    """The process-wide store in LLM_CACHE_DIR."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ReplyStore(os.getenv("LLM_CACHE_DIR", DEFAULT_CACHE_DIR))
+        return _default_store
+
+
+def with_cache(build: Callable[[], Any], config: RoleConfig) -> Any:
+    """`build()` as is in passthrough mode, otherwise behind the record/replay cache."""
+    mode = cache_mode()
+    if mode == "passthrough":
+        return build()
+    return CachingChatModel(build, config, mode=mode)
+
+
+class CachingChatModel:
+    """
+    Record/replay wrapper with the invoke/ainvoke/astream surface of a chat model.
+
+    The real client is only built on the first miss, so replay mode never
+    needs credentials or network access.
+    """
+
+    def __init__(
+        self,
+        inner_factory: Callable[[], Any],
+        config: RoleConfig,
+        store: Optional[ReplyStore] = None,
+        mode: str = "record",
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode}. Expected one of {CACHE_MODES}")
+        self._inner_factory = inner_factory
+        self._inner: Any = None
+        self.config = config
+        self.store = store or default_store()
+        self.mode = mode
+
+    @property
+    def inner(self) -> Any:
+        if self._inner is None:
+            self._inner = self._inner_factory()
+        return self._inner
+
+    def invoke(self, messages: List[Any], **kwargs) -> AIMessage:
+        if self.mode == "passthrough":
+            return self.inner.invoke(messages, **kwargs)
+        key = cache_key(self.config, messages)
+        recorded = self._lookup(key)
+        if recorded is not None:
+            return _to_message(recorded)
+        response = self.inner.invoke(messages, **kwargs)
+        self.store.put(key, _to_record(response))
+        return response
+
+    async def ainvoke(self, messages: List[Any], **kwargs) -> AIMessage:
+        if self.mode == "passthrough":
+            return await self.inner.ainvoke(messages, **kwargs)
+        key = cache_key(self.config, messages)
+        recorded = self._lookup(key)
+        if recorded is not None:
+            return _to_message(recorded)
+        response = await self.inner.ainvoke(messages, **kwargs)
+        self.store.put(key, _to_record(response))
+        return response
+
+    async def astream(self, messages: List[Any], **kwargs) -> AsyncIterator[AIMessageChunk]:
+        if self.mode == "passthrough":
+            async for chunk in self.inner.astream(messages, **kwargs):
+                yield chunk
+            return
+        key = cache_key(self.config, messages)
+        recorded = self._lookup(key)
+        if recorded is not None:
+            for chunk in _to_chunks(recorded):
+                yield chunk
+            return
+        response = None
+        async for chunk in self.inner.astream(messages, **kwargs):
+            response = chunk if response is None else response + chunk
+            yield chunk
+        if response is not None:
+            self.store.put(key, _to_record(response))
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        recorded = self.store.get(key)
+        if recorded is None and self.mode == "replay":
+            raise CacheMiss(f"No recorded reply for {self.config.model} call {key[:12]} in {self.store.directory}")
+        return recorded
+
+
+def _to_record(response: Any) -> Dict[str, Any]:
+    return {
+        "content": content_text(response.content),
+        "response_metadata": dict(response.response_metadata or {}),
+        "usage_metadata": dict(getattr(response, "usage_metadata", None) or {}),
+    }
+
+
+def _to_message(recorded: Dict[str, Any]) -> AIMessage:
+    return AIMessage(
+        content=recorded["content"],
+        response_metadata=recorded["response_metadata"],
+        usage_metadata=recorded["usage_metadata"] or None,
+    )
+
+
+def _to_chunks(recorded: Dict[str, Any]) -> List[AIMessageChunk]:
+    """A recorded reply as stream chunks, usage on the last one."""
+    content = recorded["content"]
+    chunks = [
+        AIMessageChunk(content=content[i:i + _REPLAY_CHUNK_CHARS])
+        for i in range(0, len(content), _REPLAY_CHUNK_CHARS)
+    ]
+    chunks.append(AIMessageChunk(
+        content="",
+        response_metadata=recorded["response_metadata"],
+        usage_metadata=recorded["usage_metadata"] or None,
+    ))
+    return chunks
+
+
+def content_text(content: Any) -> str:
+    """Flatten message content (a string or a list of content blocks) to text."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
@@ -0,0 +1,177 @@
+"""
+Central registry of LLM clients, one per role.
+
+Clients are built on first use rather than at import time, with model,
+temperature and max_tokens taken from the environment per role. Roles
+that talk to the same endpoint with the same timeout share
+langchain-anthropic's process-wide pooled HTTP client, so its keep-alive
+connections stay warm across agents.
+
+Each role has a "standard" tier and a cheaper, lower-latency "fast" tier
+with the same sampling settings; model routing (llm.routing) picks the
+tier per call.
+
+Environment (ROLE is EVALUATOR, INTERVIEWER, SPEC_PARSER, SUMMARIZER or CANDIDATE):
+    LLM_MODEL                  default model for every role
+    LLM_<ROLE>_MODEL           model for one role
+    LLM_FAST_MODEL             default fast-tier model for every role
+    LLM_<ROLE>_FAST_MODEL      fast-tier model for one role
+    LLM_<ROLE>_TEMPERATURE     sampling temperature for one role
+    LLM_<ROLE>_MAX_TOKENS      output token limit for one role
+    LLM_TIMEOUT_SECONDS        request timeout for the guarded roles (default 20)
+
+The evaluator and interviewer are called through llm.routing, whose
+CallGuard (llm.resilience) retries under the turn's time budget, so their
+clients don't retry themselves. The other roles are called directly and
+keep the SDK's own retries and timeout. With LLM_CACHE_MODE set to record or
+replay, every client is wrapped in the record/replay cache (llm.cache).
+
+Usage:
+    from llm.registry import get_llm
+
+    response = get_llm("evaluator").invoke(messages)
+
+    with registry.override(evaluator=fake_model):   # tests and benchmarks
+        ...
+    with registry.override(**{"interviewer.fast": fake_model}):   # one tier only
+        ...
+"""
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+DEFAULT_MODEL = "claude-sonnet-4-20250514"
+DEFAULT_FAST_MODEL = "claude-3-5-haiku-20241022"
+
+STANDARD_TIER = "standard"
+FAST_TIER = "fast"
+TIERS = (STANDARD_TIER, FAST_TIER)
+
+
+@dataclass(frozen=True)
+class RoleConfig:
+    """Model settings for one LLM role."""
+    model: str
+    temperature: float
+    max_tokens: int
+    # Called through a CallGuard, which does the retrying and timing out
+    guarded: bool = True
+
+
+# Built-in settings, overridable per role from the environment
+DEFAULT_ROLE_CONFIGS: Dict[str, RoleConfig] = {
+    "evaluator": RoleConfig(DEFAULT_MODEL, temperature=0.3, max_tokens=2048),
+    "interviewer": RoleConfig(DEFAULT_MODEL, temperature=0.3, max_tokens=1024),
+    "spec_parser": RoleConfig(DEFAULT_MODEL, temperature=0.2, max_tokens=2048, guarded=False),
+    "summarizer": RoleConfig(DEFAULT_MODEL, temperature=0.1, max_tokens=1500, guarded=False),
+    # Synthetic candidates in simulation sweeps (simulation.py)
+    "candidate": RoleConfig(DEFAULT_MODEL, temperature=0.7, max_tokens=512, guarded=False),
+}
+
+
+def role_config(role: str, tier: str = STANDARD_TIER) -> RoleConfig:
+    """Settings for `role` at `tier`, with environment overrides applied."""
+    if role not in DEFAULT_ROLE_CONFIGS:
+        raise ValueError(f"Unknown LLM role: {role}. Expected one of {tuple(DEFAULT_ROLE_CONFIGS)}")
+    if tier not in TIERS:
+        raise ValueError(f"Unknown LLM tier: {tier}. Expected one of {TIERS}")
+    default = DEFAULT_ROLE_CONFIGS[role]
+    prefix = f"LLM_{role.upper()}_"
+    if tier == FAST_TIER:
+        model = os.getenv(prefix + "FAST_MODEL") or os.getenv("LLM_FAST_MODEL") or DEFAULT_FAST_MODEL
+    else:
+        model = os.getenv(prefix + "MODEL") or os.getenv("LLM_MODEL") or default.model
+    return RoleConfig(
+        model=model,
+        temperature=float(os.getenv(prefix + "TEMPERATURE", default.temperature)),
+        max_tokens=int(os.getenv(prefix + "MAX_TOKENS", default.max_tokens)),
+        guarded=default.guarded,
+    )
+
+
+def _build_chat_anthropic(config: RoleConfig) -> Any:
+    """A ChatAnthropic client with the given settings."""
+    # Imported here so importing the agents doesn't pay for client setup
+    from langchain_anthropic import ChatAnthropic
+
+    settings: Dict[str, Any] = {}
+    if config.guarded:
+        settings = {"default_request_timeout": float(os.getenv("LLM_TIMEOUT_SECONDS", "20")), "max_retries": 0}
+    return ChatAnthropic(
+        model=config.model,
+        temperature=config.temperature,
+        max_tokens=config.max_tokens,
+        **settings,
+    )
+
+
+def _build_client(config: RoleConfig) -> Any:
+    """Default client factory: ChatAnthropic, behind the record/replay cache if enabled."""
+    from .cache import with_cache
+
+    return with_cache(lambda: _build_chat_anthropic(config), config)
+
+
+class LLMRegistry:
+    """Lazily built, shared LLM clients keyed by role and tier."""
+
+    def __init__(self, factory: Callable[[RoleConfig], Any] = _build_client):
+        self._factory = factory
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._overrides: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, role: str, tier: str = STANDARD_TIER) -> Any:
+        """The client for `role` at `tier`, built on first use."""
+        override = self._overrides.get(f"{role}.{tier}")
+        if override is None:
+            override = self._overrides.get(role)
+        if override is not None:
+            return override
+        client = self._clients.get((role, tier))
+        if client is None:
+            config = role_config(role, tier)
+            with self._lock:
+                client = self._clients.get((role, tier))
+                if client is None:
+                    client = self._clients[(role, tier)] = self._factory(config)
+        return client
+
+    @contextmanager
+    def override(self, **clients: Any) -> Iterator[None]:
+        """
+        Temporarily serve the given clients.
+
+        Keys are a role (every tier) or "role.tier" (one tier, taking
+        precedence over the role-wide override).
+        """
+        previous = {role: self._overrides.get(role) for role in clients}
+        self._overrides.update(clients)
+        try:
+            yield
+        finally:
+            for role, client in previous.items():
+                if client is None:
+                    self._overrides.pop(role, None)
+                else:
+                    self._overrides[role] = client
+
+    def reset(self) -> None:
+        """Drop built clients so the next get() picks up new configuration."""
+        with self._lock:
+            self._clients.clear()
+
+    def configs(self, tier: str = STANDARD_TIER) -> Dict[str, RoleConfig]:
+        """Current settings for every role at `tier`."""
+        return {role: role_config(role, tier) for role in DEFAULT_ROLE_CONFIGS}
+
+
+# Process-wide registry used by the agents and spec generators
+registry = LLMRegistry()
+
+
+def get_llm(role: str, tier: str = STANDARD_TIER) -> Any:
+    """The shared client for `role` ("evaluator", "interviewer", "spec_parser", "summarizer", "candidate")."""
+    return registry.get(role, tier)
@@ -0,0 +1,482 @@
+"""
+Deadlines, retries, hedging and circuit breaking for LLM calls.
+
+A turn runs under a time budget (`time_budget`), held in a context
+variable so it reaches every LLM call made during the turn, including
+calls on tasks and worker threads started from it. Each call is made
+through a CallGuard, which:
+
+- caps every attempt at the per-attempt timeout or the remaining budget,
+  whichever is sooner, and hands that cap to the call as its request
+  timeout, so a blocking call that is given up on ends with it instead
+  of running on in the background
+- retries transient failures (timeouts, connection errors, 408/409/429
+  and 5xx) with full-jitter exponential backoff
+- optionally sends a second, hedged request when the first has not
+  answered after a threshold, and takes whichever finishes first
+- fails fast while its circuit breaker is open
+
+When a call cannot be completed it raises LLMUnavailable, and the agents
+fall back to a degraded reply instead of leaving the candidate waiting.
+Errors that retrying can't fix (a 400 bad request, a 401/403 bad key or
+missing permission, a bug here) are raised as they are and leave the
+breaker alone, so a misconfiguration fails loudly instead of looking like
+a flaky provider.
+
+Environment:
+    LLM_TIMEOUT_SECONDS         per-attempt timeout (default 20)
+    LLM_MAX_RETRIES             retries after the first attempt (default 2)
+    LLM_RETRY_BASE_SECONDS      first backoff ceiling, doubled per retry (default 0.25)
+    LLM_RETRY_MAX_SECONDS       largest backoff ceiling (default 2)
+    LLM_HEDGE                   "off" (default), "p95" or a number of seconds
+    LLM_BREAKER_FAILURES        consecutive failures that open the breaker (default 5)
+    LLM_BREAKER_RESET_SECONDS   how long the breaker stays open (default 30)
+
+Usage:
+    from llm.resilience import CallGuard, time_budget
+
+    guard = CallGuard()
+    with time_budget(8.0):
+        response = guard.call(lambda timeout: llm.invoke(messages, timeout=timeout))
+"""
+import asyncio
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+DEFAULT_BREAKER_RESET_SECONDS = float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30"))
+
+# Status codes worth retrying: timeout, conflict, rate limit, provider errors
+_RETRYABLE_STATUS = (408, 409, 429)
+_TRANSIENT_ERROR_NAMES = ("APIConnectionError", "APITimeoutError")
+# asyncio.wait_for raises asyncio.TimeoutError, not the builtin, before 3.11
+_TIMEOUT_ERRORS = (TimeoutError, asyncio.TimeoutError)
+
+# Runs blocking calls so they can be abandoned when their time is up. Each
+# call carries its own request timeout, so an abandoned one frees its worker
+# (and its provider connection) by the end of its attempt.
+_call_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="llm-call")
+
+
+class LLMUnavailable(Exception):
+    """An LLM call could not complete within its budget, retries or breaker."""
+
+
+# =============================================================================
+# TIME BUDGET
+# =============================================================================
+
+class Deadline:
+    """A point in (monotonic) time by which a piece of work must finish."""
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+
+_deadline: ContextVar[Optional[Deadline]] = ContextVar("llm_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline LLM calls made here must meet, if any."""
+    return _deadline.get()
+
+
+@contextmanager
+def time_budget(seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """
+    Bound every LLM call in this block to `seconds` from now.
+
+    A nested budget can only shorten the enclosing one. None leaves the
+    current budget in place.
+    """
+    outer = _deadline.get()
+    if seconds is None:
+        yield outer
+        return
+    deadline = Deadline(seconds)
+    if outer is not None and outer.expires_at < deadline.expires_at:
+        deadline = outer
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+# =============================================================================
+# POLICY AND BREAKER
+# =============================================================================
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How hard a CallGuard tries before giving up."""
+    attempt_timeout_seconds: float = 20.0
+    max_retries: int = 2
+    backoff_base_seconds: float = 0.25
+    backoff_max_seconds: float = 2.0
+    hedge: str = "off"  # "off", "p95" or a number of seconds
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        return cls(
+            attempt_timeout_seconds=float(os.getenv("LLM_TIMEOUT_SECONDS", "20")),
+            max_retries=int(os.getenv("LLM_MAX_RETRIES", "2")),
+            backoff_base_seconds=float(os.getenv("LLM_RETRY_BASE_SECONDS", "0.25")),
+            backoff_max_seconds=float(os.getenv("LLM_RETRY_MAX_SECONDS", "2")),
+            hedge=os.getenv("LLM_HEDGE", "off").lower(),
+        )
+
+    def backoff(self, retry: int) -> float:
+        """Full-jitter delay before retry number `retry` (1-based)."""
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (retry - 1))
+        return random.uniform(0.0, ceiling)
+
+    def hedge_after(self, p95_seconds: Optional[float]) -> Optional[float]:
+        """Seconds to wait before hedging, or None to not hedge."""
+        if self.hedge in ("", "off", "0", "false", "no"):
+            return None
+        if self.hedge == "p95":
+            return p95_seconds
+        return float(self.hedge)
+
+
+class CircuitBreaker:
+    """
+    Stop calling a failing model for a while.
+
+    Opens after `failure_threshold` consecutive failures. Once
+    `reset_seconds` have passed, a single trial call is let through
+    (half-open); its success closes the breaker, its failure reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_BREAKER_FAILURES,
+        reset_seconds: float = DEFAULT_BREAKER_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at >= self.reset_seconds:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        """Whether a call may be made now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._clock() - self._opened_at < self.reset_seconds or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        """End a call without judging the model's health."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._trial_in_flight:
+                    self.opened += 1
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether a failed call is worth retrying."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status in _RETRYABLE_STATUS or status >= 500
+    return isinstance(error, (*_TIMEOUT_ERRORS, OSError)) or type(error).__name__ in _TRANSIENT_ERROR_NAMES
+
+
+# =============================================================================
+# GUARDED CALLS
+# =============================================================================
+
+class CallGuard:
+    """Retries, hedging and a circuit breaker around the calls to one model."""
+
+    def __init__(self, policy: Optional[RetryPolicy] = None, breaker: Optional[CircuitBreaker] = None):
+        self.policy = policy or RetryPolicy.from_env()
+        self.breaker = breaker or CircuitBreaker()
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.hedged = 0
+        self.timeouts = 0
+        self.short_circuited = 0
+        self.gave_up = 0
+
+    def call(self, fn: Callable[[float], T], p95_seconds: Optional[float] = None) -> T:
+        """
+        Run a blocking call under the current time budget.
+
+        `fn` receives the seconds left in its attempt and must pass them on
+        as the request timeout.
+        """
+        hedge_after = self.policy.hedge_after(p95_seconds)
+        retry = 0
+        while True:
+            timeout = self._begin_attempt()
+            try:
+                result = self._hedged(fn, timeout, hedge_after)
+            except Exception as error:
+                delay = self._after_failure(error, retry + 1)
+                retry += 1
+                time.sleep(delay)
+                continue
+            except BaseException:
+                # Interrupted, not failed: free a half-open trial for the next call
+                self.breaker.release()
+                raise
+            self.breaker.record_success()
+            return result
+
+    async def acall(self, make_call: Callable[[float], Awaitable[T]], p95_seconds: Optional[float] = None) -> T:
+        """Await a call under the current time budget; `make_call` receives its request timeout."""
+        hedge_after = self.policy.hedge_after(p95_seconds)
+        retry = 0
+        while True:
+            timeout = self._begin_attempt()
+            try:
+                result = await self._ahedged(make_call, timeout, hedge_after)
+            except asyncio.CancelledError:
+                # Cancelled, not failed: free a half-open trial for the next call
+                self.breaker.release()
+                raise
+            except Exception as error:
+                delay = self._after_failure(error, retry + 1)
+                retry += 1
+                await asyncio.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+    async def astream(self, make_stream: Callable[[], AsyncIterator[T]]) -> AsyncIterator[T]:
+        """
+        Stream a reply under the current time budget.
+
+        Attempts are retried only until the first chunk arrives; after
+        that, a stall or error ends the stream with LLMUnavailable.
+        """
+        retry = 0
+        while True:
+            timeout = self._begin_attempt()
+            stream = make_stream()
+            try:
+                first = await asyncio.wait_for(stream.__anext__(), timeout)
+            except StopAsyncIteration:
+                self.breaker.record_success()
+                return
+            except asyncio.CancelledError:
+                self.breaker.release()
+                await _aclose(stream)
+                raise
+            except Exception as error:
+                await _aclose(stream)
+                delay = self._after_failure(error, retry + 1)
+                retry += 1
+                await asyncio.sleep(delay)
+                continue
+            break
+
+        settled = False
+        try:
+            yield first
+            while True:
+                # A stall between chunks counts against the attempt timeout too
+                idle_timeout = min(self.policy.attempt_timeout_seconds, _remaining())
+                try:
+                    chunk = await asyncio.wait_for(stream.__anext__(), idle_timeout)
+                except StopAsyncIteration:
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception as error:
+                    settled = True
+                    if not is_transient(error):
+                        self.breaker.release()
+                        raise
+                    self._count_failure(error)
+                    self.breaker.record_failure()
+                    raise LLMUnavailable("LLM stream interrupted") from error
+                yield chunk
+            settled = True
+            self.breaker.record_success()
+        finally:
+            if not settled:
+                # Cancelled, or the consumer stopped reading (GeneratorExit)
+                self.breaker.release()
+            await _aclose(stream)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "hedged": self.hedged,
+                "timeouts": self.timeouts,
+                "short_circuited": self.short_circuited,
+                "gave_up": self.gave_up,
+                "breaker": self.breaker.state,
+                "breaker_opened": self.breaker.opened,
+            }
+
+    def _begin_attempt(self) -> float:
+        """Timeout for the next attempt; raises LLMUnavailable if none may be made."""
+        timeout = min(self.policy.attempt_timeout_seconds, _remaining())
+        if timeout <= 0:
+            with self._lock:
+                self.gave_up += 1
+            raise LLMUnavailable("Turn time budget exhausted")
+        if not self.breaker.allow():
+            with self._lock:
+                self.short_circuited += 1
+            raise LLMUnavailable("LLM circuit breaker is open")
+        return timeout
+
+    def _after_failure(self, error: Exception, retry: int) -> float:
+        """Record a failed attempt. Returns the backoff before the retry, or raises."""
+        if not is_transient(error):
+            # A request the provider will never accept, or a bug on our side:
+            # not an outage, so don't degrade around it or count it against the model
+            self.breaker.release()
+            raise error
+        self._count_failure(error)
+        self.breaker.record_failure()
+
+        delay = self.policy.backoff(retry)
+        if retry > self.policy.max_retries or delay >= _remaining():
+            with self._lock:
+                self.gave_up += 1
+            raise LLMUnavailable(f"LLM call failed: {error!r}") from error
+        with self._lock:
+            self.retries += 1
+        return delay
+
+    def _count_failure(self, error: BaseException) -> None:
+        if isinstance(error, _TIMEOUT_ERRORS):
+            with self._lock:
+                self.timeouts += 1
+
+    def _hedged(self, fn: Callable[[float], T], timeout: float, hedge_after: Optional[float]) -> T:
+        """Run `fn` on a worker thread, hedged once after `hedge_after` seconds."""
+        ends_at = time.monotonic() + timeout
+        pending = {_call_pool.submit(fn, timeout)}
+        if hedge_after is not None and hedge_after < timeout:
+            done, _ = wait(pending, timeout=hedge_after)
+            if not done:
+                # The hedge gets what is left of the attempt, not a fresh timeout
+                pending.add(_call_pool.submit(fn, ends_at - time.monotonic()))
+                with self._lock:
+                    self.hedged += 1
+
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, ends_at - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    _cancel(pending)
+                    return future.result()
+                error = future.exception()
+        _cancel(pending)
+        if pending or error is None:
+            raise TimeoutError(f"LLM call timed out after {timeout:.1f}s")
+        raise error
+
+    async def _ahedged(self, make_call: Callable[[float], Awaitable[T]], timeout: float, hedge_after: Optional[float]) -> T:
+        """Await `make_call()`, hedged once after `hedge_after` seconds."""
+        if hedge_after is None or hedge_after >= timeout:
+            return await asyncio.wait_for(make_call(timeout), timeout)
+
+        loop = asyncio.get_running_loop()
+        ends_at = loop.time() + timeout
+        pending = {asyncio.ensure_future(make_call(timeout))}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge_after)
+            if not done:
+                pending.add(asyncio.ensure_future(make_call(ends_at - loop.time())))
+                with self._lock:
+                    self.hedged += 1
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(0.0, ends_at - loop.time()), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            if pending or error is None:
+                raise TimeoutError(f"LLM call timed out after {timeout:.1f}s")
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def _remaining() -> float:
+    """Seconds left in the current time budget (unbounded without one)."""
+    deadline = _deadline.get()
+    return deadline.remaining() if deadline is not None else float("inf")
+
+
+def _cancel(futures: "set[Future]") -> None:
+    """Cancel queued calls; running ones finish on their own and are ignored."""
+    for future in futures:
+        future.cancel()
+
+
+async def _aclose(stream: Any) -> None:
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        try:
+            await aclose()
+        except Exception:
+            pass
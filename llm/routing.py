@@ -0,0 +1,271 @@
+"""
+Per-turn model routing.
+
+Not every turn needs the strongest model. An interview spec can list
+routing rules (InterviewSpec.routing) that send one agent's turn to the
+registry's "fast" tier when the turn is low-stakes: a rapport phase, a
+short answer that gets no help, or a closing turn. Anything no rule
+matches, and every legacy (spec-less) interview, uses the "standard"
+tier.
+
+Routed calls take an admission slot, run through a per-(agent, tier)
+CallGuard (retries, hedging, circuit breaker; see llm.resilience) and
+are timed and their tokens (uncached input, output, cache reads and
+writes) counted per (agent, tier), so the latency and cost savings are
+visible at /api/llm/stats. Each call also annotates the calling node's
+span (see telemetry) with its tier, prompt sizes, latency and time to
+first byte.
+
+Environment:
+    LLM_ROUTING     "on" (default) or "off" to send every call to "standard"
+
+Usage:
+    from llm.routing import route_llm
+
+    response = route_llm("interviewer", state).invoke(messages)
+"""
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from state import InterviewState, get_compiled_spec, last_of_role
+from telemetry import annotate_span, record_prompt
+
+from .admission import Priority, aadmit, admit, current_priority
+from .registry import STANDARD_TIER, get_llm
+from .resilience import CallGuard
+
+# Samples needed before a tier's p95 latency is trusted as a hedging threshold
+MIN_HEDGE_SAMPLES = 20
+
+TOKEN_KINDS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_write_tokens")
+
+
+def routing_enabled() -> bool:
+    """Whether spec routing rules are applied (LLM_ROUTING kill switch)."""
+    return os.getenv("LLM_ROUTING", "on").lower() not in ("off", "0", "false", "no")
+
+
+def select_tier(agent: str, state: InterviewState) -> str:
+    """
+    Pick the model tier for `agent`'s next call from the spec routing rules.
+
+    A rule matches when every condition it sets holds for the current
+    turn; the first matching rule wins.
+    """
+    compiled = get_compiled_spec(state)
+    if compiled is None or not compiled.routing or not routing_enabled():
+        return STANDARD_TIER
+
+    phase = (state.get("current_phase") or "").lower()
+    action = state.get("evaluator_action") or ""
+    directive = state.get("manager_directive") or {}
+    urgency = directive.get("urgency", "normal")
+    candidate_chars: Optional[int] = None
+
+    for rule in compiled.routing:
+        if rule.agent != agent:
+            continue
+        if rule.phases and phase not in rule.phases:
+            continue
+        if rule.evaluator_actions and action not in rule.evaluator_actions:
+            continue
+        if rule.urgencies and urgency not in rule.urgencies:
+            continue
+        if rule.max_candidate_chars is not None:
+            if candidate_chars is None:
+                last = last_of_role(state.get("messages") or [], "candidate")
+                candidate_chars = len(last["content"]) if last else 0
+            if candidate_chars > rule.max_candidate_chars:
+                continue
+        return rule.tier
+    return STANDARD_TIER
+
+
+# =============================================================================
+# PER-TIER STATS
+# =============================================================================
+
+@dataclass
+class TierStats:
+    """Call counts, latency and tokens by kind for one (agent, tier)."""
+    calls: int = 0
+    errors: int = 0
+    input_tokens: int = 0       # Uncached prompt tokens
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    latency_seconds: Deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+
+    def p95_seconds(self) -> Optional[float]:
+        """p95 latency, once there are enough samples to trust it."""
+        if len(self.latency_seconds) < MIN_HEDGE_SAMPLES:
+            return None
+        ordered = sorted(self.latency_seconds)
+        return ordered[int(len(ordered) * 0.95)]
+
+    def report(self) -> Dict[str, Any]:
+        ordered = sorted(self.latency_seconds)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            **{kind: getattr(self, kind) for kind in TOKEN_KINDS},
+            "latency_ms": {
+                "p50": round(ordered[len(ordered) // 2] * 1000, 1) if ordered else 0.0,
+                "p95": round(ordered[int(len(ordered) * 0.95)] * 1000, 1) if ordered else 0.0,
+            },
+        }
+
+
+_stats: Dict[Tuple[str, str], TierStats] = {}
+_guards: Dict[Tuple[str, str], CallGuard] = {}
+_stats_lock = threading.Lock()
+
+
+def _guard(agent: str, tier: str) -> CallGuard:
+    """The CallGuard (and circuit breaker) shared by every call to one (agent, tier)."""
+    guard = _guards.get((agent, tier))
+    if guard is None:
+        with _stats_lock:
+            guard = _guards.setdefault((agent, tier), CallGuard())
+    return guard
+
+
+def _p95_seconds(agent: str, tier: str) -> Optional[float]:
+    """The latency to hedge after, only worked out when hedging on p95 (LLM_HEDGE=p95)."""
+    if _guard(agent, tier).policy.hedge != "p95":
+        return None
+    with _stats_lock:
+        stats = _stats.get((agent, tier))
+        return stats.p95_seconds() if stats else None
+
+
+def _record(
+    agent: str,
+    tier: str,
+    started: float,
+    response: Any,
+    failed: bool,
+    first_byte: Optional[float] = None,
+) -> None:
+    """
+    Record one finished call. Latency excludes the admission queue wait and failed calls.
+
+    `first_byte` is when the first streamed chunk arrived; unstreamed
+    replies arrive all at once.
+    """
+    finished = time.perf_counter()
+    elapsed = finished - started
+    annotate_span(llm_seconds=elapsed, ttfb_seconds=None if failed else (first_byte or finished) - started)
+    # Imported here: the agents package imports this module
+    from agents.usage import extract_token_usage
+
+    usage = extract_token_usage(response) if response is not None else {}
+    with _stats_lock:
+        stats = _stats.setdefault((agent, tier), TierStats())
+        stats.calls += 1
+        stats.errors += int(failed)
+        for kind in TOKEN_KINDS:
+            setattr(stats, kind, getattr(stats, kind) + usage.get(kind, 0))
+        if not failed:
+            stats.latency_seconds.append(elapsed)
+
+
+def get_routing_report() -> Dict[str, Dict[str, Any]]:
+    """Per-agent, per-tier call stats, e.g. report["interviewer"]["fast"]["calls"]."""
+    with _stats_lock:
+        report: Dict[str, Dict[str, Any]] = {}
+        for (agent, tier), stats in sorted(_stats.items()):
+            report.setdefault(agent, {})[tier] = stats.report()
+        guards = dict(_guards)
+    for (agent, tier), guard in guards.items():
+        report.setdefault(agent, {}).setdefault(tier, TierStats().report()).update(guard.stats())
+    return report
+
+
+def reset_routing_stats() -> None:
+    """Clear the per-tier stats and circuit breakers."""
+    with _stats_lock:
+        _stats.clear()
+        _guards.clear()
+
+
+# =============================================================================
+# ROUTED CLIENT
+# =============================================================================
+
+class RoutedLLM:
+    """
+    The client chosen for one agent turn.
+
+    Exposes the invoke/ainvoke/astream calls the agents make, each under
+    an admission slot and the tier's CallGuard, and timed for the routing
+    report. Raises LLMUnavailable when the call cannot be completed within
+    the turn's time budget.
+    """
+
+    def __init__(self, agent: str, tier: str, priority: Priority = Priority.LIVE_TURN):
+        self.agent = agent
+        self.tier = tier
+        self.priority = priority
+
+    @property
+    def client(self) -> Any:
+        return get_llm(self.agent, self.tier)
+
+    def invoke(self, messages: List[Any]) -> Any:
+        record_prompt(messages)
+        annotate_span(tier=self.tier)
+        with admit(self.priority):
+            started = time.perf_counter()
+            response = None
+            try:
+                client = self.client
+                response = _guard(self.agent, self.tier).call(
+                    lambda timeout: client.invoke(messages, timeout=timeout), _p95_seconds(self.agent, self.tier)
+                )
+                return response
+            finally:
+                _record(self.agent, self.tier, started, response, failed=response is None)
+
+    async def ainvoke(self, messages: List[Any]) -> Any:
+        record_prompt(messages)
+        annotate_span(tier=self.tier)
+        async with aadmit(self.priority):
+            started = time.perf_counter()
+            response = None
+            try:
+                client = self.client
+                response = await _guard(self.agent, self.tier).acall(
+                    lambda timeout: client.ainvoke(messages, timeout=timeout), _p95_seconds(self.agent, self.tier)
+                )
+                return response
+            finally:
+                _record(self.agent, self.tier, started, response, failed=response is None)
+
+    async def astream(self, messages: List[Any]) -> AsyncIterator[Any]:
+        record_prompt(messages)
+        annotate_span(tier=self.tier)
+        async with aadmit(self.priority):
+            started = time.perf_counter()
+            response = None
+            first_byte = None
+            failed = True
+            try:
+                client = self.client
+                async for chunk in _guard(self.agent, self.tier).astream(lambda: client.astream(messages)):
+                    if response is None:
+                        first_byte = time.perf_counter()
+                    response = chunk if response is None else response + chunk
+                    yield chunk
+                failed = False
+            finally:
+                _record(self.agent, self.tier, started, response, failed=failed, first_byte=first_byte)
+
+
+def route_llm(agent: str, state: InterviewState, priority: Optional[Priority] = None) -> RoutedLLM:
+    """The routed client for `agent`'s call on this turn, at the context's priority by default."""
+    return RoutedLLM(agent, select_tier(agent, state), current_priority() if priority is None else priority)
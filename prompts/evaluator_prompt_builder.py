@@ -11,9 +11,12 @@ The evaluator:
 """
 
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
 
-from state import InterviewState, has_spec, get_heuristics, get_context_packet
+from state import InterviewState, has_spec, get_compiled_spec
+from specs.compiled import CompiledSpec
+from prompts.system_blocks import SEGMENT_SEPARATOR, to_system_blocks, system_blocks_text
+from prompts.render_cache import render_cache
 
 
 def build_evaluator_prompt(state: InterviewState) -> str:
@@ -29,63 +32,90 @@ def build_evaluator_prompt(state: InterviewState) -> str:
     Returns:
         Complete system prompt for the evaluator
     """
+    return system_blocks_text(build_evaluator_system_blocks(state))
+
+
+def build_evaluator_system_blocks(state: InterviewState) -> List[Dict[str, Any]]:
+    """
+    Build the evaluator system prompt as cacheable content blocks.
+
+    Same text as build_evaluator_prompt(), split into cache tiers with a
+    breakpoint after each one.
+
+    Args:
+        state: Current interview state
+
+    Returns:
+        List of system content blocks for a SystemMessage
+    """
     if has_spec(state):
-        return _build_spec_driven_evaluator_prompt(state)
+        # The evaluator prompt has no per-phase content: rendered once per spec
+        key = ("evaluator", get_compiled_spec(state).content_hash)
+        segments = render_cache.get(key, lambda: tuple(_build_spec_driven_evaluator_segments(state)))
+        return to_system_blocks(segments, cached_segments=3)
     else:
         # Fall back to legacy prompt
         from prompts.evaluator_prompt import get_evaluator_system_prompt
         from case_loader import get_case_data
-        case_data = get_case_data(state)
-        return get_evaluator_system_prompt(case_data)
+        key = ("evaluator_legacy", state.get("case_id"))
+        prompt = render_cache.get(key, lambda: get_evaluator_system_prompt(get_case_data(state)))
+        return to_system_blocks([prompt], cached_segments=1)
 
 
 def _build_spec_driven_evaluator_prompt(state: InterviewState) -> str:
     """Build an evaluator prompt driven by the InterviewSpec."""
+    return SEGMENT_SEPARATOR.join(s for s in _build_spec_driven_evaluator_segments(state) if s)
 
-    spec = state.get("interview_spec", {})
-    heuristics = get_heuristics(state) or {}
-    context_packet = get_context_packet(state) or {}
-
-    # Build sections
-    sections = []
-
-    # 1. Role and Purpose
-    sections.append(_build_evaluator_role_section(spec))
-
-    # 2. Context for Evaluation
-    sections.append(_build_evaluation_context_section(context_packet, state))
-
-    # 3. Competencies to Assess
-    sections.append(_build_competencies_section(spec))
 
-    # 4. Level Definitions (universal)
-    sections.append(_build_level_definitions_section())
-
-    # 5. Action Mapping
-    sections.append(_build_action_mapping_section(heuristics, spec))
-
-    # 6. Data Approval Rules (adapted by interview type)
-    sections.append(_build_data_approval_section(spec, heuristics))
-
-    # 7. Output Format
-    sections.append(_build_output_format_section(spec))
-
-    # 8. Critical Rules
-    sections.append(_build_critical_rules_section(heuristics, spec))
-
-    return "\n\n".join(sections)
+def _build_spec_driven_evaluator_segments(state: InterviewState) -> List[str]:
+    """
+    Build the spec-driven evaluator prompt as one segment per cache tier.
 
+    Global content comes first, then content shared by every interview of
+    the same template, then this session's materials. The evaluator has no
+    per-phase content; per-turn content goes in the user message.
+    """
 
-def _build_evaluator_role_section(spec: Dict[str, Any]) -> str:
+    spec = get_compiled_spec(state)
+    heuristics = spec.heuristics
+    context_packet = spec.context_packet
+
+    # Global: level scale shared by every interview
+    global_sections = [
+        _build_level_definitions_section(),
+    ]
+
+    # Template: role, competencies, actions and rules for this interview type
+    template_sections = [
+        _build_evaluator_role_section(spec),
+        _build_competencies_section(spec),
+        _build_action_mapping_section(heuristics, spec),
+        _build_data_approval_section(spec, heuristics),
+        _build_output_format_section(spec),
+        _build_critical_rules_section(heuristics, spec),
+    ]
+
+    # Session: this interview's title and what good looks like
+    session_sections = [
+        _build_evaluation_title_section(spec),
+        _build_evaluation_context_section(context_packet, state),
+    ]
+
+    return [
+        SEGMENT_SEPARATOR.join(global_sections),
+        SEGMENT_SEPARATOR.join(template_sections),
+        SEGMENT_SEPARATOR.join(session_sections),
+    ]
+
+
+def _build_evaluator_role_section(spec: CompiledSpec) -> str:
     """Build the evaluator's role description."""
 
-    interview_type = spec.get("interview_type", "interview")
-    title = spec.get("title", "Interview")
+    interview_type = spec.interview_type or "interview"
 
     return f"""# YOUR ROLE: Assessment Authority
 
 You are the assessment authority for this {interview_type.replace("_", " ")} interview.
-**Interview:** {title}
 
 Your job is to:
 1. Assess the candidate's performance on EACH competency (1-5 scale)
@@ -96,6 +126,16 @@ Your job is to:
 You do NOT interact with the candidate directly. You provide guidance to the interviewer."""
 
 
+def _build_evaluation_title_section(spec: CompiledSpec) -> str:
+    """Build the header naming the interview being evaluated."""
+
+    title = spec.title
+
+    return f"""# THIS INTERVIEW
+
+**Interview:** {title}"""
+
+
 def _build_evaluation_context_section(context_packet: Dict[str, Any], state: InterviewState) -> str:
     """Build context about what's being evaluated."""
 
@@ -285,28 +325,23 @@ def _format_calibration_examples(calibration: Dict[str, Any]) -> str:
     return "\n".join(sections)
 
 
-def _build_competencies_section(spec: Dict[str, Any]) -> str:
+def _build_competencies_section(spec: CompiledSpec) -> str:
     """Build the competencies to assess section."""
 
-    competencies = spec.get("competencies", [])
+    competencies = spec.competencies
 
     if not competencies:
         return "## COMPETENCIES TO ASSESS\n\nNo specific competencies defined."
 
-    # Import universal rubric
-    try:
-        from specs.spec_schema import UNIVERSAL_RUBRIC
-    except ImportError:
-        UNIVERSAL_RUBRIC = {}
-
     sections = ["---\n\n## COMPETENCIES TO ASSESS\n"]
     sections.append("Score EACH competency independently on a 1-5 scale.\n")
 
     for comp in competencies:
-        comp_id = comp.get("competency_id", "")
-        tier = comp.get("tier", "important")
+        comp_id = comp.competency_id
+        tier = comp.tier
 
-        full_comp = UNIVERSAL_RUBRIC.get(comp_id)
+        # Rubric definitions are resolved when the spec is compiled
+        full_comp = comp.rubric
         if not full_comp:
             sections.append(f"### {comp_id} [{tier.upper()}]\nCompetency not found in rubric.\n")
             continue
@@ -329,8 +364,8 @@ def _build_competencies_section(spec: Dict[str, Any]) -> str:
                 sections.append(f"- **{level_num} ({level.name}):** {indicators}")
 
         # Show flags
-        all_red = list(full_comp.red_flags) + comp.get("additional_red_flags", [])
-        all_green = list(full_comp.green_flags) + comp.get("additional_green_flags", [])
+        all_red = list(full_comp.red_flags) + list(comp.additional_red_flags)
+        all_green = list(full_comp.green_flags) + list(comp.additional_green_flags)
 
         if all_red:
             sections.append(f"\nRed Flags: {'; '.join(all_red[:3])}")
@@ -360,12 +395,12 @@ Note: Level 0 means "not yet assessed" - only use when you have no signal for th
 ---"""
 
 
-def _build_action_mapping_section(heuristics: Dict[str, Any], spec: Dict[str, Any] = None) -> str:
+def _build_action_mapping_section(heuristics: Mapping[str, Any], spec: Optional[CompiledSpec] = None) -> str:
     """Build the action mapping section, informed by heuristics and interview type."""
 
     hint_philosophy = heuristics.get("hint_philosophy", "")
     rescue_policy = heuristics.get("rescue_policy", "")
-    interview_type = spec.get("interview_type", "case") if spec else "case"
+    interview_type = spec.interview_type if spec else "case"
 
     # First round uses different action philosophy
     if interview_type == "first_round":
@@ -442,10 +477,10 @@ Based on the LOWEST critical competency score, recommend one of:
 ---"""
 
 
-def _build_data_approval_section(spec: Dict[str, Any], heuristics: Dict[str, Any]) -> str:
+def _build_data_approval_section(spec: CompiledSpec, heuristics: Mapping[str, Any]) -> str:
     """Build data approval rules based on interview type."""
 
-    interview_type = spec.get("interview_type", "case")
+    interview_type = spec.interview_type
     data_revelation = heuristics.get("data_revelation", "")
 
     if interview_type == "first_round":
@@ -492,12 +527,11 @@ Only approve data for sharing when the candidate has EARNED it:
 ---"""
 
 
-def _build_output_format_section(spec: Dict[str, Any]) -> str:
+def _build_output_format_section(spec: CompiledSpec) -> str:
     """Build the output format section with competency scores."""
 
-    competencies = spec.get("competencies", [])
-    comp_ids = [c.get("competency_id", "") for c in competencies]
-    interview_type = spec.get("interview_type", "case")
+    comp_ids = spec.competency_ids
+    interview_type = spec.interview_type
 
     # Build competency scores example
     scores_example = ",\n        ".join([
@@ -538,10 +572,10 @@ You MUST respond with valid JSON:
 ---"""
 
 
-def _build_critical_rules_section(heuristics: Dict[str, Any], spec: Dict[str, Any] = None) -> str:
+def _build_critical_rules_section(heuristics: Mapping[str, Any], spec: Optional[CompiledSpec] = None) -> str:
     """Build critical rules for the evaluator."""
 
-    interview_type = spec.get("interview_type", "case") if spec else "case"
+    interview_type = spec.interview_type if spec else "case"
 
     # First round has different critical rules
     if interview_type == "first_round":
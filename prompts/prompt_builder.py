@@ -10,9 +10,19 @@ The interviewer is a "Method Actor" - same core capabilities, different script.
 """
 
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping
 
-from state import InterviewState, has_spec, get_heuristics, get_context_packet, get_current_phase_config
+from state import (
+    InterviewState,
+    has_spec,
+    get_compiled_spec,
+    get_heuristics,
+    get_context_packet,
+    get_current_phase_config,
+)
+from specs.compiled import CompiledSpec
+from prompts.system_blocks import SEGMENT_SEPARATOR, to_system_blocks, system_blocks_text
+from prompts.render_cache import render_cache
 
 
 # =============================================================================
@@ -135,60 +145,101 @@ def build_interviewer_prompt(state: InterviewState) -> str:
     Returns:
         Complete system prompt for the interviewer
     """
+    return system_blocks_text(build_interviewer_system_blocks(state))
+
+
+def build_interviewer_system_blocks(state: InterviewState) -> List[Dict[str, Any]]:
+    """
+    Build the interviewer system prompt as cacheable content blocks.
+
+    Same text as build_interviewer_prompt(), split so the stable prefix
+    carries prompt-cache breakpoints.
+
+    Args:
+        state: Current interview state
+
+    Returns:
+        List of system content blocks for a SystemMessage
+    """
     if has_spec(state):
-        return _build_spec_driven_prompt(state)
+        # Rendered once per (spec, phase) and shared across sessions
+        key = ("interviewer", get_compiled_spec(state).content_hash, state.get("current_phase"))
+        segments = render_cache.get(key, lambda: tuple(_build_spec_driven_segments(state)))
+        return to_system_blocks(segments, cached_segments=4)
     else:
         # Fall back to legacy prompt for backward compatibility
         from prompts.interviewer_prompt import get_interviewer_system_prompt
-        case_data = _extract_legacy_case_data(state)
-        return get_interviewer_system_prompt(case_data)
+        key = ("interviewer_legacy", state.get("case_id"))
+        prompt = render_cache.get(
+            key, lambda: get_interviewer_system_prompt(_extract_legacy_case_data(state))
+        )
+        return to_system_blocks([prompt], cached_segments=1)
 
 
 def _build_spec_driven_prompt(state: InterviewState) -> str:
     """Build a prompt driven by the InterviewSpec."""
+    return SEGMENT_SEPARATOR.join(s for s in _build_spec_driven_segments(state) if s)
 
-    spec = state.get("interview_spec", {})
-    heuristics = get_heuristics(state) or {}
-    context_packet = get_context_packet(state) or {}
-    phase_config = get_current_phase_config(state)
-
-    # Build the prompt in sections
-    sections = []
-
-    # 1. Role and Persona
-    sections.append(_build_persona_section(heuristics, spec))
-
-    # 2. Context Materials (what the interviewer "sees")
-    sections.append(_build_context_section(context_packet, state))
 
-    # 3. Behavioral Heuristics
-    sections.append(_build_heuristics_section(heuristics, phase_config))
+def _build_spec_driven_segments(state: InterviewState) -> List[str]:
+    """
+    Build the spec-driven prompt as one segment per cache tier.
 
-    # 4. Universal Methodology (adapted by heuristics)
-    sections.append(UNIVERSAL_METHODOLOGY)
+    Tiers run from most to least widely shared so that the cached prefix
+    of one interview can be reused by every other interview of the same
+    type. Per-turn content (guidance, transcript) goes in the user message.
+    """
 
-    # 5. Response Patterns (may be overridden by heuristics)
-    sections.append(_build_response_patterns_section(heuristics))
+    spec = get_compiled_spec(state)
+    heuristics = spec.heuristics
+    context_packet = spec.context_packet
+    phase_config = get_current_phase_config(state)
 
-    # 6. Current Phase Guidance
+    # Global: methodology shared by every interview
+    global_sections = [
+        UNIVERSAL_METHODOLOGY,
+        RESPONSE_PATTERNS,
+    ]
+
+    # Template: persona, heuristics and style from the interview template
+    template_sections = [
+        _build_persona_section(heuristics, spec),
+        _build_heuristics_section(heuristics),
+        _build_style_section(heuristics),
+    ]
+
+    # Session: this interview's title and materials
+    session_sections = [
+        _build_title_section(spec),
+        _build_context_section(context_packet, state),
+    ]
+
+    # Phase: current phase guidance and heuristic overrides
+    phase_sections = []
     if phase_config:
-        sections.append(_build_phase_section(phase_config))
+        phase_sections.append(_build_phase_section(phase_config))
+        overrides = _build_heuristic_overrides_section(phase_config)
+        if overrides:
+            phase_sections.append(overrides)
 
-    return "\n\n".join(sections)
+    return [
+        SEGMENT_SEPARATOR.join(global_sections),
+        SEGMENT_SEPARATOR.join(template_sections),
+        SEGMENT_SEPARATOR.join(session_sections),
+        SEGMENT_SEPARATOR.join(phase_sections),
+    ]
 
 
-def _build_persona_section(heuristics: Dict[str, Any], spec: Dict[str, Any]) -> str:
+def _build_persona_section(heuristics: Mapping[str, Any], spec: CompiledSpec) -> str:
     """Build the persona/role section."""
 
-    interview_type = spec.get("interview_type", "interview")
-    title = spec.get("title", "Interview")
+    interview_type = spec.interview_type or "interview"
     tone = heuristics.get("tone", "Professional and warm.")
     persona = heuristics.get("persona_description", "You are an experienced interviewer.")
 
     return f"""# YOUR ROLE
 
 **Interview Type:** {interview_type.replace("_", " ").title()}
-**Title:** {title}
 
 **Tone:** {tone}
 
@@ -197,6 +248,16 @@ def _build_persona_section(heuristics: Dict[str, Any], spec: Dict[str, Any]) ->
 Remember: You are executing methodology, not assessing. The evaluator handles assessment."""
 
 
+def _build_title_section(spec: CompiledSpec) -> str:
+    """Build the header naming this interview."""
+
+    title = spec.title
+
+    return f"""# THIS INTERVIEW
+
+**Title:** {title}"""
+
+
 def _build_context_section(context_packet: Dict[str, Any], state: InterviewState) -> str:
     """Build the context/materials section based on packet type."""
 
@@ -344,73 +405,69 @@ def _build_legacy_context(state: InterviewState) -> str:
 ---"""
 
 
-def _build_heuristics_section(heuristics: Dict[str, Any], phase_config: Optional[Dict[str, Any]]) -> str:
+def _build_heuristics_section(heuristics: Dict[str, Any]) -> str:
     """Build the behavioral heuristics section."""
 
-    # Get base heuristics
-    primary_mode = heuristics.get("primary_mode", "")
-    silence_tolerance = heuristics.get("silence_tolerance", "")
-    hint_philosophy = heuristics.get("hint_philosophy", "")
-    rescue_policy = heuristics.get("rescue_policy", "")
-    pushback_style = heuristics.get("pushback_style", "")
-    follow_up_depth = heuristics.get("follow_up_depth", "")
-    data_revelation = heuristics.get("data_revelation", "")
-
-    # Check for phase-specific overrides
-    if phase_config:
-        overrides = phase_config.get("heuristic_overrides", {})
-        if "pushback_style" in overrides:
-            pushback_style = overrides["pushback_style"]
-        if "hint_philosophy" in overrides:
-            hint_philosophy = overrides["hint_philosophy"]
-        if "data_revelation" in overrides:
-            data_revelation = overrides["data_revelation"]
-        if "primary_mode" in overrides:
-            primary_mode = overrides["primary_mode"]
-
     return f"""---
 
 ## YOUR BEHAVIORAL HEURISTICS
 
-**Primary Mode:** {primary_mode}
+**Primary Mode:** {heuristics.get("primary_mode", "")}
 
-**Silence Tolerance:** {silence_tolerance}
+**Silence Tolerance:** {heuristics.get("silence_tolerance", "")}
 
-**Hint Philosophy:** {hint_philosophy}
+**Hint Philosophy:** {heuristics.get("hint_philosophy", "")}
 
-**Rescue Policy:** {rescue_policy}
+**Rescue Policy:** {heuristics.get("rescue_policy", "")}
 
-**Pushback Style:** {pushback_style}
+**Pushback Style:** {heuristics.get("pushback_style", "")}
 
-**Follow-up Depth:** {follow_up_depth}
+**Follow-up Depth:** {heuristics.get("follow_up_depth", "")}
 
-**Data/Information Revelation:** {data_revelation}
+**Data/Information Revelation:** {heuristics.get("data_revelation", "")}
 
 ---"""
 
 
-def _build_response_patterns_section(heuristics: Dict[str, Any]) -> str:
-    """Build response patterns, incorporating heuristics."""
+def _build_style_section(heuristics: Dict[str, Any]) -> str:
+    """Build the opening/closing style guidance from heuristics."""
 
-    # Start with universal patterns
-    patterns = RESPONSE_PATTERNS
-
-    # Add heuristics-specific guidance
     opening_style = heuristics.get("opening_style", "")
     closing_style = heuristics.get("closing_style", "")
 
-    if opening_style or closing_style:
-        patterns += f"""
----
+    if not (opening_style or closing_style):
+        return ""
 
-## OPENING AND CLOSING
+    return f"""## OPENING AND CLOSING
 
 **Opening Style:** {opening_style}
 
-**Closing Style:** {closing_style}
-"""
+**Closing Style:** {closing_style}"""
 
-    return patterns
+
+def _build_heuristic_overrides_section(phase_config: Dict[str, Any]) -> str:
+    """Build the heuristics the current phase overrides, if any."""
+
+    overrides = phase_config.get("heuristic_overrides", {})
+    labels = [
+        ("primary_mode", "Primary Mode"),
+        ("hint_philosophy", "Hint Philosophy"),
+        ("pushback_style", "Pushback Style"),
+        ("data_revelation", "Data/Information Revelation"),
+    ]
+    lines = [f"**{label}:** {overrides[key]}" for key, label in labels if key in overrides]
+    if not lines:
+        return ""
+
+    overrides_text = "\n\n".join(lines)
+
+    return f"""## HEURISTIC OVERRIDES FOR THIS PHASE
+
+These replace the matching behavioral heuristics until the phase changes.
+
+{overrides_text}
+
+---"""
 
 
 def _build_phase_section(phase_config: Dict[str, Any]) -> str:
@@ -510,25 +567,18 @@ def build_competency_context(state: InterviewState) -> str:
     if not has_spec(state):
         return ""
 
-    spec = state.get("interview_spec", {})
-    competencies = spec.get("competencies", [])
+    competencies = get_compiled_spec(state).competencies
 
     if not competencies:
         return ""
 
-    # Import the universal rubric to get full definitions
-    try:
-        from specs.spec_schema import UNIVERSAL_RUBRIC
-    except ImportError:
-        return ""
-
     sections = ["## COMPETENCIES BEING ASSESSED\n"]
 
     for comp in competencies:
-        comp_id = comp.get("competency_id", "")
-        tier = comp.get("tier", "important")
+        tier = comp.tier
 
-        full_comp = UNIVERSAL_RUBRIC.get(comp_id)
+        # Rubric definitions are resolved when the spec is compiled
+        full_comp = comp.rubric
         if not full_comp:
             continue
 
@@ -549,8 +599,8 @@ def build_competency_context(state: InterviewState) -> str:
                 sections.append(f"- Level {level_num} ({level.name}): {level.description}")
 
         # Add flags
-        all_red = list(full_comp.red_flags) + comp.get("additional_red_flags", [])
-        all_green = list(full_comp.green_flags) + comp.get("additional_green_flags", [])
+        all_red = list(full_comp.red_flags) + list(comp.additional_red_flags)
+        all_green = list(full_comp.green_flags) + list(comp.additional_green_flags)
 
         if all_red:
             sections.append(f"\n**Red Flags:** {', '.join(all_red[:3])}")
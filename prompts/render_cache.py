@@ -0,0 +1,76 @@
+"""
+Memoized system-prompt rendering.
+
+A spec-driven system prompt only changes when the spec or the current phase
+changes, so rendered prompts are cached under (agent, spec content hash,
+phase) and shared by every session running the same spec. The content hash
+comes from the compiled spec (see specs/compiled.py).
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("PROMPT_RENDER_CACHE_SIZE", "256"))
+
+
+class PromptRenderCache:
+    """Thread-safe LRU cache of rendered prompts with hit/miss counters."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, render: Callable[[], T]) -> T:
+        """Return the cached value for `key`, rendering it on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Render outside the lock; a concurrent miss renders the same value
+        value = render()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Process-wide cache used by the prompt builders
+render_cache = PromptRenderCache()
+
+
+def get_render_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the process-wide prompt render cache."""
+    return render_cache.stats()
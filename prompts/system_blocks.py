@@ -0,0 +1,50 @@
+"""
+Structured system prompts with prompt-cache breakpoints.
+
+The prompt builders split each system prompt into tiers ordered from most
+to least widely shared:
+
+    global -> template -> session -> phase
+
+Per-turn content (guidance, transcript) stays in the user message. Each
+tier becomes an Anthropic text block ending in a `cache_control`
+breakpoint, so one cached prefix serves every interview of the same type
+and the session/phase tiers are reused across turns.
+"""
+from typing import Dict, Any, List
+
+# Anthropic's ephemeral prompt cache
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# The API allows at most 4 cache breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+
+SEGMENT_SEPARATOR = "\n\n"
+
+
+def to_system_blocks(segments: List[str], cached_segments: int) -> List[Dict[str, Any]]:
+    """
+    Turn prompt segments into system content blocks.
+
+    Args:
+        segments: Prompt segments, most stable first. Empty segments are dropped.
+        cached_segments: How many leading segments end with a cache breakpoint.
+
+    Returns:
+        List of {"type": "text", "text": ...} blocks for a SystemMessage
+    """
+    cached_segments = min(cached_segments, MAX_CACHE_BREAKPOINTS)
+    blocks = []
+    for index, text in enumerate(segments):
+        if not text:
+            continue
+        block: Dict[str, Any] = {"type": "text", "text": text}
+        if index < cached_segments:
+            block["cache_control"] = dict(CACHE_CONTROL)
+        blocks.append(block)
+    return blocks
+
+
+def system_blocks_text(blocks: List[Dict[str, Any]]) -> str:
+    """Flatten system blocks back into a single prompt string."""
+    return SEGMENT_SEPARATOR.join(block["text"] for block in blocks)
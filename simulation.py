@@ -0,0 +1,431 @@
+"""
+Synthetic-candidate simulation engine.
+
+Runs many persona x case x interview-type interviews concurrently, each
+one an InterviewRunner answered by a synthetic candidate, and collects
+per-competency level trajectories as rows (one per run, turn and
+competency) for calibration sweeps.
+
+Interviews run as asyncio tasks on a bounded pool: at most `concurrency`
+are in flight at once, and their evaluator, interviewer and candidate
+LLM calls overlap on one event loop. Every run gets a seed derived from
+the sweep's seed in grid order, so the same sweep always produces the
+same runs; scripted candidates pick their answers with it and LLM
+candidates carry it in their prompt, which keeps replicates distinct
+and replayable from the LLM cache (see llm/cache.py).
+
+LLM candidates use the registry's "candidate" role (LLM_CANDIDATE_MODEL
+and friends). Every LLM call of a simulated interview, the candidate's
+and the runner's evaluator and interviewer calls alike, takes admission
+slots at the lowest priority, so a large sweep queues behind live
+interviews instead of overrunning the provider's rate limits.
+
+Usage:
+    from simulation import build_scenarios, run_simulation
+
+    scenarios = build_scenarios(["strong", "weak"], ["legacy_case", "technical"], repeats=5)
+    result = run_simulation(scenarios, concurrency=16, max_turns=6)
+    result.write_csv("trajectories.csv")
+
+    python simulation.py --personas strong weak --types legacy_case case technical \\
+        --repeats 5 --concurrency 16 --turns 6 --csv trajectories.csv [--scripted]
+"""
+import asyncio
+import csv
+import random
+import statistics
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from langchain_core.messages import HumanMessage
+
+from case_loader import get_available_cases, initialize_interview_state, load_case
+from graph import InterviewRunner
+from interview_factory import create_case_interview, create_first_round_interview_simple, create_technical_interview
+from llm.admission import Priority, aadmit
+from llm.registry import get_llm
+
+INTERVIEW_TYPES = ("legacy_case", "case", "first_round", "technical")
+
+
+# =============================================================================
+# PERSONAS
+# =============================================================================
+
+@dataclass(frozen=True)
+class Persona:
+    """A kind of candidate: a prompt for LLM candidates, lines for scripted ones."""
+    name: str
+    prompt: str
+    lines: Sequence[str]
+
+
+PERSONAS: Dict[str, Persona] = {
+    "strong": Persona(
+        name="strong",
+        prompt="""You are an excellent consulting candidate with McKinsey experience.
+When asked case questions:
+- Always structure your thinking clearly using frameworks (e.g., profit = revenue - costs)
+- Use MECE principles (Mutually Exclusive, Collectively Exhaustive)
+- Ask smart clarifying questions before diving in
+- Do mental math accurately and quickly
+- Give crisp, CEO-ready summaries
+- Reference relevant business concepts and best practices
+
+Respond naturally but demonstrate strong analytical thinking.""",
+        lines=(
+            "Before I dive in, is the decline in absolute terms or in margin? I'd split it into revenue and costs.",
+            "That's 12% of the base, so the gap is mostly volume. I'd check whether it's concentrated in a segment.",
+            "Three hypotheses, mutually exclusive: pricing, mix and unit costs. Mix is cheapest to test first.",
+            "So the driver is clear. I'd recommend acting on it within the quarter, and the main risk is execution.",
+        ),
+    ),
+    "average": Persona(
+        name="average",
+        prompt="""You are an average candidate with some business background.
+When asked case questions:
+- Provide decent but not exceptional structure
+- Cover the basics but miss some nuances
+- Do calculations correctly but slowly
+- Give reasonable but generic answers
+- Sometimes ask for hints when stuck
+
+Respond naturally with moderate analytical ability.""",
+        lines=(
+            "I think I'd look at revenue and costs to start with.",
+            "Let me work that out... it comes to roughly 10%, I think.",
+            "Maybe it's competition? Could you give me a hint on where to look?",
+            "I'd probably suggest cutting costs and improving marketing.",
+        ),
+    ),
+    "weak": Persona(
+        name="weak",
+        prompt="""You are a nervous candidate with no consulting experience.
+When asked case questions:
+- Give rambling, unstructured responses
+- Miss obvious analytical frameworks
+- Struggle with basic math calculations
+- Focus on irrelevant details
+- Avoid directly answering questions
+- Show confusion about business concepts
+
+Respond naturally but show signs of struggling with the material.""",
+        lines=(
+            "Um, I'm not sure. Maybe the logo or the store music is putting people off?",
+            "I'm not great with numbers... is it about half? Or maybe double.",
+            "There are lots of things it could be, like the weather, or people's moods.",
+            "I guess they should just try harder with everything.",
+        ),
+    ),
+}
+
+
+# =============================================================================
+# INTERVIEW CONTENT
+# =============================================================================
+
+TECHNICAL_PROBLEMS: Dict[str, Dict[str, Any]] = {
+    "rate_limiter": {
+        "id": "rate_limiter",
+        "title": "API Rate Limiter",
+        "problem_statement": "Design a rate limiter for a public API that allows N requests per key per minute.",
+        "expected_complexity": "O(1) per request",
+        "hints": [
+            {"level": 1, "hint": "Consider a token bucket per key", "score_impact": "none"},
+            {"level": 2, "hint": "Think about refilling lazily on each request", "score_impact": "minor"},
+        ],
+    },
+    "two_sum": {
+        "id": "two_sum",
+        "title": "Two Sum",
+        "problem_statement": "Given an array of integers and a target, return the indices of two numbers that add up to it.",
+        "expected_complexity": "O(n)",
+        "hints": [{"level": 1, "hint": "Consider using a hash map", "score_impact": "minor"}],
+    },
+}
+
+FIRST_ROUND_ROLES: Dict[str, Dict[str, str]] = {
+    "data_engineer": {
+        "role_title": "Senior Data Engineer",
+        "job_description": "Own our batch and streaming data pipelines. 5+ years with Spark, Airflow and Kafka.",
+        "candidate_cv": "Data engineer, 4 years at a logistics company. Airflow, Spark; Kafka on side projects.",
+    },
+    "product_manager": {
+        "role_title": "Senior Product Manager",
+        "job_description": "Lead a B2B analytics product. 5+ years of product management, strong with data.",
+        "candidate_cv": "Product manager, 6 years across two SaaS startups. Launched a reporting suite.",
+    },
+}
+
+
+def available_content(interview_type: str) -> List[str]:
+    """Case, problem or role ids an interview type can be run with."""
+    if interview_type in ("legacy_case", "case"):
+        return sorted(get_available_cases())
+    if interview_type == "technical":
+        return sorted(TECHNICAL_PROBLEMS)
+    if interview_type == "first_round":
+        return sorted(FIRST_ROUND_ROLES)
+    raise ValueError(f"Unknown interview type: {interview_type}. Expected one of {INTERVIEW_TYPES}")
+
+
+def create_runner(interview_type: str, case_id: str, session_id: str) -> InterviewRunner:
+    """A fresh runner for one interview of `interview_type` on `case_id`, admitted at SIMULATION priority."""
+    if interview_type == "legacy_case":
+        state = initialize_interview_state(case_id)
+        state["session_id"] = session_id
+        runner = InterviewRunner(state)
+    elif interview_type == "case":
+        runner = create_case_interview({"id": case_id, **load_case(case_id)}, session_id=session_id)
+    elif interview_type == "technical":
+        runner = create_technical_interview(TECHNICAL_PROBLEMS[case_id], session_id=session_id)
+    elif interview_type == "first_round":
+        runner = create_first_round_interview_simple(**FIRST_ROUND_ROLES[case_id], session_id=session_id)
+    else:
+        raise ValueError(f"Unknown interview type: {interview_type}. Expected one of {INTERVIEW_TYPES}")
+    runner.priority = Priority.SIMULATION
+    return runner
+
+
+# =============================================================================
+# SCENARIOS
+# =============================================================================
+
+@dataclass(frozen=True)
+class Scenario:
+    """One simulated interview."""
+    run_id: str
+    persona: str
+    interview_type: str
+    case_id: str
+    seed: int
+
+
+def build_scenarios(
+    personas: Sequence[str] = tuple(PERSONAS),
+    interview_types: Sequence[str] = INTERVIEW_TYPES,
+    cases: Optional[Sequence[str]] = None,
+    repeats: int = 1,
+    seed: int = 0,
+) -> List[Scenario]:
+    """
+    The persona x case x interview-type grid, `repeats` times over.
+
+    `cases` limits each interview type to the listed ids it supports; by
+    default every case, problem or role available for the type is used.
+    """
+    rng = random.Random(seed)
+    scenarios = []
+    for interview_type in interview_types:
+        content = [c for c in available_content(interview_type) if cases is None or c in cases]
+        for case_id in content:
+            for persona in personas:
+                if persona not in PERSONAS:
+                    raise ValueError(f"Unknown persona: {persona}. Expected one of {tuple(PERSONAS)}")
+                for repeat in range(repeats):
+                    scenarios.append(Scenario(
+                        run_id=f"{interview_type}-{case_id}-{persona}-{repeat}",
+                        persona=persona,
+                        interview_type=interview_type,
+                        case_id=case_id,
+                        seed=rng.randrange(2 ** 31),
+                    ))
+    return scenarios
+
+
+# =============================================================================
+# CANDIDATES
+# =============================================================================
+
+class LLMCandidate:
+    """A candidate answered in character by the registry's "candidate" model, or by `llm`."""
+
+    def __init__(self, persona: Persona, seed: int, llm: Any = None):
+        self.persona = persona
+        self.seed = seed
+        self.llm = llm
+
+    async def reply(self, interviewer_message: str, history: str) -> str:
+        context = f"""
+You are synthetic candidate #{self.seed}.
+{self.persona.prompt}
+
+## Conversation So Far
+{history}
+
+## Interviewer's Latest Message
+{interviewer_message}
+
+Respond as the candidate would. Keep your response focused and conversational (2-4 sentences typically).
+"""
+        llm = self.llm if self.llm is not None else get_llm("candidate")
+        async with aadmit(Priority.SIMULATION):
+            response = await llm.ainvoke([HumanMessage(content=context)])
+        return response.content
+
+
+class ScriptedCandidate:
+    """A candidate answering with the persona's canned lines, in seeded order. Needs no LLM."""
+
+    def __init__(self, persona: Persona, seed: int):
+        self.persona = persona
+        self._random = random.Random(seed)
+
+    async def reply(self, interviewer_message: str, history: str) -> str:
+        return self._random.choice(self.persona.lines)
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+@dataclass
+class SimulationResult:
+    """Per-turn, per-competency level rows plus one summary per run."""
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    runs: List[Dict[str, Any]] = field(default_factory=list)
+
+    def write_csv(self, path: str) -> None:
+        """Write the trajectory rows as CSV."""
+        columns = ["run_id", "persona", "interview_type", "case_id", "seed", "turn", "competency", "level", "action"]
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(self.rows)
+
+    def final_levels(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Mean final level per interview type, persona and competency."""
+        finals: Dict[tuple, int] = {}
+        for row in self.rows:
+            # Rows are in turn order within a run, so the last one wins
+            finals[(row["run_id"], row["interview_type"], row["persona"], row["competency"])] = row["level"]
+
+        grouped: Dict[str, Dict[str, Dict[str, List[int]]]] = {}
+        for (_, interview_type, persona, competency), level in finals.items():
+            grouped.setdefault(interview_type, {}).setdefault(persona, {}).setdefault(competency, []).append(level)
+        return {
+            interview_type: {
+                persona: {competency: round(statistics.fmean(levels), 2) for competency, levels in sorted(by_comp.items())}
+                for persona, by_comp in sorted(by_persona.items())
+            }
+            for interview_type, by_persona in sorted(grouped.items())
+        }
+
+
+CandidateFactory = Callable[[Persona, int], Any]
+
+
+async def simulate_interview(
+    scenario: Scenario,
+    candidate_factory: CandidateFactory = LLMCandidate,
+    max_turns: int = 6,
+) -> Dict[str, Any]:
+    """Run one interview. Returns its summary and trajectory rows."""
+    runner = create_runner(scenario.interview_type, scenario.case_id, session_id=f"sim-{scenario.run_id}")
+    candidate = candidate_factory(PERSONAS[scenario.persona], scenario.seed)
+    base = asdict(scenario)
+    rows: List[Dict[str, Any]] = []
+
+    interviewer_message = await runner.astart()
+    history = f"Interviewer: {interviewer_message}\n"
+    turn = 0
+    while not runner.is_complete() and turn < max_turns:
+        answer = await candidate.reply(interviewer_message, history)
+        interviewer_message = await runner.arespond(answer)
+        history += f"Candidate: {answer}\nInterviewer: {interviewer_message}\n"
+        turn += 1
+        rows.extend({**base, "turn": turn, **level} for level in _levels(runner))
+
+    return {
+        "run": {
+            **base,
+            "turns": turn,
+            "completed": runner.is_complete(),
+            "final_level": runner.get_current_level()[0],
+            "total_tokens": runner.get_state().get("total_tokens", 0),
+            "error": None,
+        },
+        "rows": rows,
+    }
+
+
+def _levels(runner: InterviewRunner) -> List[Dict[str, Any]]:
+    """The current level of every competency (and the overall level), plus the evaluator's action."""
+    action = runner.get_state().get("evaluator_action")
+    levels = [
+        {"competency": competency_id, "level": score.get("current_level", 0), "action": action}
+        for competency_id, score in sorted(runner.get_competency_scores().items())
+    ]
+    levels.append({"competency": "overall", "level": runner.get_current_level()[0], "action": action})
+    return levels
+
+
+async def simulate(
+    scenarios: Sequence[Scenario],
+    concurrency: int = 8,
+    max_turns: int = 6,
+    candidate_factory: CandidateFactory = LLMCandidate,
+) -> SimulationResult:
+    """
+    Run every scenario, at most `concurrency` at a time.
+
+    A run that fails is recorded with its error instead of stopping the
+    sweep. Results are in scenario order regardless of finishing order.
+    """
+    pool = asyncio.Semaphore(concurrency)
+
+    async def run_one(scenario: Scenario) -> Dict[str, Any]:
+        async with pool:
+            try:
+                return await simulate_interview(scenario, candidate_factory, max_turns)
+            except Exception as error:
+                run = {**asdict(scenario), "turns": 0, "completed": False, "final_level": None,
+                       "total_tokens": 0, "error": f"{type(error).__name__}: {error}"}
+                return {"run": run, "rows": []}
+
+    outcomes = await asyncio.gather(*(run_one(scenario) for scenario in scenarios))
+    result = SimulationResult()
+    for outcome in outcomes:
+        result.runs.append(outcome["run"])
+        result.rows.extend(outcome["rows"])
+    return result
+
+
+def run_simulation(
+    scenarios: Sequence[Scenario],
+    concurrency: int = 8,
+    max_turns: int = 6,
+    candidate_factory: CandidateFactory = LLMCandidate,
+) -> SimulationResult:
+    """Blocking wrapper around simulate()."""
+    return asyncio.run(simulate(scenarios, concurrency, max_turns, candidate_factory))
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Run a synthetic-candidate simulation sweep")
+    parser.add_argument("--personas", nargs="+", default=list(PERSONAS), choices=list(PERSONAS))
+    parser.add_argument("--types", nargs="+", default=list(INTERVIEW_TYPES), choices=list(INTERVIEW_TYPES))
+    parser.add_argument("--cases", nargs="+", help="Case, problem or role ids (default: all)")
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--turns", type=int, default=6, help="Maximum turns per interview")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scripted", action="store_true", help="Use scripted candidates instead of an LLM")
+    parser.add_argument("--csv", help="Write trajectory rows to this file")
+    args = parser.parse_args()
+
+    sweep = build_scenarios(args.personas, args.types, args.cases, args.repeats, args.seed)
+    factory = ScriptedCandidate if args.scripted else LLMCandidate
+    result = run_simulation(sweep, args.concurrency, args.turns, factory)
+
+    failed = [run for run in result.runs if run["error"]]
+    print(f"{len(result.runs)} interviews, {len(result.rows)} rows, {len(failed)} failed")
+    for run in failed:
+        print(f"  {run['run_id']}: {run['error']}")
+    print(json.dumps(result.final_levels(), indent=2))
+
+    if args.csv:
+        result.write_csv(args.csv)
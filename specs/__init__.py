@@ -49,6 +49,8 @@ from .spec_schema import (
     SelectedCompetency,
     CompetencyScore,
     UNIVERSAL_RUBRIC,
+    LazyRubric,
+    load_universal_rubric,
     get_competency,
     get_competencies_for_type,
 
@@ -56,6 +58,7 @@ from .spec_schema import (
     InterviewerHeuristics,
     PhaseConfig,
     SessionConstraints,
+    RoutingRule,
 
     # Manager Output
     ManagerDirective,
@@ -76,6 +79,13 @@ from .spec_loader import (
     get_competencies_summary,
 )
 
+from .compiled import (
+    CompiledSpec,
+    CompiledCompetency,
+    CompiledPhase,
+    compile_spec,
+)
+
 from .generators import (
     generate_first_round_spec,
     generate_first_round_spec_simple,
@@ -102,6 +112,8 @@ __all__ = [
     "SelectedCompetency",
     "CompetencyScore",
     "UNIVERSAL_RUBRIC",
+    "LazyRubric",
+    "load_universal_rubric",
     "get_competency",
     "get_competencies_for_type",
 
@@ -109,6 +121,7 @@ __all__ = [
     "InterviewerHeuristics",
     "PhaseConfig",
     "SessionConstraints",
+    "RoutingRule",
 
     # Manager Output
     "ManagerDirective",
@@ -127,6 +140,12 @@ __all__ = [
     "get_available_templates",
     "get_competencies_summary",
 
+    # Compiled runtime view
+    "CompiledSpec",
+    "CompiledCompetency",
+    "CompiledPhase",
+    "compile_spec",
+
     # Generators (LLM-powered)
     "generate_first_round_spec",
     "generate_first_round_spec_simple",
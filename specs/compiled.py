@@ -0,0 +1,234 @@
+"""
+Compiled runtime view of an InterviewSpec.
+
+Interview state carries the spec as a plain dict so it can be serialized.
+Agents read it on every turn, so the dict is compiled once into an
+immutable, indexed CompiledSpec: competency tiers as a map, phases indexed
+by id, and rubric definitions already resolved.
+
+Usage:
+    from specs.compiled import compile_spec
+
+    compiled = compile_spec(state["interview_spec"])
+    compiled.tier("problem_structuring")   # "critical"
+    compiled.phase("analysis").next_phase_id
+"""
+import copy
+import hashlib
+import json
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
+
+from .spec_schema import UniversalCompetency, get_competency
+
+# Compiled specs kept in memory (one per distinct spec content)
+MAX_COMPILED_SPECS = 1024
+
+DEFAULT_TIER = "important"
+
+
+@dataclass(frozen=True)
+class CompiledCompetency:
+    """A selected competency with its rubric definition resolved."""
+    competency_id: str
+    tier: str
+    rubric: Optional[UniversalCompetency]
+    additional_red_flags: Tuple[str, ...]
+    additional_green_flags: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CompiledPhase:
+    """A phase with its position in the interview."""
+    id: str
+    index: int
+    config: Mapping[str, Any]
+    next_phase_id: Optional[str]
+
+
+@dataclass(frozen=True)
+class CompiledRoutingRule:
+    """A model routing rule with its conditions as sets."""
+    agent: str
+    tier: str
+    phases: FrozenSet[str]
+    evaluator_actions: FrozenSet[str]
+    urgencies: FrozenSet[str]
+    max_candidate_chars: Optional[int]
+
+
+@dataclass(frozen=True)
+class CompiledSpec:
+    """Immutable, indexed view of an InterviewSpec dict."""
+    spec_id: str
+    interview_type: str
+    title: str
+    content_hash: str
+
+    heuristics: Mapping[str, Any]
+    context_packet: Mapping[str, Any]
+
+    # Session constraints
+    max_duration_minutes: int
+    max_exchanges: int
+    min_exchanges: int
+    allow_early_termination: bool
+
+    # Competencies, in spec order
+    competencies: Tuple[CompiledCompetency, ...]
+    competency_ids: Tuple[str, ...]
+    tiers: Mapping[str, str]
+    critical_ids: FrozenSet[str]
+
+    # Phases, in spec order, indexed by lowercase id
+    phases: Tuple[CompiledPhase, ...]
+    phase_index: Mapping[str, CompiledPhase]
+
+    # Model routing rules, in spec order (first match wins)
+    routing: Tuple[CompiledRoutingRule, ...] = ()
+
+    def tier(self, competency_id: str) -> str:
+        """Tier of a competency ("important" if not in the spec)."""
+        return self.tiers.get(competency_id, DEFAULT_TIER)
+
+    def phase(self, phase_id: Optional[str]) -> Optional[CompiledPhase]:
+        """Look up a phase by id (case-insensitive)."""
+        if not phase_id:
+            return None
+        return self.phase_index.get(phase_id.lower())
+
+    @property
+    def first_phase_id(self) -> Optional[str]:
+        """Id of the opening phase, if the spec defines phases."""
+        return self.phases[0].id if self.phases else None
+
+
+def spec_content_hash(spec: Dict[str, Any]) -> str:
+    """SHA-256 of a spec's canonical JSON form."""
+    payload = json.dumps(spec, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _build_compiled_spec(spec: Dict[str, Any], content_hash: str) -> CompiledSpec:
+    """Compile a spec dict. Nested data is copied so later edits can't leak in."""
+    spec = copy.deepcopy(spec)
+
+    competencies = []
+    for comp in spec.get("competencies", []):
+        comp_id = comp.get("competency_id", comp.get("id", ""))
+        competencies.append(CompiledCompetency(
+            competency_id=comp_id,
+            tier=comp.get("tier", DEFAULT_TIER),
+            rubric=get_competency(comp_id),
+            additional_red_flags=tuple(comp.get("additional_red_flags", [])),
+            additional_green_flags=tuple(comp.get("additional_green_flags", [])),
+        ))
+
+    raw_phases = spec.get("phases", [])
+    phases = []
+    for index, phase in enumerate(raw_phases):
+        next_phase = raw_phases[index + 1] if index + 1 < len(raw_phases) else None
+        phases.append(CompiledPhase(
+            id=phase.get("id", ""),
+            index=index,
+            config=MappingProxyType(phase),
+            next_phase_id=next_phase.get("id") if next_phase else None,
+        ))
+
+    phase_index = {}
+    for phase in phases:
+        # First match wins, as with the linear scan this replaces
+        phase_index.setdefault(phase.id.lower(), phase)
+
+    routing = tuple(
+        CompiledRoutingRule(
+            agent=rule.get("agent", ""),
+            tier=rule.get("tier", "fast"),
+            phases=frozenset(phase.lower() for phase in rule.get("phases", [])),
+            evaluator_actions=frozenset(rule.get("evaluator_actions", [])),
+            urgencies=frozenset(rule.get("urgencies", [])),
+            max_candidate_chars=rule.get("max_candidate_chars"),
+        )
+        for rule in spec.get("routing") or []
+    )
+
+    constraints = spec.get("constraints") or {}
+    tiers = {comp.competency_id: comp.tier for comp in competencies}
+
+    return CompiledSpec(
+        spec_id=spec.get("spec_id", ""),
+        interview_type=spec.get("interview_type", ""),
+        title=spec.get("title", "Interview"),
+        content_hash=content_hash,
+        heuristics=MappingProxyType(spec.get("heuristics") or {}),
+        context_packet=MappingProxyType(spec.get("context_packet") or {}),
+        max_duration_minutes=constraints.get("max_duration_minutes", 30),
+        max_exchanges=constraints.get("max_exchanges", 15),
+        min_exchanges=constraints.get("min_exchanges_for_completion", 5),
+        allow_early_termination=constraints.get("allow_early_termination", True),
+        competencies=tuple(competencies),
+        competency_ids=tuple(comp.competency_id for comp in competencies),
+        tiers=MappingProxyType(tiers),
+        critical_ids=frozenset(cid for cid, tier in tiers.items() if tier == "critical"),
+        phases=tuple(phases),
+        phase_index=MappingProxyType(phase_index),
+        routing=routing,
+    )
+
+
+# content hash -> compiled spec, least recently used first. Sessions running
+# the same spec share one entry.
+_compiled: "OrderedDict[str, CompiledSpec]" = OrderedDict()
+
+# id(spec) -> (weak reference to the spec, its content hash), for specs that
+# can be weakly referenced (state.SpecDict). The entry goes when the spec is
+# freed, so the cache never keeps a spec alive and an id is never reused.
+_hashes: Dict[int, Tuple["weakref.ref[Dict[str, Any]]", str]] = {}
+_compiled_lock = threading.Lock()
+
+
+def _content_hash(spec: Dict[str, Any]) -> str:
+    """The spec's content hash, computed once per weakly referenceable spec object."""
+    key = id(spec)
+    entry = _hashes.get(key)
+    if entry is not None and entry[0]() is spec:
+        return entry[1]
+
+    content_hash = spec_content_hash(spec)
+    try:
+        ref = weakref.ref(spec, lambda _, key=key: _hashes.pop(key, None))
+    except TypeError:
+        # A plain dict: hashed on every call
+        return content_hash
+    _hashes[key] = (ref, content_hash)
+    return content_hash
+
+
+def compile_spec(spec: Dict[str, Any]) -> CompiledSpec:
+    """
+    Get the compiled view of a spec dict.
+
+    Compiled once per distinct spec content and memoized. For specs held in
+    interview state (state.SpecDict) the content hash is computed once per
+    spec object too, so calling this on every turn costs a dict lookup.
+    Spec dicts are treated as immutable once they are placed in interview
+    state.
+    """
+    content_hash = _content_hash(spec)
+    with _compiled_lock:
+        compiled = _compiled.get(content_hash)
+        if compiled is not None:
+            _compiled.move_to_end(content_hash)
+            return compiled
+
+    compiled = _build_compiled_spec(spec, content_hash)
+
+    with _compiled_lock:
+        _compiled[content_hash] = compiled
+        while len(_compiled) > MAX_COMPILED_SPECS:
+            _compiled.popitem(last=False)
+    return compiled
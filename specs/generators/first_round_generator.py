@@ -20,7 +20,6 @@ from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent.parent / ".env")
 
-from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from specs.spec_schema import (
@@ -34,16 +33,12 @@ from specs.spec_schema import (
     InterviewerHeuristics,
     PhaseConfig,
     SessionConstraints,
+    RoutingRule,
     validate_spec,
 )
 from specs.spec_loader import load_template
-
-# Initialize LLM for parsing
-parser_llm = ChatAnthropic(
-    model="claude-sonnet-4-20250514",
-    temperature=0.2,
-    max_tokens=2048,
-)
+from llm.admission import Priority, admit
+from llm.registry import get_llm
 
 
 def generate_first_round_spec(
@@ -119,6 +114,7 @@ def generate_first_round_spec(
         heuristics=heuristics,
         phases=phases,
         constraints=constraints,
+        routing=[RoutingRule(**rule) for rule in template.get("routing", [])],
         template_id=template_name
     )
 
@@ -198,7 +194,8 @@ Analyze and respond with this JSON structure:
     ]
 
     try:
-        response = parser_llm.invoke(messages)
+        with admit(Priority.SPEC_GENERATION):
+            response = get_llm("spec_parser").invoke(messages)
         return _parse_json_response(response.content)
     except Exception as e:
         print(f"Error parsing JD/CV: {e}")
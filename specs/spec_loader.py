@@ -22,6 +22,7 @@ from .spec_schema import (
     InterviewerHeuristics,
     PhaseConfig,
     SessionConstraints,
+    RoutingRule,
     validate_spec,
     UNIVERSAL_RUBRIC,
 )
@@ -130,6 +131,7 @@ def create_case_interview_spec(
         heuristics=heuristics,
         phases=phases,
         constraints=constraints,
+        routing=[RoutingRule(**rule) for rule in template.get("routing", [])],
         template_id=template_name
     )
 
@@ -219,6 +221,7 @@ def create_first_round_spec(
         heuristics=heuristics,
         phases=phases,
         constraints=constraints,
+        routing=[RoutingRule(**rule) for rule in template.get("routing", [])],
         template_id=template_name
     )
 
@@ -300,6 +303,7 @@ def create_technical_interview_spec(
         heuristics=heuristics,
         phases=phases,
         constraints=constraints,
+        routing=[RoutingRule(**rule) for rule in template.get("routing", [])],
         template_id=template_name
     )
 
@@ -4,8 +4,13 @@ State definitions for the Adaptive Case Interview System.
 This module defines the core state that flows through all agents.
 The state now supports multiple interview types via the InterviewSpec system.
 """
-from typing import TypedDict, List, Optional, Literal, Dict, Any
+from typing import TypedDict, List, Optional, Literal, Dict, Any, Mapping, Iterable, Iterator, Sequence, TYPE_CHECKING
+from bisect import bisect_left
 from enum import Enum
+from itertools import islice
+
+if TYPE_CHECKING:
+    from specs.compiled import CompiledSpec
 
 
 class Phase(str, Enum):
@@ -146,7 +151,7 @@ class InterviewState(TypedDict):
     # =========================================================================
     # CONVERSATION TRACKING
     # =========================================================================
-    messages: List[Message]
+    messages: Sequence[Message]  # MessageLog at runtime (append-only)
 
     # =========================================================================
     # MULTI-COMPETENCY SCORING (NEW)
@@ -193,6 +198,194 @@ class InterviewState(TypedDict):
     # USAGE TRACKING
     # =========================================================================
     total_tokens: int
+    cache_read_tokens: int   # Prompt-cache reads (included in total_tokens)
+    cache_write_tokens: int  # Prompt-cache writes (included in total_tokens)
+    degraded_calls: int      # LLM calls replaced by a fallback (timeout, outage, unparseable reply)
+
+
+# =============================================================================
+# APPEND-ONLY LOGS AND STATE DELTAS
+# =============================================================================
+# The transcript and the history lists only ever grow. Nodes return deltas
+# (Append / Increment) that are applied to the runner's state in place, so a
+# turn costs the same at exchange 200 as at exchange 2 instead of copying
+# every list on every turn.
+
+class AppendLog(list):
+    """
+    A list that is only ever appended to.
+
+    Still a plain list for JSON and callers, but snapshot() returns an O(1)
+    read-only view fixed at the current length, so background work can read
+    a consistent prefix while the live log keeps growing.
+    """
+
+    def snapshot(self, end: Optional[int] = None) -> "LogView":
+        return LogView(self, len(self) if end is None else end)
+
+
+class MessageLog(AppendLog):
+    """Append-only transcript indexed by role for O(log n) role lookups."""
+
+    def __init__(self, messages: Iterable[Message] = ()):
+        super().__init__()
+        self._role_positions: Dict[str, List[int]] = {}
+        self.extend(messages)
+
+    def append(self, message: Message) -> None:
+        self._role_positions.setdefault(message["role"], []).append(len(self))
+        super().append(message)
+
+    def extend(self, messages: Iterable[Message]) -> None:
+        for message in messages:
+            self.append(message)
+
+    def count_role(self, role: str, end: Optional[int] = None) -> int:
+        """Number of messages from `role` (among the first `end` messages)."""
+        positions = self._role_positions.get(role, [])
+        return len(positions) if end is None else bisect_left(positions, end)
+
+    def last_of_role(self, role: str, end: Optional[int] = None) -> Optional[Message]:
+        """Most recent message from `role` (among the first `end` messages)."""
+        count = self.count_role(role, end)
+        return self[self._role_positions[role][count - 1]] if count else None
+
+    def snapshot(self, end: Optional[int] = None) -> "LogView":
+        return MessageView(self, len(self) if end is None else end)
+
+    def __reduce__(self):
+        return (MessageLog, (list(self),))
+
+
+class LogView(Sequence):
+    """Read-only view of the first `end` entries of an AppendLog."""
+
+    def __init__(self, log: AppendLog, end: int):
+        self._log = log
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._log[i] for i in range(self._end)[index]]
+        return self._log[range(self._end)[index]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return islice(iter(self._log), self._end)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def snapshot(self) -> "LogView":
+        return self
+
+
+class MessageView(LogView):
+    """Read-only view of a MessageLog prefix."""
+
+    def count_role(self, role: str) -> int:
+        return self._log.count_role(role, self._end)
+
+    def last_of_role(self, role: str) -> Optional[Message]:
+        return self._log.last_of_role(role, self._end)
+
+
+class SpecDict(dict):
+    """
+    The interview spec as carried in state: a plain dict that can be
+    weakly referenced, so its compiled view (specs.compiled) can be
+    memoized without keeping the spec alive after its session is gone.
+    """
+    __slots__ = ("__weakref__",)
+
+
+class Append:
+    """State delta: append items to the log at this key."""
+    __slots__ = ("items",)
+
+    def __init__(self, *items: Any):
+        self.items = items
+
+
+class Increment:
+    """State delta: add to the counter at this key."""
+    __slots__ = ("amount",)
+
+    def __init__(self, amount: int):
+        self.amount = amount
+
+
+# Keys of InterviewState that hold append-only logs
+LOG_KEYS = ("messages", "level_history", "red_flags_observed", "green_flags_observed", "question_scores")
+
+
+def _new_log(key: str, items: Iterable[Any] = ()) -> AppendLog:
+    return MessageLog(items) if key == "messages" else AppendLog(items)
+
+
+def prepare_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a state dict for in-place updates, converting lists to fresh logs.
+
+    The caller's dict and lists are never modified afterwards.
+    """
+    prepared = dict(state)
+    for key in LOG_KEYS:
+        if key in prepared:
+            prepared[key] = _new_log(key, prepared[key] or ())
+    spec = prepared.get("interview_spec")
+    if spec is not None and not isinstance(spec, SpecDict):
+        prepared["interview_spec"] = SpecDict(spec)
+    return prepared
+
+
+def snapshot_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """O(#keys) read-only snapshot of a prepared state for background work."""
+    return {
+        key: value.snapshot() if isinstance(value, (AppendLog, LogView)) else value
+        for key, value in state.items()
+    }
+
+
+def restore_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Live state from a snapshot_state() result, with logs cut back to the snapshot's lengths."""
+    return {
+        key: _new_log(key, value) if isinstance(value, (AppendLog, LogView)) else value
+        for key, value in snapshot.items()
+    }
+
+
+def apply_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Apply a node result to `state` in place."""
+    for key, value in delta.items():
+        if isinstance(value, Append):
+            log = state.get(key)
+            if not isinstance(log, AppendLog):
+                log = state[key] = _new_log(key, log or ())
+            log.extend(value.items)
+        elif isinstance(value, Increment):
+            state[key] = state.get(key, 0) + value.amount
+        else:
+            state[key] = value
+
+
+def count_role(messages: Sequence[Message], role: str) -> int:
+    """Number of messages from `role` (O(log n) on a MessageLog)."""
+    if hasattr(messages, "count_role"):
+        return messages.count_role(role)
+    return sum(1 for m in messages if m["role"] == role)
+
+
+def last_of_role(messages: Sequence[Message], role: str) -> Optional[Message]:
+    """Most recent message from `role`, if any."""
+    if hasattr(messages, "last_of_role"):
+        return messages.last_of_role(role)
+    for message in reversed(messages):
+        if message["role"] == role:
+            return message
+    return None
 
 
 def create_empty_competency_score(competency_id: str) -> CompetencyScore:
@@ -225,7 +418,7 @@ def initialize_competency_scores(spec: Dict[str, Any]) -> Dict[str, CompetencySc
     return scores
 
 
-def get_overall_level(competency_scores: Dict[str, CompetencyScore], spec: Dict[str, Any]) -> int:
+def get_overall_level(competency_scores: Dict[str, CompetencyScore], spec: Any) -> int:
     """
     Calculate overall interview level from competency scores.
 
@@ -234,17 +427,18 @@ def get_overall_level(competency_scores: Dict[str, CompetencyScore], spec: Dict[
     - IMPORTANT competencies contribute to the overall score
     - BONUS competencies can elevate but not carry
 
+    Args:
+        competency_scores: Scores by competency id
+        spec: CompiledSpec (or a raw spec dict, compiled on demand)
+
     Returns:
         Overall level 1-5
     """
     if not competency_scores:
         return 0
 
-    # Get competency tiers from spec
-    competency_tiers = {}
-    for comp in spec.get("competencies", []):
-        comp_id = comp.get("competency_id", comp.get("id"))
-        competency_tiers[comp_id] = comp.get("tier", "important")
+    from specs.compiled import CompiledSpec, compile_spec
+    compiled = spec if isinstance(spec, CompiledSpec) else compile_spec(spec)
 
     # Check critical competencies
     critical_levels = []
@@ -252,7 +446,7 @@ def get_overall_level(competency_scores: Dict[str, CompetencyScore], spec: Dict[
     bonus_levels = []
 
     for comp_id, score in competency_scores.items():
-        tier = competency_tiers.get(comp_id, "important")
+        tier = compiled.tier(comp_id)
         level = score.get("current_level", 0)
 
         if level == 0:  # Not yet assessed
@@ -303,39 +497,44 @@ def has_spec(state: InterviewState) -> bool:
     return state.get("interview_spec") is not None
 
 
+def get_compiled_spec(state: InterviewState) -> Optional["CompiledSpec"]:
+    """Get the compiled (indexed, read-only) view of the spec, if present."""
+    spec = state.get("interview_spec")
+    if not spec:
+        return None
+    from specs.compiled import compile_spec
+    return compile_spec(spec)
+
+
 def get_spec_interview_type(state: InterviewState) -> Optional[str]:
     """Get the interview type from the spec, if present."""
-    spec = state.get("interview_spec")
-    if spec:
-        return spec.get("interview_type")
+    compiled = get_compiled_spec(state)
+    if compiled:
+        return compiled.interview_type
     return None
 
 
-def get_current_phase_config(state: InterviewState) -> Optional[Dict[str, Any]]:
+def get_current_phase_config(state: InterviewState) -> Optional[Mapping[str, Any]]:
     """Get the current phase configuration from the spec."""
-    spec = state.get("interview_spec")
-    if not spec:
+    compiled = get_compiled_spec(state)
+    if not compiled:
         return None
 
-    current_phase_id = state.get("current_phase", "").lower()
-    for phase in spec.get("phases", []):
-        if phase.get("id", "").lower() == current_phase_id:
-            return phase
-
-    return None
+    phase = compiled.phase(state.get("current_phase", ""))
+    return phase.config if phase else None
 
 
-def get_heuristics(state: InterviewState) -> Optional[Dict[str, Any]]:
+def get_heuristics(state: InterviewState) -> Optional[Mapping[str, Any]]:
     """Get the interviewer heuristics from the spec."""
-    spec = state.get("interview_spec")
-    if spec:
-        return spec.get("heuristics")
+    compiled = get_compiled_spec(state)
+    if compiled:
+        return compiled.heuristics
     return None
 
 
-def get_context_packet(state: InterviewState) -> Optional[Dict[str, Any]]:
+def get_context_packet(state: InterviewState) -> Optional[Mapping[str, Any]]:
     """Get the context packet from the spec."""
-    spec = state.get("interview_spec")
-    if spec:
-        return spec.get("context_packet")
+    compiled = get_compiled_spec(state)
+    if compiled:
+        return compiled.context_packet
     return None
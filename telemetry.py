@@ -0,0 +1,379 @@
+"""
+Per-node spans and Prometheus metrics for interview turns.
+
+Every evaluator, interviewer and manager call records a NodeSpan: wall
+time, time spent building the prompt, time to first byte of the LLM
+reply, time spent parsing it, input/output/cache tokens, prompt size in
+characters per section (each system block plus the context message) and
+whether the reply parsed or fell back. Spans are
+kept per session (InterviewRunner.get_spans()) and aggregated per agent
+and interview type into histograms and counters, served in the
+Prometheus text format at GET /metrics.
+
+The span for the node running in the current context is held in a
+context variable, so the LLM client layer and the agents can annotate it
+without threading it through every call. Concurrent nodes (speculative
+drafts, pipelined evaluations) each get their own span.
+
+Environment:
+    TELEMETRY_SESSION_SPANS   spans kept per session (default 500)
+    TELEMETRY_MAX_SESSIONS    sessions whose spans are kept, least recently used evicted (default 1000)
+
+Usage:
+    from telemetry import traced, annotate_span
+
+    @traced("evaluator")
+    def evaluator_node(state): ...
+
+    @timed_stage("parse_seconds")
+    def _process_evaluator_response(state, response): ...
+
+    annotate_span(parse="ok")
+"""
+import asyncio
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from state import InterviewState, count_role, get_spec_interview_type
+
+DEFAULT_SESSION_SPANS = int(os.getenv("TELEMETRY_SESSION_SPANS", "500"))
+DEFAULT_MAX_SESSIONS = int(os.getenv("TELEMETRY_MAX_SESSIONS", "1000"))
+
+# Histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 30.0)
+# ...and for the in-process stages around the LLM call (prompt building, parsing)
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+TOKEN_KINDS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_write_tokens")
+
+# Parse outcomes: "ok", "fallback" (reply was not valid JSON) or "degraded" (no reply in time)
+PARSE_OUTCOMES = ("ok", "fallback", "degraded")
+
+
+@dataclass
+class NodeSpan:
+    """One agent node call."""
+    node: str
+    interview_type: str
+    session_id: str
+    exchange: int
+    started_at: float                   # Unix time
+    wall_seconds: float = 0.0
+    prompt_build_seconds: Optional[float] = None
+    llm_seconds: Optional[float] = None  # Whole LLM call, retries included
+    parse_seconds: Optional[float] = None
+    ttfb_seconds: Optional[float] = None  # First streamed chunk, or the whole reply when not streamed
+    tier: Optional[str] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    prompt_chars: Dict[str, int] = field(default_factory=dict)
+    parse: Optional[str] = None          # None when the node made no LLM call
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+_current_span: ContextVar[Optional[NodeSpan]] = ContextVar("node_span", default=None)
+
+
+def current_span() -> Optional[NodeSpan]:
+    """The span of the node running in this context, if any."""
+    return _current_span.get()
+
+
+def annotate_span(**fields: Any) -> None:
+    """Set fields on the current span; a no-op outside a traced node."""
+    span = _current_span.get()
+    if span is not None:
+        for name, value in fields.items():
+            setattr(span, name, value)
+
+
+def record_tokens(usage: Dict[str, int]) -> None:
+    """Add an extract_token_usage() result to the current span."""
+    span = _current_span.get()
+    if span is not None:
+        for kind in TOKEN_KINDS:
+            setattr(span, kind, getattr(span, kind) + (usage.get(kind, 0) or 0))
+
+
+def record_prompt(messages: List[Any]) -> None:
+    """Record the size of each prompt section (system blocks and context) on the current span."""
+    span = _current_span.get()
+    if span is None:
+        return
+    # Imported here: the llm package imports this module
+    from llm.cache import content_text
+
+    sizes: Dict[str, int] = {}
+    for message in messages:
+        role = getattr(message, "type", "")
+        content = getattr(message, "content", "")
+        if role == "system" and isinstance(content, list):
+            for index, block in enumerate(content):
+                sizes[f"system_{index}"] = len(content_text([block]))
+        elif role == "system":
+            sizes["system_0"] = len(content)
+        else:
+            sizes["context"] = sizes.get("context", 0) + len(content_text(content))
+    span.prompt_chars = sizes
+
+
+def _open_span(node: str, state: InterviewState) -> NodeSpan:
+    return NodeSpan(
+        node=node,
+        interview_type=get_spec_interview_type(state) or "legacy_case",
+        session_id=state.get("session_id") or "",
+        exchange=count_role(state.get("messages") or [], "candidate"),
+        started_at=time.time(),
+    )
+
+
+def traced(node: str) -> Callable:
+    """
+    Record a span for every call of a node function.
+
+    Works on sync and async nodes whose first argument is the state. The
+    span is set in the node's own context, so nodes run concurrently on
+    worker threads or tasks don't share one.
+    """
+    def decorator(fn: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(state: InterviewState, *args: Any, **kwargs: Any) -> Any:
+                span = _open_span(node, state)
+                token = _current_span.set(span)
+                started = time.perf_counter()
+                try:
+                    return await fn(state, *args, **kwargs)
+                except BaseException as error:
+                    span.error = type(error).__name__
+                    raise
+                finally:
+                    _current_span.reset(token)
+                    span.wall_seconds = time.perf_counter() - started
+                    telemetry.record(span)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(state: InterviewState, *args: Any, **kwargs: Any) -> Any:
+            span = _open_span(node, state)
+            token = _current_span.set(span)
+            started = time.perf_counter()
+            try:
+                return fn(state, *args, **kwargs)
+            except BaseException as error:
+                span.error = type(error).__name__
+                raise
+            finally:
+                _current_span.reset(token)
+                span.wall_seconds = time.perf_counter() - started
+                telemetry.record(span)
+        return wrapper
+    return decorator
+
+
+def timed_stage(name: str) -> Callable:
+    """
+    Add the time spent in a function to the current span's `name` field.
+
+    For the in-process stages of a node, e.g. prompt building
+    ("prompt_build_seconds") and reply parsing ("parse_seconds").
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                span = _current_span.get()
+                if span is not None:
+                    elapsed = time.perf_counter() - started
+                    setattr(span, name, (getattr(span, name) or 0.0) + elapsed)
+        return wrapper
+    return decorator
+
+
+# =============================================================================
+# AGGREGATION
+# =============================================================================
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+
+@dataclass
+class NodeMetrics:
+    """Aggregates for one (agent, interview type)."""
+    wall: Histogram = field(default_factory=Histogram)
+    prompt_build: Histogram = field(default_factory=lambda: Histogram(STAGE_BUCKETS))
+    ttfb: Histogram = field(default_factory=Histogram)
+    parse_time: Histogram = field(default_factory=lambda: Histogram(STAGE_BUCKETS))
+    tokens: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(TOKEN_KINDS, 0))
+    prompt_chars: Dict[str, int] = field(default_factory=dict)
+    parse: Dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+
+
+class Telemetry:
+    """Spans per session (bounded) and metrics per (agent, interview type)."""
+
+    def __init__(self, session_spans: int = DEFAULT_SESSION_SPANS, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        self.session_spans = session_spans
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, Deque[NodeSpan]]" = OrderedDict()
+        self._metrics: Dict[Tuple[str, str], NodeMetrics] = {}
+
+    def record(self, span: NodeSpan) -> None:
+        with self._lock:
+            spans = self._sessions.get(span.session_id)
+            if spans is None:
+                spans = self._sessions[span.session_id] = deque(maxlen=self.session_spans)
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(span.session_id)
+            spans.append(span)
+
+            metrics = self._metrics.get((span.node, span.interview_type))
+            if metrics is None:
+                metrics = self._metrics[(span.node, span.interview_type)] = NodeMetrics()
+            metrics.wall.observe(span.wall_seconds)
+            if span.prompt_build_seconds is not None:
+                metrics.prompt_build.observe(span.prompt_build_seconds)
+            if span.ttfb_seconds is not None:
+                metrics.ttfb.observe(span.ttfb_seconds)
+            if span.parse_seconds is not None:
+                metrics.parse_time.observe(span.parse_seconds)
+            for kind in TOKEN_KINDS:
+                metrics.tokens[kind] += getattr(span, kind)
+            for section, chars in span.prompt_chars.items():
+                metrics.prompt_chars[section] = metrics.prompt_chars.get(section, 0) + chars
+            if span.parse is not None:
+                metrics.parse[span.parse] = metrics.parse.get(span.parse, 0) + 1
+            metrics.errors += int(span.error is not None)
+
+    def session_spans_for(self, session_id: str) -> List[Dict[str, Any]]:
+        """A session's spans, oldest first."""
+        with self._lock:
+            return [span.to_dict() for span in self._sessions.get(session_id, ())]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+            self._metrics.clear()
+
+    def render_prometheus(self) -> str:
+        """All aggregates in the Prometheus text exposition format."""
+        with self._lock:
+            items = sorted(self._metrics.items())
+            lines: List[str] = []
+
+            _header(lines, "interview_node_seconds", "histogram", "Wall time of one agent node call.")
+            for (node, interview_type), metrics in items:
+                _histogram(lines, "interview_node_seconds", metrics.wall, node, interview_type)
+
+            _header(lines, "interview_llm_ttfb_seconds", "histogram", "Time to the first byte of an LLM reply.")
+            for (node, interview_type), metrics in items:
+                if metrics.ttfb.count:
+                    _histogram(lines, "interview_llm_ttfb_seconds", metrics.ttfb, node, interview_type)
+
+            _header(lines, "interview_prompt_build_seconds", "histogram", "Time spent building an LLM prompt.")
+            for (node, interview_type), metrics in items:
+                if metrics.prompt_build.count:
+                    _histogram(lines, "interview_prompt_build_seconds", metrics.prompt_build, node, interview_type)
+
+            _header(lines, "interview_parse_seconds", "histogram", "Time spent parsing an LLM reply.")
+            for (node, interview_type), metrics in items:
+                if metrics.parse_time.count:
+                    _histogram(lines, "interview_parse_seconds", metrics.parse_time, node, interview_type)
+
+            _header(lines, "interview_tokens_total", "counter", "LLM tokens by kind.")
+            for (node, interview_type), metrics in items:
+                for kind, count in metrics.tokens.items():
+                    labels = _labels(node, interview_type, kind=kind.replace("_tokens", ""))
+                    lines.append(f"interview_tokens_total{{{labels}}} {count}")
+
+            _header(lines, "interview_prompt_chars_total", "counter", "Prompt characters by section.")
+            for (node, interview_type), metrics in items:
+                for section, chars in sorted(metrics.prompt_chars.items()):
+                    labels = _labels(node, interview_type, section=section)
+                    lines.append(f"interview_prompt_chars_total{{{labels}}} {chars}")
+
+            _header(lines, "interview_parse_total", "counter", "LLM replies by parse outcome.")
+            for (node, interview_type), metrics in items:
+                for outcome, count in sorted(metrics.parse.items()):
+                    labels = _labels(node, interview_type, outcome=outcome)
+                    lines.append(f"interview_parse_total{{{labels}}} {count}")
+
+            _header(lines, "interview_node_errors_total", "counter", "Node calls that raised.")
+            for (node, interview_type), metrics in items:
+                lines.append(f"interview_node_errors_total{{{_labels(node, interview_type)}}} {metrics.errors}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _header(lines: List[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _labels(node: str, interview_type: str, **extra: str) -> str:
+    pairs = {"agent": node, "interview_type": interview_type, **extra}
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram(lines: List[str], name: str, histogram: Histogram, node: str, interview_type: str) -> None:
+    labels = _labels(node, interview_type)
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {count}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum:.6f}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+# Process-wide telemetry
+telemetry = Telemetry()
+
+
+def get_session_spans(session_id: str) -> List[Dict[str, Any]]:
+    """The recorded spans of one session, oldest first."""
+    return telemetry.session_spans_for(session_id)
+
+
+def render_metrics() -> str:
+    """Process-wide metrics in the Prometheus text format."""
+    return telemetry.render_prometheus()
+
+
+def reset_telemetry() -> None:
+    """Clear all spans and metrics."""
+    telemetry.reset()
@@ -0,0 +1,75 @@
+"""
+Shared fixtures for the offline test suite.
+
+The agents get their LLM clients from llm.registry. These fixtures swap
+them for a scripted stand-in so runner behaviour can be tested without
+network access or API spend.
+"""
+import sys
+import json
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# The benchmarks' stand-in, under the name the tests use for it
+from benchmarks.stand_in import StandInChatModel as FakeChatModel
+
+
+def legacy_evaluation(level: int = 3, action: str = "LIGHT_HELP", data: Optional[str] = None) -> str:
+    """A legacy-format evaluator reply."""
+    return json.dumps({
+        "current_level": level,
+        "level_name": "GOOD_NOT_ENOUGH",
+        "level_justification": "scripted",
+        "level_trend": "STABLE",
+        "action": action,
+        "interviewer_guidance": "Ask for their hypothesis.",
+        "data_to_share": data,
+        "red_flags": [],
+        "green_flags": ["Structured"],
+    })
+
+
+def spoken(text: str) -> str:
+    """An interviewer reply in the expected JSON envelope."""
+    return json.dumps({"spoken": text})
+
+
+@pytest.fixture
+def fake_llms():
+    """Serve scripted fakes as the evaluator and interviewer LLMs."""
+    from llm.registry import registry
+    from llm.routing import reset_routing_stats
+    from telemetry import reset_telemetry
+
+    # Fresh circuit breakers and metrics, so one test's calls don't leak into the next
+    reset_routing_stats()
+    reset_telemetry()
+
+    evaluator = FakeChatModel(lambda messages: legacy_evaluation())
+    interviewer = FakeChatModel(lambda messages: spoken("Walk me through that."))
+
+    with registry.override(evaluator=evaluator, interviewer=interviewer):
+        yield {"evaluator": evaluator, "interviewer": interviewer}
+
+
+@pytest.fixture
+def case_state():
+    """A fresh legacy case interview state."""
+    from case_loader import initialize_interview_state
+    return initialize_interview_state("coffee_profitability")
+
+
+@pytest.fixture
+def technical_state():
+    """A fresh spec-driven technical interview state."""
+    from specs import create_technical_interview_spec
+    from graph import initialize_from_spec
+    spec = create_technical_interview_spec({
+        "problem_statement": "Return the indices of two numbers that add up to a target.",
+        "expected_complexity": "O(n)",
+    })
+    return initialize_from_spec(spec, session_id="technical-session")
@@ -0,0 +1,179 @@
+"""
+Candidate API tests using scripted LLM stand-ins.
+
+Run with: pytest tests/test_api.py -v
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.routes.interview import RespondRequest, respond_to_interview_stream, sessions
+from llm.admission import AdmissionRejected
+
+
+@pytest.fixture
+def client(fake_llms):
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _start(client) -> str:
+    response = client.post("/api/interviews", json={"case_id": "coffee_profitability"})
+    assert response.status_code == 200
+    return response.json()["session_id"]
+
+
+def test_respond_returns_interviewer_message(client):
+    session_id = _start(client)
+
+    response = client.post(f"/api/interviews/{session_id}/respond", json={"message": "Revenue or costs?"})
+
+    assert response.status_code == 200
+    assert response.json() == {"interviewer_message": "Walk me through that.", "is_complete": False}
+
+
+def test_respond_stream_emits_sse_tokens_then_done(client):
+    session_id = _start(client)
+
+    response = client.post(f"/api/interviews/{session_id}/respond/stream", json={"message": "Revenue or costs?"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        (block.split("\n")[0][len("event: "):], json.loads(block.split("\n")[1][len("data: "):]))
+        for block in response.text.strip().split("\n\n")
+    ]
+    assert {name for name, _ in events[:-1]} == {"token"}
+    assert "".join(data["text"] for _, data in events[:-1]) == "Walk me through that."
+    assert events[-1] == ("done", {"interviewer_message": "Walk me through that.", "is_complete": False})
+
+
+def test_unknown_session_is_404(client):
+    response = client.post("/api/interviews/missing/respond/stream", json={"message": "hi"})
+    assert response.status_code == 404
+
+
+
+@pytest.mark.asyncio
+async def test_sse_client_disconnect_rolls_back_before_freeing_the_session(fake_llms, monkeypatch):
+    interviewer = fake_llms["interviewer"]
+    real_astream = interviewer.astream
+
+    async def slow_astream(messages, **kwargs):
+        async for chunk in real_astream(messages, **kwargs):
+            yield chunk
+            await asyncio.sleep(0.05)
+
+    monkeypatch.setattr(interviewer, "astream", slow_astream)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        started = await client.post("/api/interviews", json={"case_id": "coffee_profitability"})
+    session_id = started.json()["session_id"]
+
+    response = await respond_to_interview_stream(session_id, RespondRequest(message="Revenue or costs?"), None)
+    first = await response.body_iterator.__anext__()
+    assert first.startswith("event: token")
+    # The client goes away while the stream is parked at a yield
+    await response.body_iterator.aclose()
+
+    # By the time the lease is free, the turn has already rolled back
+    runner = sessions.get(session_id)
+    assert [m["role"] for m in runner.get_messages()] == ["interviewer"]
+    assert runner.response_count == 0
+    lease = await asyncio.wait_for(sessions.acquire_lease(session_id), timeout=0.1)
+    await lease.arelease()
+
+@pytest.mark.asyncio
+async def test_concurrent_retries_with_idempotency_key_run_one_turn(fake_llms):
+    fake_llms["evaluator"].delay = 0.05
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        started = await client.post("/api/interviews", json={"case_id": "coffee_profitability"})
+        session_id = started.json()["session_id"]
+        url = f"/api/interviews/{session_id}/respond"
+        headers = {"Idempotency-Key": "turn-1"}
+
+        first, retry = await asyncio.gather(
+            client.post(url, json={"message": "Revenue or costs?"}, headers=headers),
+            client.post(url, json={"message": "Revenue or costs?"}, headers=headers),
+        )
+        reused = await client.post(url, json={"message": "Something else"}, headers=headers)
+        status = await client.get(f"/api/interviews/{session_id}/status")
+
+    assert first.json() == retry.json() == {"interviewer_message": "Walk me through that.", "is_complete": False}
+    assert len(fake_llms["evaluator"].calls) == 1
+    assert reused.status_code == 422
+    assert status.json()["message_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_turns_on_one_session_are_serialized(fake_llms):
+    fake_llms["evaluator"].delay = 0.05
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        started = await client.post("/api/interviews", json={"case_id": "coffee_profitability"})
+        session_id = started.json()["session_id"]
+        url = f"/api/interviews/{session_id}/respond"
+
+        await asyncio.gather(
+            client.post(url, json={"message": "Revenue?"}),
+            client.post(url, json={"message": "Costs?"}),
+        )
+
+    roles = [message["role"] for message in sessions.get(session_id).get_messages()]
+    assert roles == ["interviewer", "candidate", "interviewer", "candidate", "interviewer"]
+
+
+def test_metrics_exports_node_histograms_and_token_counters(client):
+    session_id = _start(client)
+    client.post(f"/api/interviews/{session_id}/respond", json={"message": "Revenue or costs?"})
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'interview_node_seconds_count{agent="evaluator",interview_type="legacy_case"} 1' in body
+    assert 'interview_llm_ttfb_seconds_bucket{agent="interviewer",interview_type="legacy_case",le="+Inf"} 1' in body
+    assert 'interview_tokens_total{agent="evaluator",interview_type="legacy_case",kind="output"} 20' in body
+    assert 'interview_parse_total{agent="evaluator",interview_type="legacy_case",outcome="ok"} 1' in body
+    assert 'interview_prompt_build_seconds_count{agent="evaluator",interview_type="legacy_case"} 1' in body
+    assert 'interview_parse_seconds_count{agent="interviewer",interview_type="legacy_case"} 1' in body
+
+
+
+def test_llm_stats_include_the_prompt_render_cache(client):
+    session_id = _start(client)
+    client.post(f"/api/interviews/{session_id}/respond", json={"message": "Revenue or costs?"})
+
+    stats = client.get("/api/llm/stats").json()
+
+    assert set(stats) == {"admission", "routing", "prompt_render_cache"}
+    assert stats["prompt_render_cache"]["hits"] + stats["prompt_render_cache"]["misses"] > 0
+
+def test_turn_rejected_mid_flight_leaves_the_session_unchanged(client, monkeypatch):
+    import llm.routing
+
+    session_id = _start(client)
+    url = f"/api/interviews/{session_id}/respond"
+    real_aadmit = llm.routing.aadmit
+    rejections = [AdmissionRejected("LLM queue is full", retry_after=2.0)]
+
+    def aadmit(priority):
+        # The capacity pre-check passes; the evaluator's own call is rejected
+        if rejections:
+            raise rejections.pop()
+        return real_aadmit(priority)
+
+    monkeypatch.setattr(llm.routing, "aadmit", aadmit)
+
+    rejected = client.post(url, json={"message": "Revenue or costs?"})
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"] == "2"
+    assert [m["role"] for m in sessions.get(session_id).get_messages()] == ["interviewer"]
+
+    retried = client.post(url, json={"message": "Revenue or costs?"})
+    assert retried.status_code == 200
+    roles = [m["role"] for m in sessions.get(session_id).get_messages()]
+    assert roles == ["interviewer", "candidate", "interviewer"]
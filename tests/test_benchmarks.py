@@ -0,0 +1,97 @@
+"""
+Benchmark tooling tests: the stub Messages API, turn latency and load test.
+
+Run with: pytest tests/test_benchmarks.py -v
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from benchmarks.stub_llm import StubConfig, create_stub_app, serve_stub
+from graph import InterviewRunner
+from state import get_compiled_spec
+
+
+@pytest.fixture
+def stub_url():
+    """A stub Messages API served on a free local port."""
+    with serve_stub(StubConfig(latency_ms=5, ttft_ms=1, latency_sigma=0)) as url:
+        yield url
+
+
+def test_chat_anthropic_runs_an_interview_against_the_stub(stub_url, technical_state, monkeypatch):
+    from llm.registry import RoleConfig, _build_chat_anthropic, registry
+
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_url)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "stub")
+    clients = {role: _build_chat_anthropic(RoleConfig("stub", 0.3, 1024)) for role in ("evaluator", "interviewer")}
+
+    with registry.override(**clients):
+        runner = InterviewRunner(technical_state)
+        runner.start()
+        reply = runner.respond("I'd use a hash map from value to index.")
+        runner.respond("Then a single pass over the array.")
+
+    assert reply and not reply.startswith("{")
+    assert runner.state["degraded_calls"] == 0
+    # Every competency is scored, not just the three in the prompt's output example
+    compiled = get_compiled_spec(runner.state)
+    assert len(compiled.competency_ids) > 3
+    assert all(runner.state["competency_scores"][cid]["current_level"] >= 2 for cid in compiled.competency_ids)
+    # The evaluator's cached system prompt is written once, then read
+    assert runner.state["cache_read_tokens"] > 0
+
+
+def test_stub_rate_limits_and_injects_errors():
+    body = {"model": "stub", "max_tokens": 100, "messages": [{"role": "user", "content": "Hi"}]}
+
+    with TestClient(create_stub_app(StubConfig(latency_ms=0, rpm=2))) as client:
+        statuses = [client.post("/v1/messages", json=body).status_code for _ in range(3)]
+        limited = client.post("/v1/messages", json=body)
+    assert statuses == [200, 200, 429]
+    assert limited.json()["error"]["type"] == "rate_limit_error"
+    assert int(limited.headers["retry-after"]) >= 1
+
+    with TestClient(create_stub_app(StubConfig(latency_ms=0, error_rate=1.0))) as client:
+        overloaded = client.post("/v1/messages", json=body)
+    assert overloaded.status_code == 529
+
+
+def test_turn_latency_covers_every_path_and_reports_growth():
+    from benchmarks.turn_latency import run
+
+    results = run(turns=8, bucket=4)
+
+    scenarios = {scenario["scenario"]: scenario for scenario in results["scenarios"]}
+    assert set(scenarios) == {"legacy_case", "spec_case", "spec_first_round", "spec_technical"}
+    technical = scenarios["spec_technical"]
+    assert technical["path"] == "spec" and technical["turns_run"] == 8
+    assert [bucket["turns"] for bucket in technical["buckets"]] == ["1-4", "5-8"]
+    assert technical["summary"]["evaluator_prompt_tokens"]["mean"] > 0
+    assert technical["summary"]["prompt_build_ms"]["mean"] > 0
+    assert set(technical["growth_per_10_turns"]) >= {"turn_ms", "state_merge_ms", "interviewer_prompt_tokens"}
+
+
+def test_load_test_reports_latency_errors_and_memory_per_endpoint():
+    from benchmarks.load_test import LoadConfig, run
+
+    config = LoadConfig(candidates=4, turns=2, think_ms=0, ramp_seconds=0)
+    results = run(config, llm="stand-in", llm_latency_ms=0)
+
+    assert results["turns_answered"] == 8
+    respond = results["endpoints"]["respond"]
+    assert respond["requests"] == 8 and respond["statuses"] == {"200": 8} and respond["error_rate"] == 0.0
+    assert 0 < respond["latency_ms"]["p50"] <= respond["latency_ms"]["p99"]
+    assert results["endpoints"]["start"]["requests"] == 4
+    assert results["memory"]["store_bytes_per_session"] > 0
+
+
+def test_load_test_against_the_stub_restores_the_environment(monkeypatch):
+    import os
+    from benchmarks.load_test import LoadConfig, run
+
+    monkeypatch.delenv("ANTHROPIC_BASE_URL", raising=False)
+    config = LoadConfig(candidates=2, turns=1, think_ms=0, ramp_seconds=0)
+    results = run(config, llm="stub", llm_latency_ms=5)
+
+    assert results["turns_answered"] == 2
+    assert "ANTHROPIC_BASE_URL" not in os.environ
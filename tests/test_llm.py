@@ -0,0 +1,413 @@
+"""
+LLM plumbing tests: admission control, the client registry, model routing
+and resilience (time budgets, retries, hedging, circuit breaking).
+
+Run with: pytest tests/test_llm.py -v
+"""
+import asyncio
+import time
+
+import pytest
+
+from graph import InterviewRunner
+from llm.admission import AdmissionController, AdmissionRejected, Priority
+from llm.cache import CacheMiss, CachingChatModel, ReplyStore
+from llm.registry import LLMRegistry, RoleConfig, registry
+from llm.resilience import (
+    DEFAULT_BREAKER_FAILURES,
+    CallGuard,
+    CircuitBreaker,
+    LLMUnavailable,
+    RetryPolicy,
+    time_budget,
+)
+from llm.routing import get_routing_report, reset_routing_stats, select_tier
+from tests.conftest import FakeChatModel, legacy_evaluation, spoken
+
+
+async def _hold(controller: AdmissionController, priority: Priority, order: list, name: str, seconds: float = 0.01):
+    async with controller.aslot(priority):
+        order.append(name)
+        await asyncio.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_live_turns_are_admitted_before_background_work():
+    controller = AdmissionController(max_concurrent=1, max_queue=10)
+    order = []
+
+    first = asyncio.ensure_future(_hold(controller, Priority.LIVE_TURN, order, "running", 0.05))
+    await asyncio.sleep(0.01)
+    queued = [
+        asyncio.ensure_future(_hold(controller, Priority.SUMMARIZATION, order, "summary")),
+        asyncio.ensure_future(_hold(controller, Priority.SPEC_GENERATION, order, "spec")),
+        asyncio.ensure_future(_hold(controller, Priority.LIVE_TURN, order, "turn")),
+    ]
+    await asyncio.sleep(0.01)
+    assert controller.stats()["queued_by_priority"] == {"live_turn": 1, "spec_generation": 1, "summarization": 1, "simulation": 0}
+
+    await asyncio.gather(first, *queued)
+    assert order == ["running", "turn", "spec", "summary"]
+    assert controller.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_with_retry_after_and_live_turns_displace_background_work():
+    controller = AdmissionController(max_concurrent=1, max_queue=1)
+    order = []
+
+    running = asyncio.ensure_future(_hold(controller, Priority.LIVE_TURN, order, "running", 0.05))
+    await asyncio.sleep(0.01)
+    background = asyncio.ensure_future(_hold(controller, Priority.SUMMARIZATION, order, "summary"))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        async with controller.aslot(Priority.SUMMARIZATION):
+            pass
+    assert rejected.value.retry_after >= 1
+
+    turn = asyncio.ensure_future(_hold(controller, Priority.LIVE_TURN, order, "turn"))
+    with pytest.raises(AdmissionRejected):
+        await background
+    await asyncio.gather(running, turn)
+
+    assert order == ["running", "turn"]
+    stats = controller.stats()
+    assert (stats["rejected"], stats["preempted"], stats["queued"]) == (1, 1, 0)
+
+
+def test_sync_waiters_time_out():
+    controller = AdmissionController(max_concurrent=1, max_queue=4, queue_timeout_seconds=0.01)
+
+    with controller.slot(Priority.LIVE_TURN):
+        with pytest.raises(AdmissionRejected):
+            with controller.slot(Priority.LIVE_TURN):
+                pass
+
+    with controller.slot(Priority.LIVE_TURN):
+        pass
+    assert controller.stats()["timeouts"] == 1
+    assert controller.stats()["admitted"] == 2
+
+
+def test_api_returns_429_with_retry_after_when_llm_queue_is_full(fake_llms, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import api.routes.interview
+    from api.main import app
+
+    saturated = AdmissionController(max_concurrent=0, max_queue=0)
+    monkeypatch.setattr(api.routes.interview, "admission", saturated)
+
+    with TestClient(app) as client:
+        session_id = client.post("/api/interviews", json={"case_id": "coffee_profitability"}).json()["session_id"]
+        response = client.post(f"/api/interviews/{session_id}/respond", json={"message": "Revenue?"})
+        status = client.get(f"/api/interviews/{session_id}/status").json()
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert status["message_count"] == 0
+    assert fake_llms["evaluator"].calls == []
+
+
+def test_registry_builds_each_role_once_with_env_settings(monkeypatch):
+    monkeypatch.setenv("LLM_MODEL", "base-model")
+    monkeypatch.setenv("LLM_INTERVIEWER_MODEL", "fast-model")
+    monkeypatch.setenv("LLM_INTERVIEWER_MAX_TOKENS", "256")
+    built = []
+    registry = LLMRegistry(factory=lambda config: built.append(config) or object())
+
+    interviewer = registry.get("interviewer")
+    assert registry.get("interviewer") is interviewer
+    evaluator = registry.get("evaluator")
+
+    assert built == [RoleConfig("fast-model", 0.3, 256), RoleConfig("base-model", 0.3, 2048)]
+    monkeypatch.setenv("LLM_FAST_MODEL", "small-model")
+    assert registry.get("evaluator", "fast") is not evaluator
+    assert built[-1] == RoleConfig("small-model", 0.3, 2048)
+    fake = object()
+    with registry.override(evaluator=fake):
+        assert registry.get("evaluator") is fake
+    assert registry.get("evaluator") is evaluator
+    with pytest.raises(ValueError):
+        registry.get("narrator")
+
+
+
+def test_only_guarded_roles_turn_off_sdk_retries(monkeypatch):
+    from llm.registry import _build_chat_anthropic, role_config
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    evaluator = _build_chat_anthropic(role_config("evaluator"))
+    spec_parser = _build_chat_anthropic(role_config("spec_parser"))
+
+    assert (evaluator.max_retries, evaluator.default_request_timeout) == (0, 20.0)
+    # Called directly, without a CallGuard: the SDK retries a 429 or 529 itself
+    assert spec_parser.max_retries > 0 and spec_parser.default_request_timeout is None
+
+def test_spec_routing_sends_low_stakes_turns_to_the_fast_tier(fake_llms, technical_state, case_state, monkeypatch):
+    fast = FakeChatModel(lambda messages: spoken("Go on."))
+    fake_llms["evaluator"].responder = lambda messages: legacy_evaluation(action="DO_NOT_HELP")
+    reset_routing_stats()
+
+    with registry.override(**{"interviewer.fast": fast}):
+        runner = InterviewRunner(technical_state)
+        runner.start()
+        assert runner.respond("Hash map.") == "Go on."
+        assert runner.respond("I'd store each value's index, then look up target minus value. " * 3) == "Walk me through that."
+
+        legacy = InterviewRunner(case_state)
+        legacy.start()
+        legacy.respond("Revenue?")
+
+    assert len(fast.calls) == 1
+    report = get_routing_report()["interviewer"]
+    assert report["fast"]["calls"] == 1 and report["standard"]["calls"] == 2
+    assert (report["fast"]["input_tokens"], report["fast"]["output_tokens"]) == (100, 20)
+    assert report["fast"]["cache_read_tokens"] == report["fast"]["cache_write_tokens"] == 0
+
+    state = dict(runner.get_state(), manager_directive={"urgency": "must_end"}, evaluator_action="LET_SHINE")
+    assert select_tier("interviewer", state) == "fast"
+    monkeypatch.setenv("LLM_ROUTING", "off")
+    assert select_tier("interviewer", state) == "standard"
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def _failing(status_code: int, then=None):
+    """Responder that raises once per call until `then` is set, then replies with `then`."""
+    def responder(messages):
+        if then is None or len(responder.calls) == 0:
+            responder.calls.append(messages)
+            raise ProviderError(status_code)
+        return then
+    responder.calls = []
+    return responder
+
+
+def test_stalled_evaluator_keeps_last_guidance_within_the_turn_budget(fake_llms, technical_state):
+    runner = InterviewRunner(technical_state, turn_budget_seconds=0.3)
+    runner.start()
+    action, guidance = runner.state["evaluator_action"], runner.state["evaluator_guidance"]
+    fake_llms["evaluator"].delay = 2.0
+
+    started = time.perf_counter()
+    reply = runner.respond("I'd use a hash map.")
+
+    assert time.perf_counter() - started < 1.0
+    assert reply == "Walk me through that."
+    assert (runner.state["evaluator_action"], runner.state["evaluator_guidance"]) == (action, guidance)
+    assert runner.state["degraded_calls"] == 1
+
+
+def test_unparseable_evaluation_keeps_last_guidance(fake_llms, case_state):
+    runner = InterviewRunner(case_state)
+    runner.start()
+    runner.respond("Revenue or costs?")
+    assert runner.state["evaluator_action"] == "LIGHT_HELP"
+
+    fake_llms["evaluator"].responder = lambda messages: "Sorry, I can't help with that."
+    runner.respond("Costs, I think.")
+
+    assert runner.state["evaluator_action"] == "LIGHT_HELP"
+    assert runner.state["level_name"] != "PARSE_ERROR"
+    assert runner.state["degraded_calls"] == 1
+
+
+def test_transient_errors_are_retried(fake_llms, case_state, monkeypatch):
+    monkeypatch.setenv("LLM_RETRY_BASE_SECONDS", "0.01")
+    fake_llms["evaluator"].responder = _failing(429, then=legacy_evaluation(level=4))
+    runner = InterviewRunner(case_state)
+    runner.start()
+    runner.respond("Revenue or costs?")
+
+    assert runner.state["current_level"] == 4
+    assert runner.state["degraded_calls"] == 0
+    assert get_routing_report()["evaluator"]["standard"]["retries"] == 1
+
+
+@pytest.mark.parametrize("status_code", [400, 401, 403])
+def test_non_transient_provider_errors_are_raised_not_degraded(fake_llms, case_state, status_code):
+    runner = InterviewRunner(case_state)
+    runner.start()
+    fake_llms["evaluator"].responder = _failing(status_code)
+
+    with pytest.raises(ProviderError):
+        runner.respond("Revenue or costs?")
+
+    assert len(fake_llms["evaluator"].calls) == 1
+    assert [m["role"] for m in runner.get_messages()] == ["interviewer"]
+    stats = get_routing_report()["evaluator"]["standard"]
+    assert stats["breaker"] == "closed" and stats["gave_up"] == 0
+
+
+@pytest.mark.asyncio
+async def test_interviewer_outage_falls_back_to_a_neutral_prompt_and_opens_the_breaker(
+    fake_llms, technical_state, monkeypatch
+):
+    monkeypatch.setenv("LLM_MAX_RETRIES", "0")
+    fake_llms["interviewer"].responder = _failing(529)
+    runner = InterviewRunner(technical_state)
+    await runner.astart()
+
+    replies = [await runner.arespond(f"Attempt {i}.") for i in range(7)]
+
+    # The spec's silence prompt, not a blank or a hang
+    assert set(replies) == {"What are you thinking?"}
+    assert len(fake_llms["interviewer"].calls) == DEFAULT_BREAKER_FAILURES
+    stats = get_routing_report()["interviewer"]["standard"]
+    assert stats["breaker"] == "open" and stats["short_circuited"] == 7 - DEFAULT_BREAKER_FAILURES
+    assert runner.state["degraded_calls"] == 7
+
+
+
+@pytest.mark.asyncio
+async def test_attempt_timed_out_by_wait_for_is_retried():
+    guard = CallGuard(RetryPolicy(attempt_timeout_seconds=0.05, backoff_base_seconds=0.01))
+    delays = [1.0, 0.0]
+
+    async def call(timeout):
+        await asyncio.sleep(delays.pop(0))
+        return "ok"
+
+    with time_budget(2.0):
+        assert await guard.acall(call) == "ok"
+
+    stats = guard.stats()
+    assert (stats["timeouts"], stats["retries"], stats["gave_up"]) == (1, 1, 0)
+
+
+def test_p95_latency_is_only_worked_out_when_hedging_on_it(fake_llms, case_state, monkeypatch):
+    from llm.routing import TierStats
+
+    def p95_seconds(self):
+        raise AssertionError("p95 computed with LLM_HEDGE off")
+
+    monkeypatch.setattr(TierStats, "p95_seconds", p95_seconds)
+    runner = InterviewRunner(case_state)
+    runner.start()
+    runner.respond("Revenue or costs?")
+    runner.respond("Costs, I think.")
+
+    assert get_routing_report()["evaluator"]["standard"]["calls"] == 2
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_and_the_first_answer_wins():
+    guard = CallGuard(RetryPolicy(hedge="0.05"))
+    delays = [1.0, 0.0]
+
+    async def call(timeout):
+        delay = delays.pop(0)
+        await asyncio.sleep(delay)
+        return delay
+
+    started = time.perf_counter()
+    with time_budget(2.0):
+        result = await guard.acall(call)
+
+    assert result == 0.0
+    assert time.perf_counter() - started < 0.5
+    assert guard.stats()["hedged"] == 1
+
+
+def test_blocking_calls_get_what_is_left_of_the_attempt_as_their_request_timeout():
+    guard = CallGuard(RetryPolicy(max_retries=0, hedge="0.1"))
+    timeouts = []
+
+    def call(timeout):
+        # A client honouring its request timeout: a stalled call ends with it
+        timeouts.append(timeout)
+        time.sleep(timeout)
+        raise TimeoutError("request timed out")
+
+    with time_budget(0.4), pytest.raises(LLMUnavailable):
+        guard.call(call)
+
+    # The hedge, sent 0.1s in, ends with the first attempt rather than 0.1s after it
+    assert len(timeouts) == 2
+    assert timeouts[0] <= 0.4
+    assert timeouts[1] <= timeouts[0] - 0.09
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_trial_lets_the_next_call_through():
+    now = [0.0]
+    guard = CallGuard(
+        RetryPolicy(max_retries=0),
+        CircuitBreaker(failure_threshold=1, reset_seconds=1, clock=lambda: now[0]),
+    )
+
+    async def failing(timeout):
+        raise TimeoutError("request timed out")
+
+    async def stalled(timeout):
+        await asyncio.sleep(10)
+
+    async def answered(timeout):
+        return "ok"
+
+    async def stream():
+        yield "first"
+        yield "second"
+
+    with pytest.raises(LLMUnavailable):
+        await guard.acall(failing)
+    now[0] += 2
+
+    # The half-open trial is cancelled, e.g. by a client disconnecting mid-turn
+    trial = asyncio.ensure_future(guard.acall(stalled))
+    await asyncio.sleep(0)
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    # ...and so is a streamed trial whose reader stops after the first chunk
+    chunks = guard.astream(stream)
+    assert await chunks.__anext__() == "first"
+    await chunks.aclose()
+
+    assert guard.breaker.state == "half_open"
+    assert await guard.acall(answered) == "ok"
+    assert guard.breaker.state == "closed"
+
+
+def _cached_llms(fakes, store, mode):
+    return {
+        role: CachingChatModel(lambda fake=fake: fake, RoleConfig(f"fake-{role}", 0.3, 1024), store, mode)
+        for role, fake in fakes.items()
+    }
+
+
+def test_recorded_interview_replays_offline(fake_llms, technical_state, tmp_path):
+    store = ReplyStore(str(tmp_path / "cache"))
+    answers = ["I'd use a hash map.", "One pass, storing each value's index."]
+
+    with registry.override(**_cached_llms(fake_llms, store, "record")):
+        recorded = InterviewRunner(technical_state)
+        recorded.start()
+        for answer in answers:
+            recorded.respond(answer)
+    live_calls = len(fake_llms["evaluator"].calls) + len(fake_llms["interviewer"].calls)
+
+    offline = {role: FakeChatModel(lambda messages: pytest.fail("replay called the model")) for role in fake_llms}
+    with registry.override(**_cached_llms(offline, store, "replay")):
+        replayed = InterviewRunner(technical_state)
+
+        async def run():
+            await replayed.astart()
+            for answer in answers:
+                async for event in replayed.arespond_stream(answer):
+                    pass
+
+        asyncio.run(run())
+        assert [m["content"] for m in replayed.get_messages()] == [m["content"] for m in recorded.get_messages()]
+        assert replayed.state["total_tokens"] == recorded.state["total_tokens"]
+
+        with pytest.raises(CacheMiss):
+            replayed.respond("An answer that was never recorded.")
+
+    assert store.stats()["writes"] == live_calls
@@ -0,0 +1,113 @@
+"""
+Prompt construction tests: cache breakpoints and token accounting.
+
+Run with: pytest tests/test_prompts.py -v
+"""
+import copy
+import os
+
+from langchain_core.messages import SystemMessage
+
+from graph import InterviewRunner
+from prompts.prompt_builder import build_interviewer_prompt, build_interviewer_system_blocks
+from prompts.evaluator_prompt_builder import build_evaluator_prompt, build_evaluator_system_blocks
+from prompts.system_blocks import system_blocks_text
+from prompts.system_blocks import SEGMENT_SEPARATOR
+from specs import create_technical_interview_spec
+from tests.conftest import FakeChatModel, legacy_evaluation, spoken
+
+
+def test_system_blocks_join_to_the_plain_prompt(case_state, technical_state):
+    for state in (case_state, technical_state):
+        interviewer_blocks = build_interviewer_system_blocks(state)
+        evaluator_blocks = build_evaluator_system_blocks(state)
+
+        assert system_blocks_text(interviewer_blocks) == build_interviewer_prompt(state)
+        assert system_blocks_text(evaluator_blocks) == build_evaluator_prompt(state)
+        assert interviewer_blocks[0]["cache_control"] == {"type": "ephemeral"}
+        assert evaluator_blocks[-1]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_sessions_of_the_same_type_share_the_cached_prefix(technical_state):
+    from graph import initialize_from_spec
+
+    other_spec = create_technical_interview_spec({
+        "problem_statement": "Merge all overlapping intervals.",
+        "title": "Merge Intervals",
+    })
+    other_state = initialize_from_spec(other_spec, session_id="other-session")
+
+    for build_blocks, build_prompt in (
+        (build_interviewer_system_blocks, build_interviewer_prompt),
+        (build_evaluator_system_blocks, build_evaluator_prompt),
+    ):
+        blocks = build_blocks(technical_state)
+        other_blocks = build_blocks(other_state)
+
+        # Global and template tiers are byte-identical across sessions
+        assert blocks[:2] == other_blocks[:2]
+        assert blocks[2] != other_blocks[2]
+
+        shared = len(SEGMENT_SEPARATOR.join(block["text"] for block in blocks[:2]))
+        prefix = os.path.commonprefix([build_prompt(technical_state), build_prompt(other_state)])
+        assert len(prefix) >= shared
+
+
+def test_agents_send_cacheable_system_blocks(fake_llms, technical_state):
+    runner = InterviewRunner(technical_state)
+    runner.start()
+    runner.respond("I'd use a hash map from value to index.")
+
+    for role in ("evaluator", "interviewer"):
+        system = fake_llms[role].calls[0][0]
+        assert isinstance(system, SystemMessage)
+        assert any("cache_control" in block for block in system.content)
+
+
+def test_cache_usage_is_tracked_per_session(case_state):
+    from llm.registry import registry
+
+    usage = {
+        "input_tokens": 10,
+        "output_tokens": 20,
+        "cache_read_input_tokens": 900,
+        "cache_creation_input_tokens": 0,
+    }
+    with registry.override(
+        evaluator=FakeChatModel(lambda m: legacy_evaluation(), usage=usage),
+        interviewer=FakeChatModel(lambda m: spoken("Go on."), usage=usage),
+    ):
+        runner = InterviewRunner(case_state)
+        runner.start()
+        runner.respond("Revenue is flat, so costs must have grown.")
+
+    state = runner.get_state()
+    assert state["cache_read_tokens"] == 1800
+    assert state["cache_write_tokens"] == 0
+    assert state["total_tokens"] == 1860
+
+
+def test_spec_prompts_render_once_per_phase(monkeypatch, technical_state):
+    import prompts.prompt_builder
+    from prompts.render_cache import PromptRenderCache
+
+    cache = PromptRenderCache(max_entries=2)
+    monkeypatch.setattr(prompts.prompt_builder, "render_cache", cache)
+
+    first = build_interviewer_prompt(technical_state)
+    for _ in range(5):
+        assert build_interviewer_prompt(dict(technical_state)) == first
+
+    # Another session with an equal (but separate) spec shares the entry
+    other = {**technical_state, "interview_spec": copy.deepcopy(technical_state["interview_spec"])}
+    assert build_interviewer_prompt(other) == first
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 6
+
+    # A phase change renders again; the LRU keeps at most two entries
+    phases = [phase["id"] for phase in technical_state["interview_spec"]["phases"]]
+    for phase in phases[1:3]:
+        build_interviewer_prompt({**technical_state, "current_phase": phase})
+    assert cache.stats()["misses"] == 3
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,347 @@
+"""
+Runner flow tests using scripted LLM stand-ins.
+
+Run with: pytest tests/test_runner.py -v
+"""
+import asyncio
+import json
+import time
+
+import pytest
+
+from graph import InterviewRunner
+
+
+def test_respond_runs_evaluator_then_interviewer(fake_llms, case_state):
+    runner = InterviewRunner(case_state)
+    runner.start()
+
+    reply = runner.respond("I'd split profit into revenue and costs.")
+
+    assert reply == "Walk me through that."
+    assert len(fake_llms["evaluator"].calls) == 1
+    assert len(fake_llms["interviewer"].calls) == 1
+    assert runner.get_state()["evaluator_action"] == "LIGHT_HELP"
+    assert runner.get_state()["total_tokens"] == 240
+
+
+@pytest.mark.asyncio
+async def test_arespond_matches_sync_flow(fake_llms, case_state):
+    runner = InterviewRunner(case_state)
+    opening = await runner.astart()
+
+    reply = await runner.arespond("I'd split profit into revenue and costs.")
+
+    assert opening
+    assert reply == "Walk me through that."
+    assert [m["role"] for m in runner.get_messages()] == ["interviewer", "candidate", "interviewer"]
+    assert runner.get_current_level() == (3, "GOOD_NOT_ENOUGH")
+
+
+@pytest.mark.asyncio
+async def test_arespond_does_not_block_other_sessions(fake_llms):
+    from case_loader import initialize_interview_state
+
+    fake_llms["evaluator"].delay = 0.05
+    fake_llms["interviewer"].delay = 0.05
+    runners = [InterviewRunner(initialize_interview_state("coffee_profitability")) for _ in range(10)]
+    for runner in runners:
+        await runner.astart()
+
+    started = asyncio.get_running_loop().time()
+    await asyncio.gather(*(runner.arespond("Revenue or costs?") for runner in runners))
+    elapsed = asyncio.get_running_loop().time() - started
+
+    # Ten serial turns would take ~1s; concurrent turns overlap their waits
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_speculative_turn_keeps_draft_when_guidance_unchanged(fake_llms, case_state):
+    runner = InterviewRunner(case_state, turn_mode="speculative")
+    await runner.astart()
+
+    # First turn: no previous guidance, so the draft is regenerated
+    await runner.arespond("Is the problem revenue or costs?")
+    assert runner.speculation.misses == 1
+    assert len(fake_llms["interviewer"].calls) == 2
+
+    # Second turn: evaluator repeats LIGHT_HELP with no data, so the draft stands
+    reply = await runner.arespond("I think costs are rising.")
+    assert reply == "Walk me through that."
+    assert runner.speculation.hits == 1
+    assert len(fake_llms["interviewer"].calls) == 3
+    assert runner.speculation.summary()["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_failed_speculative_draft_cancels_the_evaluation(fake_llms, case_state):
+    runner = InterviewRunner(case_state, turn_mode="speculative")
+    await runner.astart()
+    fake_llms["evaluator"].delay = 0.1
+
+    def broken(messages):
+        raise ValueError("prompt bug")
+
+    fake_llms["interviewer"].responder = broken
+    with pytest.raises(ValueError):
+        await runner.arespond("Is the problem revenue or costs?")
+
+    await asyncio.sleep(0.2)
+    assert fake_llms["evaluator"].calls == []
+    assert runner.response_count == 0
+
+
+
+def test_failed_speculative_sync_evaluation_still_counts_the_draft(fake_llms, case_state):
+    runner = InterviewRunner(case_state, turn_mode="speculative")
+    runner.start()
+    fake_llms["interviewer"].delay = 0.1
+
+    def broken(messages):
+        raise ValueError("prompt bug")
+
+    fake_llms["evaluator"].responder = broken
+    with pytest.raises(ValueError):
+        runner.respond("Is the problem revenue or costs?")
+
+    # The draft was already running; it finishes on its thread and is paid for
+    time.sleep(0.2)
+    assert len(fake_llms["interviewer"].calls) == 1
+    assert runner.speculation.wasted_tokens == 120
+    assert runner.speculation.summary()["turns"] == 0
+    assert runner.response_count == 0
+
+def test_speculative_sync_turn_regenerates_when_data_changes(fake_llms, case_state):
+    from tests.conftest import legacy_evaluation
+
+    runner = InterviewRunner(case_state, turn_mode="speculative")
+    runner.start()
+    tokens_before = runner.get_state()["total_tokens"]
+    runner.respond("Is the problem revenue or costs?")
+
+    fake_llms["evaluator"].responder = lambda messages: legacy_evaluation(data="Costs rose 20%")
+    runner.respond("Can I see the cost breakdown?")
+
+    assert runner.speculation.hits == 0
+    assert runner.speculation.misses == 2
+    assert runner.get_state()["data_to_share"] == "Costs rose 20%"
+    # Wasted drafts are still paid for
+    assert runner.speculation.wasted_tokens == 240
+    # ...and count toward the session: evaluator, draft and regenerated reply per turn
+    assert runner.get_state()["total_tokens"] - tokens_before == 2 * 3 * 120
+
+
+def test_spoken_extractor_decodes_fenced_json_incrementally():
+    from agents.interviewer import SpokenFieldExtractor
+
+    raw = '```json\n{"spoken": "Sure \\"costs\\" rose\\nby 20% \\u2014 go on."}\n```'
+    extractor = SpokenFieldExtractor()
+    pieces = [extractor.feed(raw[i:i + 2]) for i in range(0, len(raw), 2)]
+
+    assert "".join(pieces) == 'Sure "costs" rose\nby 20% — go on.'
+    # Text starts flowing before the envelope is complete
+    assert any(pieces[: len(pieces) // 2])
+
+
+
+def test_spoken_extractor_stops_at_a_malformed_unicode_escape():
+    from agents.interviewer import SpokenFieldExtractor
+
+    raw = '{"spoken": "Costs rose \\u20zz by 20%."}'
+    extractor = SpokenFieldExtractor()
+    pieces = [extractor.feed(raw[i:i + 4]) for i in range(0, len(raw), 4)]
+
+    # What was decoded before the bad escape, then nothing: the final parse has the last word
+    assert "".join(pieces) == "Costs rose "
+
+
+def test_spoken_extractor_only_pairs_a_high_surrogate_with_a_following_escape():
+    from agents.interviewer import SpokenFieldExtractor
+
+    raw = '{"spoken": "Odd \\ud83d\\nline, then \\ud83d\\ude00 done."}'
+    extractor = SpokenFieldExtractor()
+    pieces = [extractor.feed(raw[i:i + 3]) for i in range(0, len(raw), 3)]
+
+    assert "".join(pieces) == json.loads(raw)["spoken"]
+
+@pytest.mark.asyncio
+async def test_arespond_stream_yields_tokens_then_done(fake_llms, case_state):
+    runner = InterviewRunner(case_state)
+    await runner.astart()
+
+    events = [event async for event in runner.arespond_stream("Revenue or costs?")]
+
+    tokens = [e["text"] for e in events if e["type"] == "token"]
+    assert len(tokens) > 1
+    assert "".join(tokens) == "Walk me through that."
+    assert events[-1] == {"type": "done", "interviewer_message": "Walk me through that.", "is_complete": False}
+    assert runner.get_state()["total_tokens"] == 240
+
+
+
+@pytest.mark.asyncio
+async def test_empty_interviewer_stream_says_a_neutral_prompt(fake_llms, case_state, monkeypatch):
+    async def astream(messages, **kwargs):
+        return
+        yield
+
+    monkeypatch.setattr(fake_llms["interviewer"], "astream", astream)
+    runner = InterviewRunner(case_state)
+    await runner.astart()
+
+    events = [event async for event in runner.arespond_stream("Revenue or costs?")]
+
+    reply = events[-1]["interviewer_message"]
+    assert reply
+    assert [e["text"] for e in events if e["type"] == "token"] == [reply]
+    assert runner.state["degraded_calls"] == 1
+
+@pytest.mark.asyncio
+async def test_abandoned_stream_leaves_the_session_as_before_the_turn(fake_llms, case_state):
+    runner = InterviewRunner(case_state)
+    await runner.astart()
+    fake_llms["interviewer"].delay = 0.5
+
+    async def consume():
+        return [event async for event in runner.arespond_stream("Revenue or costs?")]
+
+    consumer = asyncio.ensure_future(consume())
+    await asyncio.sleep(0.1)
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+    assert [m["role"] for m in runner.get_messages()] == ["interviewer"]
+    assert runner.response_count == 0
+
+    fake_llms["interviewer"].delay = 0.0
+    await runner.arespond("Revenue or costs?")
+    assert [m["role"] for m in runner.get_messages()] == ["interviewer", "candidate", "interviewer"]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_turn_evaluates_off_the_critical_path(fake_llms, case_state):
+    fake_llms["evaluator"].delay = 0.2
+    runner = InterviewRunner(case_state, turn_mode="pipelined")
+    await runner.astart()
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await runner.arespond("Is the problem revenue or costs?")
+    assert loop.time() - started < 0.15
+    assert runner.has_pending_evaluation()
+    assert runner.get_current_level() == (0, "NOT_ASSESSED")
+
+    # The next turn applies the previous evaluation before the interviewer runs
+    await runner.arespond("I think costs are rising.")
+    interviewer_context = fake_llms["interviewer"].calls[-1][1].content
+    assert "**Action:** LIGHT_HELP" in interviewer_context
+
+    await runner.adrain()
+    assert not runner.has_pending_evaluation()
+    assert len(fake_llms["evaluator"].calls) == 2
+    assert len(runner.get_state()["level_history"]) == 2
+    assert runner.get_state()["total_tokens"] == 4 * 120
+
+
+@pytest.mark.asyncio
+async def test_failed_pipelined_turn_cancels_its_background_evaluation(fake_llms, case_state):
+    runner = InterviewRunner(case_state, turn_mode="pipelined")
+    await runner.astart()
+    fake_llms["evaluator"].delay = 0.1
+
+    def broken(messages):
+        raise ValueError("prompt bug")
+
+    fake_llms["interviewer"].responder = broken
+    with pytest.raises(ValueError):
+        await runner.arespond("Is the problem revenue or costs?")
+
+    await asyncio.sleep(0.2)
+    assert not runner.has_pending_evaluation()
+    assert fake_llms["evaluator"].calls == []
+
+
+def test_pipelined_sync_turn_applies_each_evaluation_once(fake_llms, case_state):
+    runner = InterviewRunner(case_state, turn_mode="pipelined")
+    runner.start()
+
+    for answer in ["Revenue or costs?", "Costs.", "Labour costs specifically."]:
+        runner.respond(answer)
+    runner.drain()
+    runner.drain()
+
+    assert len(fake_llms["evaluator"].calls) == 3
+    assert len(runner.get_state()["level_history"]) == 3
+    assert runner.get_state()["total_tokens"] == 6 * 120
+
+
+@pytest.mark.asyncio
+async def test_last_capped_turn_skips_interviewer_call(fake_llms, case_state):
+    runner = InterviewRunner(case_state)
+    await runner.astart()
+
+    replies = []
+    while not runner.is_complete():
+        replies.append(await runner.arespond("Here is my next thought."))
+
+    # 15 exchanges: 14 interviewer replies, then straight to the closing
+    assert len(replies) == 15
+    assert len(fake_llms["evaluator"].calls) == 15
+    assert len(fake_llms["interviewer"].calls) == 14
+    assert "wrap up" in replies[-1]
+    assert runner.get_messages()[-2]["role"] == "candidate"
+    assert runner.get_state()["final_score"] == 3
+
+
+def test_turns_append_in_place_without_touching_initial_state(fake_llms, case_state):
+    runner = InterviewRunner(case_state)
+    runner.start()
+    messages = runner.get_messages()
+    history = runner.get_state()["level_history"]
+
+    runner.respond("Costs are up.")
+    runner.respond("Labour costs specifically.")
+
+    # Logs grow in place; the caller's state is left alone
+    assert runner.get_messages() is messages
+    assert runner.get_state()["level_history"] is history
+    assert len(messages) == 5 and len(history) == 2
+    assert case_state["messages"] == [] and case_state["level_history"] == []
+
+
+def test_snapshot_sees_a_fixed_prefix_of_the_transcript():
+    from state import MessageLog, Append, apply_delta, snapshot_state, count_role
+
+    state = {"messages": MessageLog([{"role": "interviewer", "content": "Hi", "timestamp": ""}])}
+    snapshot = snapshot_state(state)
+    apply_delta(state, {"messages": Append({"role": "candidate", "content": "Hello", "timestamp": ""})})
+
+    assert len(snapshot["messages"]) == 1
+    assert snapshot["messages"][-1]["content"] == "Hi"
+    assert count_role(snapshot["messages"], "candidate") == 0
+    assert count_role(state["messages"], "candidate") == 1
+
+
+@pytest.mark.asyncio
+async def test_each_node_call_records_its_own_span(fake_llms, case_state):
+    fake_llms["interviewer"].responder = lambda messages: "not json"
+    runner = InterviewRunner(case_state)
+    await runner.astart()
+
+    await runner.arespond("I'd split profit into revenue and costs.")
+
+    spans = runner.get_spans()
+    assert [span["node"] for span in spans] == ["interviewer", "evaluator", "interviewer", "manager"]
+    opening, evaluation, reply, manager = spans
+    assert opening["parse"] is None and opening["ttfb_seconds"] is None
+    assert evaluation["parse"] == "ok" and reply["parse"] == "fallback"
+    assert evaluation["interview_type"] == "legacy_case" and evaluation["exchange"] == 1
+    assert evaluation["input_tokens"] == 100 and evaluation["output_tokens"] == 20
+    assert set(evaluation["prompt_chars"]) == {"system_0", "context"}
+    assert 0 < evaluation["ttfb_seconds"] <= evaluation["wall_seconds"]
+    for span in (evaluation, reply):
+        assert 0 < span["prompt_build_seconds"] + span["parse_seconds"] < span["wall_seconds"]
+    assert opening["prompt_build_seconds"] is None and opening["parse_seconds"] is None
+    assert manager["tier"] is None and manager["wall_seconds"] > 0
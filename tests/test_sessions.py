@@ -0,0 +1,228 @@
+"""
+Session store tests.
+
+Run with: pytest tests/test_sessions.py -v
+"""
+import asyncio
+import json
+
+import pytest
+
+from api.session_store import (
+    InMemorySessionStore,
+    SQLiteSessionStore,
+    SessionBusyError,
+    SessionConflictError,
+    estimate_log_bytes,
+    estimate_static_bytes,
+)
+from graph import InterviewRunner
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _runner(case_state) -> InterviewRunner:
+    return InterviewRunner(dict(case_state))
+
+
+
+def test_session_size_counts_new_log_items_and_regrown_fields(fake_llms, case_state):
+    store = InMemorySessionStore()
+    runner = _runner(case_state)
+    runner.start()
+    store.put("a", runner)
+    for answer in ("Revenue or costs?", "Costs, mostly labour."):
+        runner.respond(answer)
+        store.put("a", runner)
+
+    state = runner.get_state()
+    assert store.stats()["bytes"] == estimate_static_bytes(state) + estimate_log_bytes(state)
+
+    # Fields outside the logs grow too, and are measured again on every put
+    before = store.stats()["bytes"]
+    runner.state["level_justification"] = "Detailed evidence. " * 100
+    store.put("a", runner)
+    assert store.stats()["bytes"] > before + 1500
+
+def test_least_recently_used_session_is_evicted_at_capacity(case_state):
+    store = InMemorySessionStore(max_sessions=2)
+    runners = {name: _runner(case_state) for name in ("a", "b", "c")}
+
+    store.put("a", runners["a"])
+    store.put("b", runners["b"])
+    assert store.get("a") is runners["a"]
+    store.put("c", runners["c"])
+
+    assert store.get("b") is None
+    assert store.get("a") is runners["a"] and store.get("c") is runners["c"]
+    stats = store.stats()
+    assert stats["sessions"] == 2
+    assert stats["evictions_by_reason"]["capacity"] == 1
+    assert (stats["hits"], stats["misses"]) == (3, 1)
+
+
+def test_byte_cap_tracks_growing_transcripts(fake_llms, case_state):
+    store = InMemorySessionStore()
+    runner = _runner(case_state)
+    runner.start()
+    store.put("a", runner)
+    before = store.stats()["bytes"]
+
+    runner.respond("I'd split profit into revenue and costs. " * 50)
+    store.put("a", runner)
+    assert store.stats()["bytes"] > before + 2000
+
+    store.max_bytes = store.stats()["bytes"] + 100
+    store.put("b", _runner(case_state))
+    assert store.get("a") is None
+    assert store.stats()["evictions_by_reason"]["bytes"] == 1
+    assert store.stats()["bytes"] <= store.max_bytes
+
+
+def test_idle_and_completed_sessions_expire(case_state):
+    clock = FakeClock()
+    store = InMemorySessionStore(idle_ttl_seconds=100, completed_ttl_seconds=10, clock=clock)
+    idle, active, done = _runner(case_state), _runner(case_state), _runner(case_state)
+    done.state["is_complete"] = True
+
+    store.put("idle", idle)
+    store.put("active", active)
+    store.put("done", done)
+
+    clock.now = 50
+    assert store.get("active") is active
+    assert store.get("done") is None
+
+    clock.now = 120
+    assert store.get("idle") is None
+    assert store.get("active") is active
+    assert store.stats()["evictions_by_reason"] == {"capacity": 0, "bytes": 0, "idle": 1, "completed": 1}
+
+
+def test_sqlite_sessions_survive_a_restart(fake_llms, technical_state, tmp_path):
+    path = str(tmp_path / "sessions.db")
+    store = SQLiteSessionStore(path)
+    runner = InterviewRunner(technical_state)
+    runner.start()
+    runner.respond("I'd use a hash map from value to index.")
+    store.put("s1", runner)
+    store.close()
+
+    restarted = SQLiteSessionStore(path)
+    restored = restarted.get("s1")
+
+    assert restored is not runner
+    assert restored.get_messages() == runner.get_messages()
+    assert restored.get_spec() == runner.get_spec()
+    assert restored.respond("Then one pass over the array.") == "Walk me through that."
+    assert restarted.get("missing") is None
+    assert restarted.stats()["rehydrations"] == 1
+
+
+def test_sqlite_worker_reloads_sessions_advanced_elsewhere(fake_llms, case_state, tmp_path):
+    path = str(tmp_path / "sessions.db")
+    worker_a, worker_b = SQLiteSessionStore(path), SQLiteSessionStore(path)
+    runner = InterviewRunner(case_state)
+    runner.start()
+    worker_a.put("s1", runner)
+
+    on_b = worker_b.get("s1")
+    on_b.respond("Revenue or costs?")
+    worker_b.put("s1", on_b)
+
+    on_a = worker_a.get("s1")
+    assert on_a is not runner
+    assert len(on_a.get_messages()) == 3
+    assert worker_a.get("s1") is on_a
+
+
+
+def test_restored_runner_keeps_its_turn_budget_and_priority(fake_llms, case_state):
+    from llm.admission import Priority
+
+    runner = InterviewRunner(case_state, turn_budget_seconds=90, priority=Priority.SIMULATION)
+    restored = InterviewRunner.restore(json.loads(json.dumps(runner.checkpoint())))
+
+    assert restored.turn_budget_seconds == 90
+    assert restored.priority is Priority.SIMULATION
+
+def test_restored_runner_reruns_an_in_flight_pipelined_evaluation(fake_llms, case_state):
+    runner = InterviewRunner(case_state, turn_mode="pipelined")
+    runner.start()
+    runner.respond("Revenue or costs?")
+    assert runner.has_pending_evaluation()
+
+    restored = InterviewRunner.restore(json.loads(json.dumps(runner.checkpoint())))
+    evaluations = len(fake_llms["evaluator"].calls)
+    restored.drain()
+
+    # Evaluated from the transcript as it was when the turn started
+    assert len(fake_llms["evaluator"].calls) == evaluations + 1
+    evaluated = fake_llms["evaluator"].calls[-1][-1].content
+    assert "Revenue or costs?" in evaluated and "Walk me through that." not in evaluated
+    assert restored.get_state()["level_history"]
+
+
+def test_sqlite_lease_admits_one_worker_per_session(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    worker_a = SQLiteSessionStore(path)
+    worker_b = SQLiteSessionStore(path, lease_wait_seconds=0.05)
+
+    async def scenario():
+        async with worker_a.lease("s1"):
+            with pytest.raises(SessionBusyError):
+                await worker_b.acquire_lease("s1")
+            # Other sessions are not blocked
+            (await worker_b.acquire_lease("s2")).release()
+        (await worker_b.acquire_lease("s1")).release()
+
+    asyncio.run(scenario())
+    assert worker_b.stats()["lease_timeouts"] == 1
+
+
+def test_sqlite_checkpoint_waits_for_a_locked_database_off_the_event_loop(fake_llms, case_state, tmp_path):
+    import sqlite3
+
+    path = str(tmp_path / "sessions.db")
+    store = SQLiteSessionStore(path)
+    runner = InterviewRunner(case_state)
+    runner.start()
+
+    # Another worker's write holds the database for a moment
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.2, other.execute, "COMMIT")
+        started = loop.time()
+        await store.aput("s1", runner)
+        return loop.time() - started
+
+    # Blocking the loop would also block the COMMIT until busy_timeout gave up
+    assert asyncio.run(scenario()) < 2.0
+    assert asyncio.run(store.aget("s1")) is runner
+    other.close()
+
+
+def test_sqlite_put_rejects_a_stale_copy(fake_llms, case_state, tmp_path):
+    path = str(tmp_path / "sessions.db")
+    worker_a, worker_b = SQLiteSessionStore(path), SQLiteSessionStore(path)
+    runner = InterviewRunner(case_state)
+    runner.start()
+    worker_a.put("s1", runner)
+    stale = worker_b.get("s1")
+
+    runner.respond("Revenue or costs?")
+    worker_a.put("s1", runner)
+    stale.respond("Costs, I think.")
+
+    with pytest.raises(SessionConflictError):
+        worker_b.put("s1", stale)
+    assert len(worker_b.get("s1").get_messages()) == 3
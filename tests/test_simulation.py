@@ -0,0 +1,79 @@
+"""
+Simulation engine tests, with scripted candidates and stub replies.
+
+Run with: pytest tests/test_simulation.py -v
+"""
+import pytest
+
+from benchmarks.stub_llm import StubConfig, StubLLM
+from simulation import ScriptedCandidate, build_scenarios, run_simulation
+from tests.conftest import FakeChatModel
+
+
+@pytest.fixture
+def stub_llms(fake_llms):
+    """Fakes answering in whichever format the prompt asks for (spec-driven or legacy)."""
+    stub = StubLLM(StubConfig())
+
+    def respond(messages):
+        system, context = messages[0].content, messages[1].content
+        return stub.reply({"system": system, "messages": [{"role": "user", "content": context}]})[0]
+
+    for model in fake_llms.values():
+        model.responder = respond
+    return fake_llms
+
+
+def test_scenario_seeds_are_deterministic():
+    first = build_scenarios(["strong", "weak"], ["legacy_case", "technical"], repeats=2, seed=7)
+    again = build_scenarios(["strong", "weak"], ["legacy_case", "technical"], repeats=2, seed=7)
+
+    assert first == again
+    assert len({scenario.seed for scenario in first}) == len(first)
+    assert {scenario.interview_type for scenario in first} == {"legacy_case", "technical"}
+
+
+def test_simulation_collects_level_trajectories_per_competency(stub_llms):
+    scenarios = build_scenarios(["strong", "weak"], ["legacy_case", "technical"], cases=["coffee_profitability", "two_sum"])
+
+    result = run_simulation(scenarios, concurrency=3, max_turns=3, candidate_factory=ScriptedCandidate)
+
+    assert [run["error"] for run in result.runs] == [None] * 4
+    assert [run["run_id"] for run in result.runs] == [scenario.run_id for scenario in scenarios]
+    technical = [row for row in result.rows if row["interview_type"] == "technical"]
+    assert {row["turn"] for row in technical} == {1, 2, 3}
+    assert "problem_decomposition" in {row["competency"] for row in technical}
+    assert {row["competency"] for row in result.rows if row["interview_type"] == "legacy_case"} == {"overall"}
+    assert set(result.final_levels()["technical"]) == {"strong", "weak"}
+
+
+def test_simulated_interviews_call_llms_at_simulation_priority(stub_llms, monkeypatch):
+    import llm.routing
+    import simulation
+    from llm.admission import Priority
+    from llm.registry import registry
+
+    priorities = {"candidate": [], "agents": []}
+
+    def recording(module, calls):
+        real_aadmit = module.aadmit
+
+        def aadmit(priority):
+            calls.append(priority)
+            return real_aadmit(priority)
+        return aadmit
+
+    monkeypatch.setattr(simulation, "aadmit", recording(simulation, priorities["candidate"]))
+    monkeypatch.setattr(llm.routing, "aadmit", recording(llm.routing, priorities["agents"]))
+    candidate = FakeChatModel(lambda messages: "I'd split profit into revenue and costs.")
+    scenarios = build_scenarios(["average"], ["technical"], cases=["two_sum"])
+
+    with registry.override(candidate=candidate):
+        result = run_simulation(scenarios, max_turns=2)
+
+    assert [run["error"] for run in result.runs] == [None]
+    assert len(candidate.calls) == 2
+    assert "synthetic candidate #" in candidate.calls[0][0].content
+    assert priorities["candidate"] == [Priority.SIMULATION] * 2
+    # The runner's evaluator and interviewer calls queue behind live interviews too
+    assert priorities["agents"] and set(priorities["agents"]) == {Priority.SIMULATION}
@@ -0,0 +1,86 @@
+"""
+Compiled spec tests.
+
+Run with: pytest tests/test_specs.py -v
+"""
+import copy
+import gc
+import json
+import weakref
+
+import pytest
+
+from agents.manager import manager_node
+from specs import UNIVERSAL_RUBRIC, LazyRubric, compile_spec, get_competency
+from specs.spec_schema import UNIVERSAL_RUBRIC_FILE
+from state import SpecDict, get_compiled_spec, get_current_phase_config
+
+
+def test_spec_is_compiled_once_per_spec_content(technical_state):
+    spec = technical_state["interview_spec"]
+
+    compiled = get_compiled_spec(technical_state)
+
+    assert get_compiled_spec(dict(technical_state)) is compiled
+    assert compile_spec(copy.deepcopy(spec)) is compiled
+    assert compile_spec({**spec, "title": "Other"}).content_hash != compiled.content_hash
+
+
+def test_compiled_spec_cache_does_not_keep_specs_alive(technical_state):
+    spec = SpecDict(copy.deepcopy(technical_state["interview_spec"]))
+    spec["title"] = "Short-lived"
+    compile_spec(spec)
+    ref = weakref.ref(spec)
+
+    del spec
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_compiled_spec_indexes_tiers_phases_and_rubric(technical_state):
+    spec = technical_state["interview_spec"]
+    compiled = get_compiled_spec(technical_state)
+
+    for comp in spec["competencies"]:
+        assert compiled.tier(comp["competency_id"]) == comp["tier"]
+        assert compiled.competencies[compiled.competency_ids.index(comp["competency_id"])].rubric is not None
+    assert compiled.tier("not_in_spec") == "important"
+
+    first, second = spec["phases"][0], spec["phases"][1]
+    assert compiled.phase(first["id"].upper()).next_phase_id == second["id"]
+    assert get_current_phase_config({**technical_state, "current_phase": second["id"]})["name"] == second["name"]
+
+    with pytest.raises(TypeError):
+        compiled.heuristics["tone"] = "changed"
+
+
+def test_manager_reads_constraints_and_phases_from_compiled_spec(technical_state):
+    spec = technical_state["interview_spec"]
+    first = spec["phases"][0]
+    exchanges = first.get("suggested_max_exchanges") or 1
+    messages = [{"role": "candidate", "content": "answer", "timestamp": ""}] * exchanges
+
+    result = manager_node({**technical_state, "current_phase": first["id"], "messages": messages})
+
+    directive = result["manager_directive"]
+    assert directive["suggested_phase"] == spec["phases"][1]["id"]
+    assert set(directive["undercovered_competencies"]) == set(get_compiled_spec(technical_state).competency_ids)
+
+
+def test_rubric_loads_lazily_and_reloads_edits(tmp_path):
+    source = tmp_path / "rubric.json"
+    source.write_text(UNIVERSAL_RUBRIC_FILE.read_text(encoding="utf-8"), encoding="utf-8")
+    rubric = LazyRubric(source)
+
+    assert not rubric.loaded
+    assert list(rubric) == list(UNIVERSAL_RUBRIC)
+    assert rubric["problem_structuring"] == get_competency("problem_structuring")
+    assert rubric.loaded
+
+    data = json.loads(source.read_text(encoding="utf-8"))
+    data["competencies"][0]["name"] = "Edited"
+    source.write_text(json.dumps(data), encoding="utf-8")
+    assert rubric["problem_structuring"].name != "Edited"
+    rubric.reload()
+    assert rubric["problem_structuring"].name == "Edited"
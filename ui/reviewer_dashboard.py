@@ -115,14 +115,9 @@ def summarize_with_ai(text: str, doc_type: str) -> str:
     if not text.strip():
         return ""
 
-    from langchain_anthropic import ChatAnthropic
     from langchain_core.messages import SystemMessage, HumanMessage
-
-    llm = ChatAnthropic(
-        model="claude-sonnet-4-20250514",
-        temperature=0.1,
-        max_tokens=1500,
-    )
+    from llm.admission import Priority, admit
+    from llm.registry import get_llm
 
     if doc_type == "jd":
         system_prompt = """You are an expert at extracting key information from job descriptions.
@@ -155,7 +150,8 @@ Be concise but capture all important details that an interviewer would need to a
             SystemMessage(content=system_prompt),
             HumanMessage(content=f"Document to summarize:\n\n{text[:8000]}")  # Limit to 8k chars
         ]
-        response = llm.invoke(messages)
+        with admit(Priority.SUMMARIZATION):
+            response = get_llm("summarizer").invoke(messages)
         return response.content
     except Exception as e:
         st.error(f"AI summarization failed: {str(e)}")
@@ -365,6 +361,7 @@ with st.sidebar:
             session_tokens = runner_state.get("total_tokens", 0)
             estimated_cost = (session_tokens / 1_000_000) * 9
             st.metric("Session Tokens", f"{session_tokens:,}")
+            st.metric("Cached Prompt Tokens", f"{runner_state.get('cache_read_tokens', 0):,}")
             st.metric("Est. Cost", f"${estimated_cost:.4f}")
         else:
             st.write("Start interview to track")